@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Benchmark McCabe complexity computation on deeply nested generated code."""
+
+import argparse
+import ast
+import time
+
+from src_check.core.functions import extract_functions
+
+
+def generate_nested(depth: int, branches: int) -> str:
+    """Generate functions nested ``depth`` levels, each with some branches."""
+    lines = []
+    for level in range(depth):
+        indent = "    " * level
+        lines.append(f"{indent}def level_{level}(x):")
+        for branch in range(branches):
+            lines.append(f"{indent}    if x == {branch} and x > 0:")
+            lines.append(f"{indent}        x += 1")
+    lines.append("    " * depth + "return x")
+    return "\n".join(lines) + "\n"
+
+
+def walk_per_function(tree: ast.AST) -> int:
+    """The former approach: walk the whole subtree of every function."""
+    total = 0
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            total += sum(1 for _ in ast.walk(node))
+    return total
+
+
+def main():
+    """Main benchmark entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark complexity computation")
+    parser.add_argument("--depths", nargs="+", type=int, default=[10, 25, 50, 90])
+    parser.add_argument("--branches", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'depth':>6} {'nodes':>8} {'walked before':>14} {'seconds':>9}")
+    for depth in args.depths:
+        tree = ast.parse(generate_nested(depth, args.branches))
+        nodes = sum(1 for _ in ast.walk(tree))
+
+        started = time.perf_counter()
+        extract_functions(tree)
+        elapsed = time.perf_counter() - started
+
+        print(f"{depth:>6} {nodes:>8} {walk_per_function(tree):>14} {elapsed:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Remote result cache server for src-check.
+
+Runs the reference HTTP cache server that CI jobs can share through
+``src-check --cache-url``.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from src_check.core.cache_server import CacheServer
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments for the cache server."""
+    parser = argparse.ArgumentParser(
+        description="src-check cache server - Shared remote result cache",
+        prog="src-check cache-server",
+    )
+
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)"
+    )
+
+    parser.add_argument(
+        "--port", type=int, default=8765, help="Port to listen on (default: 8765)"
+    )
+
+    parser.add_argument(
+        "--storage",
+        default=".src-check-cache-server",
+        help="Directory where cache entries are stored",
+    )
+
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Log every request"
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for the cache server."""
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(levelname)s: %(message)s",
+    )
+
+    try:
+        server = CacheServer((args.host, args.port), Path(args.storage))
+    except OSError as e:
+        print(f"❌ Could not start cache server: {e}", file=sys.stderr)
+        sys.exit(3)
+
+    print(f"🗄️ src-check cache server listening on {server.url}")
+    print(f"📂 Storing entries in {Path(args.storage).resolve()}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⚠️ Cache server stopped", file=sys.stderr)
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
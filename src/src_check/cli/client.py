@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Thin client for the src-check daemon.
+
+Forwards its arguments to a running ``src-check daemon`` over a Unix socket
+and streams the output back. Only the standard library is imported here, so
+that editor and git-hook invocations do not pay for loading the analysis
+engine. When no daemon is running, the analysis runs in-process instead.
+"""
+
+import io
+import json
+import os
+import socket
+import sys
+from typing import Any, Dict, List, Optional, TextIO
+
+
+def default_socket_path() -> str:
+    """Return the Unix socket path shared by the daemon and the client."""
+    env_path = os.environ.get("SRC_CHECK_DAEMON_SOCKET")
+    if env_path:
+        return env_path
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "src-check.sock")
+
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join("/tmp", f"src-check-{uid}.sock")
+
+
+def reads_stdin(argv: List[str]) -> bool:
+    """Check whether an invocation reads its file list from stdin.
+
+    Args:
+        argv: Arguments for src-check
+
+    Returns:
+        True if --stdin-filelist, or an abbreviation of it, is given
+    """
+    for arg in argv:
+        if arg == "--":
+            break
+        # argparse accepts unambiguous prefixes; "--st" could also be --staged
+        if len(arg) > 4 and "--stdin-filelist".startswith(arg):
+            return True
+    return False
+
+
+def send_request(
+    request: Dict[str, Any],
+    socket_path: str,
+    stdout: TextIO,
+    stderr: TextIO,
+    timeout: Optional[float] = None,
+) -> int:
+    """Send a request to the daemon and stream its output.
+
+    Args:
+        request: JSON-serializable request
+        socket_path: Path of the daemon socket
+        stdout: Stream receiving the daemon's standard output
+        stderr: Stream receiving the daemon's standard error
+        timeout: Optional socket timeout in seconds
+
+    Returns:
+        Exit code reported by the daemon
+
+    Raises:
+        OSError: If the daemon cannot be reached
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                message = json.loads(line)
+                if "stdout" in message:
+                    stdout.write(message["stdout"])
+                    stdout.flush()
+                elif "stderr" in message:
+                    stderr.write(message["stderr"])
+                    stderr.flush()
+                elif "exit" in message:
+                    return int(message["exit"])
+
+    print("❌ Connection to src-check daemon closed unexpectedly", file=stderr)
+    return 3
+
+
+def run_remote(argv: List[str], socket_path: Optional[str] = None) -> Optional[int]:
+    """Run src-check through the daemon.
+
+    Args:
+        argv: Arguments for src-check
+        socket_path: Daemon socket path, defaults to default_socket_path()
+
+    Returns:
+        Exit code, or None if no daemon is listening. Standard input read
+        for the request is then restored for an in-process run.
+    """
+    request: Dict[str, Any] = {"argv": argv, "cwd": os.getcwd()}
+    if reads_stdin(argv):
+        # The daemon cannot see this process's stdin, so the list travels along
+        request["stdin"] = sys.stdin.read()
+    try:
+        return send_request(
+            request, socket_path or default_socket_path(), sys.stdout, sys.stderr
+        )
+    except (FileNotFoundError, ConnectionRefusedError):
+        if "stdin" in request:
+            sys.stdin = io.StringIO(request["stdin"])
+        return None
+
+
+def main() -> None:
+    """Main entry point for the src-check daemon client."""
+    argv = sys.argv[1:]
+    exit_code = run_remote(argv)
+
+    if exit_code is None:
+        # No daemon running: fall back to an in-process analysis
+        from src_check.cli.main import main as local_main
+
+        local_main(argv)
+        return
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
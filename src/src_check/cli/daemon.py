@@ -0,0 +1,272 @@
+"""
+Resident src-check daemon.
+
+Keeps the checker registry, a file-reading worker pool and an in-memory result
+cache warm between runs, and serves ``src-check`` invocations forwarded by the
+thin client (``src-check-client``) over a Unix socket.
+
+Protocol: the client sends one JSON line, either ``{"argv": [...], "cwd": ...}``
+or ``{"command": "status" | "shutdown"}``. With ``--stdin-filelist`` the
+request also carries the client's standard input as ``"stdin"``. The daemon answers with JSON lines
+``{"stdout": ...}`` / ``{"stderr": ...}`` while the run progresses, followed by
+a final ``{"exit": code}``.
+"""
+
+import argparse
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout, suppress
+from typing import Any, Dict, List, Optional
+
+from src_check.cli.client import default_socket_path, reads_stdin, send_request
+from src_check.cli.main import SUBCOMMANDS
+from src_check.cli.main import main as cli_main
+from src_check.core.cache import MemoryResultCache
+from src_check.core.registry import registry
+from src_check.models.source_lines import source_lines
+from src_check.models.suppressions import suppressions
+
+
+class SocketStream:
+    """Text stream forwarding every write to the client as a JSON message."""
+
+    encoding = "utf-8"
+
+    def __init__(self, handler: "DaemonRequestHandler", name: str) -> None:
+        """Initialize the stream.
+
+        Args:
+            handler: Request handler owning the client connection
+            name: Message key, "stdout" or "stderr"
+        """
+        self.handler = handler
+        self.name = name
+
+    def write(self, text: str) -> int:
+        """Send text to the client."""
+        if text:
+            self.handler.send_message({self.name: text})
+        return len(text)
+
+    def flush(self) -> None:
+        """Flush the stream (writes are sent immediately)."""
+        pass
+
+    def isatty(self) -> bool:
+        """Report that the stream is not a terminal."""
+        return False
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single client connection."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        """Read one request and stream the run's output back."""
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            self.send_message({"stderr": "❌ Malformed request\n"})
+            self.send_message({"exit": 2})
+            return
+
+        command = request.get("command")
+        if command == "shutdown":
+            self.send_message({"stdout": "🛑 src-check daemon shutting down\n"})
+            self.send_message({"exit": 0})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+        if command == "status":
+            self.send_message({"stdout": self.server.status() + "\n"})
+            self.send_message({"exit": 0})
+            return
+
+        exit_code = self.server.run(
+            list(request.get("argv", [])),
+            request.get("cwd") or os.getcwd(),
+            SocketStream(self, "stdout"),
+            SocketStream(self, "stderr"),
+            request.get("stdin"),
+        )
+        self.send_message({"exit": exit_code})
+
+    def send_message(self, message: Dict[str, Any]) -> None:
+        """Send one JSON message to the client."""
+        try:
+            self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+            self.wfile.flush()
+        except OSError:
+            pass  # Client went away; finish the run anyway
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server running src-check with warm state.
+
+    Requests are served one at a time because a run changes the process-wide
+    working directory and standard streams.
+    """
+
+    def __init__(self, socket_path: str, max_workers: Optional[int] = None) -> None:
+        """Initialize the daemon and warm up its state.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on
+            max_workers: Size of the file-reading worker pool
+        """
+        super().__init__(socket_path, DaemonRequestHandler)
+        self.socket_path = socket_path
+        registry.discover_plugins()
+        self.cache = MemoryResultCache()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.requests_served = 0
+
+    def run(
+        self,
+        argv: List[str],
+        cwd: str,
+        stdout: Any,
+        stderr: Any,
+        stdin: Optional[str] = None,
+    ) -> int:
+        """Run src-check for a forwarded invocation.
+
+        Args:
+            argv: Arguments for src-check
+            cwd: Working directory of the client
+            stdout: Stream receiving standard output
+            stderr: Stream receiving standard error
+            stdin: Standard input of the client, sent along with
+                --stdin-filelist
+
+        Returns:
+            Exit code of the run
+        """
+        if argv and argv[0] in SUBCOMMANDS:
+            stderr.write(f"❌ '{argv[0]}' cannot be run through the daemon\n")
+            return 2
+        if stdin is None and reads_stdin(argv):
+            stderr.write(
+                "❌ --stdin-filelist needs the file list in the daemon request\n"
+            )
+            return 2
+
+        self.requests_served += 1
+        # Registered classes stay warm; checker instances carry per-run state
+        registry.reset_instances()
+        # Snippets of the previous request have already been formatted
+        source_lines.clear()
+        suppressions.clear()
+        original_cwd, original_stdin = os.getcwd(), sys.stdin
+        try:
+            os.chdir(cwd)
+            # Never let a run read the daemon's own stdin
+            sys.stdin = io.StringIO(stdin or "")
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                cli_main(argv, shared_cache=self.cache, executor=self.executor)
+            return 0
+        except SystemExit as e:
+            if e.code is None:
+                return 0
+            return e.code if isinstance(e.code, int) else 1
+        except OSError as e:
+            stderr.write(f"❌ Fatal error: {e}\n")
+            return 3
+        finally:
+            os.chdir(original_cwd)
+            sys.stdin = original_stdin
+
+    def status(self) -> str:
+        """Describe the daemon's state."""
+        return (
+            f"src-check daemon running (pid {os.getpid()}, "
+            f"{self.requests_served} requests served, "
+            f"{len(registry.list_checkers())} checkers loaded)"
+        )
+
+    def server_close(self) -> None:
+        """Stop the worker pool and remove the socket file."""
+        super().server_close()
+        self.executor.shutdown(wait=False)
+        with suppress(OSError):
+            os.unlink(self.socket_path)
+
+
+def socket_in_use(socket_path: str) -> bool:
+    """Check whether a daemon is listening on the socket path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments for the daemon."""
+    parser = argparse.ArgumentParser(
+        description="src-check daemon - Resident analysis server for fast reruns",
+        prog="src-check daemon",
+    )
+
+    parser.add_argument(
+        "--socket",
+        default=default_socket_path(),
+        help="Unix socket path (default: $SRC_CHECK_DAEMON_SOCKET or a per-user path)",
+    )
+
+    parser.add_argument(
+        "--workers", type=int, help="Number of worker threads for reading files"
+    )
+
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument(
+        "--status", action="store_true", help="Show the running daemon's status"
+    )
+    action.add_argument("--stop", action="store_true", help="Stop the running daemon")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for the src-check daemon."""
+    args = parse_args(argv)
+
+    if args.status or args.stop:
+        command = "status" if args.status else "shutdown"
+        try:
+            code = send_request(
+                {"command": command}, args.socket, sys.stdout, sys.stderr
+            )
+        except OSError:
+            print("❌ No src-check daemon is running", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(code)
+
+    if os.path.exists(args.socket):
+        if socket_in_use(args.socket):
+            print(
+                f"❌ A src-check daemon is already listening on {args.socket}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        os.unlink(args.socket)  # Stale socket from a previous daemon
+
+    server = DaemonServer(args.socket, max_workers=args.workers)
+    print(f"🚀 src-check daemon listening on {args.socket}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⚠️ Daemon stopped", file=sys.stderr)
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+"""
+Language Server Protocol mode for src-check.
+
+``src-check lsp`` speaks JSON-RPC over stdio and publishes src-check findings
+as diagnostics for open editor buffers. Buffers are analyzed from memory, so
+unsaved edits are checked without touching the disk. Edits are debounced,
+analyses of outdated buffer versions are dropped, and unchanged content is
+served from an in-memory result cache.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, ClassVar, Dict, List, Optional
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from src_check.core.cache import MemoryResultCache
+from src_check.core.config_loader import ConfigLoader
+from src_check.core.engine import AnalysisEngine
+from src_check.core.registry import registry
+from src_check.models import CheckResult, FailureLocation, Severity
+from src_check.models.source_lines import LINE_BREAK_RE, source_lines
+from src_check.models.suppressions import suppressions
+
+logger = logging.getLogger(__name__)
+
+# LSP DiagnosticSeverity values
+DIAGNOSTIC_SEVERITY: Dict[Severity, int] = {
+    Severity.CRITICAL: 1,
+    Severity.HIGH: 1,
+    Severity.MEDIUM: 2,
+    Severity.LOW: 3,
+    Severity.INFO: 4,
+}
+
+# JSON-RPC error codes
+METHOD_NOT_FOUND = -32601
+SERVER_NOT_INITIALIZED = -32002
+
+
+def uri_to_path(uri: str) -> Path:
+    """Convert a file:// URI into a filesystem path."""
+    # url2pathname decodes percent-escapes itself; unquoting first would
+    # decode a literal "%" in a file name twice
+    return Path(url2pathname(urlparse(uri).path))
+
+
+def utf16_column(lines: List[str], line: int, offset: Optional[int]) -> int:
+    """Convert a UTF-8 byte offset, as in the AST, into an LSP character.
+
+    Args:
+        lines: Lines of the analyzed buffer
+        line: 0-based line the offset refers to
+        offset: Byte offset in the line, or None for the end of the line
+
+    Returns:
+        Offset in UTF-16 code units, the position encoding LSP defaults to
+    """
+    text = lines[line] if line < len(lines) else ""
+    if offset is not None:
+        text = text.encode("utf-8")[:offset].decode("utf-8", "replace")
+    return len(text.encode("utf-16-le")) // 2
+
+
+def to_diagnostic(
+    result: CheckResult, location: FailureLocation, lines: List[str]
+) -> Dict[str, Any]:
+    """Convert a failure location into an LSP diagnostic.
+
+    Args:
+        result: Check result the failure belongs to
+        location: The failure location (1-based lines, UTF-8 byte columns)
+        lines: Lines of the analyzed buffer, used to convert the columns
+
+    Returns:
+        LSP Diagnostic object
+    """
+    line = max(location.line - 1, 0)
+    start = utf16_column(lines, line, location.column or 0)
+    if location.end_line is not None and location.end_column is not None:
+        end_line = max(location.end_line - 1, line)
+        end = utf16_column(lines, end_line, location.end_column)
+    else:
+        end_line = line
+        end = utf16_column(lines, line, None) if line < len(lines) else start
+    return {
+        "range": {
+            "start": {"line": line, "character": start},
+            "end": {"line": end_line, "character": max(end, start)},
+        },
+        "severity": DIAGNOSTIC_SEVERITY.get(result.severity, 2),
+        "code": result.rule_id or result.checker_name,
+        "source": "src-check",
+        "message": location.message,
+    }
+
+
+class Document:
+    """An open editor buffer."""
+
+    def __init__(self, uri: str, text: str, version: int) -> None:
+        """Initialize the document.
+
+        Args:
+            uri: Document URI
+            text: Current buffer content
+            version: Buffer version reported by the editor
+        """
+        self.uri = uri
+        self.text = text
+        self.version = version
+        self.path = uri_to_path(uri)
+
+
+class LanguageServer:
+    """Minimal language server publishing src-check diagnostics."""
+
+    def __init__(
+        self,
+        reader: BinaryIO,
+        writer: BinaryIO,
+        engine: Optional[AnalysisEngine] = None,
+        debounce: float = 0.3,
+    ) -> None:
+        """Initialize the language server.
+
+        Args:
+            reader: Stream the client writes requests to
+            writer: Stream the server writes responses to
+            engine: Engine to analyze buffers with, created on initialize if None
+            debounce: Seconds to wait after an edit before analyzing
+        """
+        self.reader = reader
+        self.writer = writer
+        self.engine = engine
+        self.debounce = debounce
+        self.documents: Dict[str, Document] = {}
+        self.shutdown_requested = False
+        self.running = True
+        self._write_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._timers: Dict[str, threading.Timer] = {}
+        # Checkers keep per-run state, so analyses run one at a time
+        self._worker = ThreadPoolExecutor(max_workers=1)
+
+    # JSON-RPC transport
+
+    def read_message(self) -> Optional[Dict[str, Any]]:
+        """Read one Content-Length framed message, or None at end of input."""
+        content_length = None
+        while True:
+            header = self.reader.readline()
+            if not header:
+                return None
+            header = header.strip()
+            if not header:
+                break
+            name, _, value = header.decode("ascii").partition(":")
+            if name.lower() == "content-length":
+                content_length = int(value.strip())
+
+        if content_length is None:
+            return None
+        message: Dict[str, Any] = json.loads(self.reader.read(content_length))
+        return message
+
+    def send_message(self, message: Dict[str, Any]) -> None:
+        """Write one Content-Length framed message."""
+        body = json.dumps(message).encode("utf-8")
+        with self._write_lock:
+            self.writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii"))
+            self.writer.write(body)
+            self.writer.flush()
+
+    def notify(self, method: str, params: Dict[str, Any]) -> None:
+        """Send a notification to the client."""
+        self.send_message({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def serve(self) -> None:
+        """Process messages until the client sends exit or closes the stream."""
+        while self.running:
+            message = self.read_message()
+            if message is None:
+                break
+            self.handle_message(message)
+        self.close()
+
+    def close(self) -> None:
+        """Cancel pending analyses and stop the worker."""
+        with self._state_lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+        self._worker.shutdown(wait=False)
+
+    def handle_message(self, message: Dict[str, Any]) -> None:
+        """Dispatch a request or notification."""
+        method = message.get("method", "")
+        params = message.get("params") or {}
+        request_id = message.get("id")
+
+        handler = self.HANDLERS.get(method)
+        if handler is None:
+            if request_id is not None:
+                self._send_error(request_id, METHOD_NOT_FOUND, f"Unknown: {method}")
+            return
+
+        if self.engine is None and method not in ("initialize", "exit"):
+            if request_id is not None:
+                self._send_error(
+                    request_id, SERVER_NOT_INITIALIZED, "Server not initialized"
+                )
+            return
+
+        result = handler(self, params)
+        if request_id is not None:
+            self.send_message({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    def _send_error(self, request_id: Any, code: int, message: str) -> None:
+        self.send_message(
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": code, "message": message},
+            }
+        )
+
+    # Lifecycle
+
+    def on_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Set up the analysis engine for the workspace."""
+        if self.engine is None:
+            root_uri = params.get("rootUri")
+            root = uri_to_path(root_uri) if root_uri else Path.cwd()
+            self.engine = create_engine(root)
+
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": 1,  # Full document sync
+                    "save": {"includeText": False},
+                }
+            },
+            "serverInfo": {"name": "src-check", "version": "0.2.0"},
+        }
+
+    def on_initialized(self, params: Dict[str, Any]) -> None:
+        """Acknowledge the initialized notification."""
+        return None
+
+    def on_shutdown(self, params: Dict[str, Any]) -> None:
+        """Prepare for exit."""
+        self.shutdown_requested = True
+        return None
+
+    def on_exit(self, params: Dict[str, Any]) -> None:
+        """Stop serving."""
+        self.running = False
+        return None
+
+    # Document synchronization
+
+    def on_did_open(self, params: Dict[str, Any]) -> None:
+        """Analyze a newly opened buffer right away."""
+        item = params["textDocument"]
+        document = Document(item["uri"], item.get("text", ""), item.get("version", 0))
+        with self._state_lock:
+            self.documents[document.uri] = document
+        self.schedule(document.uri, delay=0)
+
+    def on_did_change(self, params: Dict[str, Any]) -> None:
+        """Track edits and analyze once the buffer has settled."""
+        identifier = params["textDocument"]
+        changes = params.get("contentChanges") or []
+        with self._state_lock:
+            document = self.documents.get(identifier["uri"])
+            if document is None or not changes:
+                return
+            # Full sync: the last change carries the whole buffer
+            document.text = changes[-1]["text"]
+            document.version = identifier.get("version", document.version + 1)
+        self.schedule(document.uri, delay=self.debounce)
+
+    def on_did_save(self, params: Dict[str, Any]) -> None:
+        """Analyze a saved buffer without waiting for the debounce delay."""
+        self.schedule(params["textDocument"]["uri"], delay=0)
+
+    def on_did_close(self, params: Dict[str, Any]) -> None:
+        """Forget a closed buffer and clear its diagnostics."""
+        uri = params["textDocument"]["uri"]
+        with self._state_lock:
+            document = self.documents.pop(uri, None)
+            timer = self._timers.pop(uri, None)
+        if timer is not None:
+            timer.cancel()
+        if document is not None:
+            source_lines.discard(str(document.path))
+            suppressions.discard(str(document.path))
+        self.notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    # Analysis
+
+    def schedule(self, uri: str, delay: float) -> None:
+        """Schedule an analysis, replacing any pending one for the buffer."""
+        with self._state_lock:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            previous = self._timers.pop(uri, None)
+            if previous is not None:
+                previous.cancel()
+            timer = threading.Timer(delay, self._submit, (uri, document.version))
+            timer.daemon = True
+            self._timers[uri] = timer
+        timer.start()
+
+    def _submit(self, uri: str, version: int) -> None:
+        with self._state_lock:
+            self._timers.pop(uri, None)
+        with suppress(RuntimeError):  # Server is shutting down
+            self._worker.submit(self.analyze, uri, version)
+
+    def _current(self, uri: str, version: int) -> Optional[Document]:
+        with self._state_lock:
+            document = self.documents.get(uri)
+        if document is None or document.version != version:
+            return None
+        return document
+
+    def analyze(self, uri: str, version: int) -> None:
+        """Analyze a buffer version and publish its diagnostics if still current."""
+        document = self._current(uri, version)
+        if document is None or self.engine is None:
+            return  # Superseded by a newer edit or closed
+
+        text = document.text
+        try:
+            results = self.engine.analyze_source(text, document.path)
+        except Exception as e:
+            logger.error(f"Error analyzing {uri}: {e}")
+            return
+
+        if self._current(uri, version) is None:
+            return  # The buffer changed while we were analyzing
+
+        # Split like the tokenizer, so that line numbers match the AST
+        lines = LINE_BREAK_RE.split(text)
+        own_path = str(document.path)
+        diagnostics = [
+            to_diagnostic(result, location, lines)
+            for result in results
+            for location in result.failure_locations
+            if location.file_path == own_path
+        ]
+        self.notify(
+            "textDocument/publishDiagnostics",
+            {"uri": uri, "version": version, "diagnostics": diagnostics},
+        )
+
+    HANDLERS: ClassVar[Dict[str, Callable[..., Any]]] = {
+        "initialize": on_initialize,
+        "initialized": on_initialized,
+        "shutdown": on_shutdown,
+        "exit": on_exit,
+        "textDocument/didOpen": on_did_open,
+        "textDocument/didChange": on_did_change,
+        "textDocument/didSave": on_did_save,
+        "textDocument/didClose": on_did_close,
+    }
+
+
+def create_engine(root: Path) -> AnalysisEngine:
+    """Create an analysis engine using the workspace's configuration."""
+    loader = ConfigLoader()
+    config_path = loader.find_config_file(root)
+    if config_path:
+        config = loader.load_from_file(config_path)
+    else:
+        config = loader.load_default_config()
+
+    registry.discover_plugins()
+    checkers = registry.get_all_checkers(config.is_checker_enabled)
+    return AnalysisEngine(checkers, cache=MemoryResultCache())
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments for the language server."""
+    parser = argparse.ArgumentParser(
+        description="src-check LSP - Diagnostics for editors over stdio",
+        prog="src-check lsp",
+    )
+
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.3,
+        help="Seconds to wait after an edit before analyzing (default: 0.3)",
+    )
+
+    parser.add_argument("--log-file", type=str, help="Write server logs to a file")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for the language server."""
+    args = parse_args(argv)
+    if args.log_file:
+        logging.basicConfig(
+            filename=args.log_file,
+            level=logging.DEBUG,
+            format="%(asctime)s %(levelname)s: %(message)s",
+        )
+
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer, debounce=args.debounce)
+    server.serve()
+    sys.exit(0 if server.shutdown_requested else 1)
+
+
+if __name__ == "__main__":
+    main()
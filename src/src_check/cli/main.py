@@ -7,23 +7,67 @@ and KPI scoring.
 """
 
 import argparse
+import importlib
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
-
-from src_check.core.config_loader import ConfigLoader
-from src_check.core.engine import AnalysisEngine
-from src_check.core.kpi_calculator import KPICalculator
-from src_check.core.registry import registry
-from src_check.formatters import BaseFormatter
-from src_check.formatters.json import JsonFormatter
-from src_check.formatters.markdown import MarkdownFormatter
-from src_check.formatters.text import TextFormatter
-from src_check.models import CheckResult
-
-
-def parse_args() -> argparse.Namespace:
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from src_check.core.cache import ResultCache
+    from src_check.core.config_loader import ConfigLoader, SrcCheckConfig
+    from src_check.core.engine import AnalysisEngine
+    from src_check.core.kpi_calculator import KPICalculator
+    from src_check.core.registry import registry
+    from src_check.formatters import BaseFormatter
+    from src_check.models import CheckResult
+
+# Heavy dependencies are imported on first use, so that --help and --version
+# return without loading the engine. They stay module attributes so that
+# they can be patched like eager imports.
+LAZY_ATTRIBUTES: Dict[str, str] = {
+    "AnalysisEngine": "src_check.core.engine",
+    "ConfigLoader": "src_check.core.config_loader",
+    "KPICalculator": "src_check.core.kpi_calculator",
+    "registry": "src_check.core.registry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazy module attributes on first access."""
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def _import_lazy_attributes() -> None:
+    """Bind every lazy attribute that has not been imported or patched yet."""
+    for name in LAZY_ATTRIBUTES:
+        if name not in globals():
+            __getattr__(name)
+
+
+# Output formats, imported only when selected
+FORMATTERS: Dict[str, Tuple[str, str]] = {
+    "text": ("src_check.formatters.text", "TextFormatter"),
+    "json": ("src_check.formatters.json", "JsonFormatter"),
+    "markdown": ("src_check.formatters.markdown", "MarkdownFormatter"),
+}
+
+# Subcommands dispatched to their own modules before normal argument parsing
+SUBCOMMANDS: Dict[str, str] = {
+    "cache-server": "src_check.cli.cache_server",
+    "daemon": "src_check.cli.daemon",
+    "lsp": "src_check.cli.lsp",
+}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
         description="src-check - Python code quality analysis with KPI scoring",
@@ -67,9 +111,44 @@ def parse_args() -> argparse.Namespace:
         help="Disable specific checkers",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Local result cache directory (enables caching)",
+    )
+
+    parser.add_argument(
+        "--cache-url",
+        type=str,
+        default=os.environ.get("SRC_CHECK_CACHE_URL"),
+        help="Remote result cache server URL (default: $SRC_CHECK_CACHE_URL)",
+    )
+
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Disable the result cache"
+    )
+
+    parser.add_argument(
+        "--stdin-filelist",
+        action="store_true",
+        help="Read the files to analyze from stdin (newline or NUL separated)",
+    )
+
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Analyze the content staged in git instead of the working tree",
+    )
+
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Print per-checker run/skip counts and time to stderr",
+    )
+
     parser.add_argument("--version", action="version", version="%(prog)s 0.2.0")
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def validate_paths(paths: List[str]) -> List[Path]:
@@ -84,33 +163,119 @@ def validate_paths(paths: List[str]) -> List[Path]:
     return validated_paths
 
 
+def collect_sources(args: argparse.Namespace) -> Dict[Path, str]:
+    """Read the sources of an explicit file list, as handed over by git hooks.
+
+    Files come from stdin with --stdin-filelist, otherwise from the paths on
+    the command line, or from the index when --staged is given without paths.
+    Only Python files are kept; no directories are walked.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Mapping of file paths to their staged or working-tree source
+    """
+    from src_check.core.git import read_file_list, read_staged_blobs, staged_files
+
+    cwd = Path.cwd()
+    if args.stdin_filelist:
+        files = [Path(name) for name in read_file_list(sys.stdin)]
+    elif args.paths != ["."]:
+        files = [Path(name) for name in args.paths]
+    else:
+        files = staged_files(cwd)
+
+    files = [f for f in files if f.suffix == ".py"]
+    if args.staged:
+        return read_staged_blobs(files, cwd)
+
+    sources: Dict[Path, str] = {}
+    for file_path in files:
+        try:
+            sources[file_path] = file_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            # Deleted or renamed files are commonly listed by hooks
+            logging.getLogger(__name__).warning(f"Skipping {file_path}: {e}")
+    return sources
+
+
 def setup_logging(verbose: bool) -> None:
     """Setup logging configuration."""
     level = logging.DEBUG if verbose else logging.WARNING
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
 
 
-def get_formatter(format_type: str) -> BaseFormatter:
-    """Get the appropriate formatter based on format type."""
-    formatters = {
-        "text": TextFormatter(),
-        "json": JsonFormatter(),
-        "markdown": MarkdownFormatter(),
-    }
-    return formatters.get(format_type, TextFormatter())
+def build_cache(
+    args: argparse.Namespace, config: "SrcCheckConfig"
+) -> Optional["ResultCache"]:
+    """Create the result cache requested by the arguments and configuration."""
+    from src_check.core.cache import create_result_cache
 
+    if args.no_cache:
+        return None
+
+    cache_url = args.cache_url or config.cache_url
+    cache_dir = args.cache_dir
+    if not cache_dir and config.cache_enabled:
+        cache_dir = config.cache_dir
+
+    try:
+        return create_result_cache(cache_dir=cache_dir, cache_url=cache_url)
+    except (TypeError, ValueError) as e:
+        logging.getLogger(__name__).warning(f"Result cache disabled: {e}")
+        return None
+
+
+def print_timing(engine: "AnalysisEngine") -> None:
+    """Print how often each checker ran or was skipped, and its time."""
+    print(f"{'checker':<20} {'runs':>6} {'skipped':>8} {'seconds':>9}", file=sys.stderr)
+    for name, stats in sorted(engine.stats.items()):
+        print(
+            f"{name:<20} {stats.runs:>6} {stats.skipped:>8} {stats.seconds:>9.3f}",
+            file=sys.stderr,
+        )
+
+
+def get_formatter(format_type: str) -> "BaseFormatter":
+    """Get the appropriate formatter based on format type."""
+    module_name, class_name = FORMATTERS.get(format_type, FORMATTERS["text"])
+    formatter_class = getattr(importlib.import_module(module_name), class_name)
+    formatter: BaseFormatter = formatter_class()
+    return formatter
+
+
+def main(
+    argv: Optional[List[str]] = None,
+    shared_cache: Optional["ResultCache"] = None,
+    executor: Optional["Executor"] = None,
+) -> None:
+    """Main entry point for src-check CLI.
+
+    Args:
+        argv: Arguments to parse instead of sys.argv[1:]
+        shared_cache: Warm cache consulted before the configured cache
+        executor: Worker pool the engine may use to read files
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv and argv[0] in SUBCOMMANDS:
+        module = importlib.import_module(SUBCOMMANDS[argv[0]])
+        module.main(argv[1:])
+        return
 
-def main() -> None:
-    """Main entry point for src-check CLI."""
     args = None
     try:
-        args = parse_args()
+        args = parse_args(argv)
 
         # Setup logging
         setup_logging(args.verbose)
+        _import_lazy_attributes()
 
-        # Validate paths
-        paths = validate_paths(args.paths)
+        # Validate paths, unless the files to analyze are listed explicitly
+        file_list_mode = args.stdin_filelist or args.staged
+        paths = [] if file_list_mode else validate_paths(args.paths)
 
         if args.verbose:
             print("src-check v0.2.0")
@@ -137,9 +302,9 @@ def main() -> None:
         print("🔍 Starting code quality analysis...")
         registry.discover_plugins()
 
-        # Get enabled checkers
+        # Get enabled checkers, importing only their modules
         checkers = []
-        for checker in registry.get_all_checkers():
+        for checker in registry.get_all_checkers(config.is_checker_enabled):
             if config.is_checker_enabled(checker.__class__.__name__):
                 checkers.append(checker)
 
@@ -147,10 +312,20 @@ def main() -> None:
             print(f"📋 Enabled checkers: {[c.name for c in checkers]}")
 
         # Create analysis engine
-        engine = AnalysisEngine(checkers)
+        cache = build_cache(args, config)
+        if shared_cache is not None:
+            from src_check.core.cache import LayeredResultCache
+
+            cache = LayeredResultCache([shared_cache, cache]) if cache else shared_cache
+        engine = AnalysisEngine(checkers, cache=cache, executor=executor)
 
         # Analyze paths
         all_results: Dict[str, List[CheckResult]] = {}
+        if file_list_mode:
+            sources = collect_sources(args)
+            origin = "staged" if args.staged else "listed"
+            print(f"📂 Analyzing {len(sources)} {origin} files...")
+            all_results.update(engine.analyze_sources(sources))
         for path in paths:
             print(f"📂 Analyzing {path}...")
             if path.is_file():
@@ -161,6 +336,11 @@ def main() -> None:
                 dir_results = engine.analyze_directory(path)
                 all_results.update(dir_results)
 
+        if args.verbose and engine.cache is not None:
+            print(f"🗄️ Cache: {engine.cache_hits} hits, {engine.cache_misses} misses")
+        if args.timing:
+            print_timing(engine)
+
         # Calculate KPI score
         calculator = KPICalculator()
         kpi_score = calculator.calculate_project_score(all_results)
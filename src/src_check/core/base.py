@@ -5,7 +5,7 @@ Base class for all checkers.
 import ast
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, ClassVar, FrozenSet, List, Optional, Type
 
 from src_check.models import CheckResult
 
@@ -13,6 +13,32 @@ from src_check.models import CheckResult
 class BaseChecker(ABC):
     """Abstract base class for all quality checkers."""
 
+    # AST node types a finding can start from. The engine skips the checker
+    # for files containing none of them; None means any file can trigger it.
+    interesting_nodes: ClassVar[Optional[FrozenSet[Type[ast.AST]]]] = None
+
+    # Literals (matched case-insensitively against the source) of which at
+    # least one must occur for a finding to be possible; None disables this.
+    trigger_tokens: ClassVar[Optional[FrozenSet[str]]] = None
+
+    # Whether check() needs the full AST. Checkers that only look at import
+    # statements set this to False and receive a module holding just the
+    # imports, which also works on files that fail to parse.
+    needs_ast: ClassVar[bool] = True
+
+    # Whether the checker works on the source text. The engine then calls
+    # check_source() instead of check(), without parsing the file for it.
+    needs_text: ClassVar[bool] = False
+
+    # Whether findings are only produced by check_project() once every file
+    # of a directory has been seen; per-file check() calls collect data.
+    project_only: ClassVar[bool] = False
+
+    # Whether check() also collects data for check_project(). Such checkers
+    # see every file, including files whose results come from the cache,
+    # unless they hand the engine their data to cache (see project_data).
+    collects_project_data: ClassVar[bool] = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -45,6 +71,79 @@ class BaseChecker(ABC):
         """
         pass
 
+    def check_source(self, source: str, file_path: str) -> Optional[CheckResult]:
+        """
+        Perform the check on the source text of a file.
+
+        Called instead of check() for checkers that set needs_text.
+
+        Args:
+            source: Source code of the file, which need not parse
+            file_path: Path to the file being checked
+
+        Returns:
+            CheckResult with findings, or None if no issues found
+        """
+        return self.check(ast.parse(source, filename=file_path), file_path)
+
+    def check_project(self, project_root: Path) -> List[CheckResult]:
+        """
+        Report project-wide findings after every file has been checked.
+
+        Called for checkers that set project_only.
+
+        Args:
+            project_root: Root directory of the analyzed project
+
+        Returns:
+            List of project-level check results
+        """
+        return []
+
+    def project_data(self, file_path: str) -> Optional[Any]:
+        """
+        Return what check() collected from a file for check_project().
+
+        The engine stores the data with the cached results of the file, so
+        that a cache hit restores it instead of checking the file again.
+
+        Args:
+            file_path: Path to a file the checker has seen
+
+        Returns:
+            JSON-serializable data, or None if the checker cannot restore it
+        """
+        return None
+
+    def restore_project_data(self, file_path: str, data: Any) -> None:
+        """
+        Take back the data project_data() returned for a file.
+
+        Called instead of check() for files whose results come from the cache.
+
+        Args:
+            file_path: Path to the file the data belongs to
+            data: Data as returned by project_data()
+        """
+        return None
+
+    def cache_context(self, file_path: str) -> str:
+        """
+        Describe what besides the content decides the findings for a file.
+
+        The result cache keys each file by its content and project-relative
+        path. Checkers whose findings also depend on the rest of the path or
+        on project settings return those inputs here, so that a change in
+        them is not answered from the cache.
+
+        Args:
+            file_path: Path to the file being checked
+
+        Returns:
+            Text identifying the inputs, empty if there are none
+        """
+        return ""
+
     def is_excluded(self, file_path: str, exclude_patterns: List[str]) -> bool:
         """
         Check if the file should be excluded from checking.
@@ -0,0 +1,403 @@
+"""Result cache backends for src-check.
+
+Check results are stored per file under a content-addressed key: the SHA-256
+of the file content combined with a fingerprint of the enabled checkers and
+the file's path relative to its project root. Identical content at the same
+place in a project, analyzed with the same checker set, therefore maps to
+the same entry, no matter which machine or checkout produced it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import urllib.error
+import urllib.request
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from src_check import __version__
+from src_check.core.base import BaseChecker
+from src_check.core.functions import FunctionFacts
+from src_check.models.check_result import CheckResult
+
+logger = logging.getLogger(__name__)
+
+# Placeholder stored instead of the analyzed file's own path, so that cached
+# entries can be shared between checkouts living at different locations.
+FILE_PATH_PLACEHOLDER = "<file>"
+
+
+def config_fingerprint(checkers: Sequence[BaseChecker]) -> str:
+    """Compute a fingerprint of the checker set used for an analysis.
+
+    Args:
+        checkers: Checkers that produce the cached results
+
+    Returns:
+        Hex digest identifying the src-check version and checker set
+    """
+    names = sorted(
+        f"{type(checker).__module__}.{type(checker).__qualname__}"
+        for checker in checkers
+    )
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    for name in names:
+        digest.update(b"\0")
+        digest.update(name.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def compute_cache_key(content: str, fingerprint: str, context: str = "") -> str:
+    """Compute the content-addressed cache key for a file.
+
+    Args:
+        content: Source code of the file
+        fingerprint: Checker fingerprint from config_fingerprint
+        context: Other inputs of the findings, such as the project-relative
+            path of the file and what checkers derive from it
+
+    Returns:
+        Hex digest used as the cache key
+    """
+    digest = hashlib.sha256(fingerprint.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(context.encode("utf-8", errors="surrogatepass"))
+    digest.update(b"\0")
+    digest.update(content.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+def is_valid_key(key: str) -> bool:
+    """Check whether a string is a well-formed cache key."""
+    return len(key) == 64 and all(c in "0123456789abcdef" for c in key)
+
+
+def encode_results(
+    results: List[CheckResult],
+    file_path: str,
+    functions: Optional[List[FunctionFacts]] = None,
+    project_data: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Convert check results into a cacheable payload.
+
+    Args:
+        results: Check results for a single file
+        file_path: Path of the analyzed file
+        functions: Function facts extracted from the file, if any
+        project_data: Data checkers collected from the file for their
+            project phase, keyed by checker name
+
+    Returns:
+        JSON-serializable payload with the file path made relocatable
+    """
+    encoded = []
+    for result in results:
+        data = result.to_dict()
+        for failure in data["failures"]:
+            if failure["file_path"] == file_path:
+                failure["file_path"] = FILE_PATH_PLACEHOLDER
+        encoded.append(data)
+    payload: Dict[str, Any] = {"version": __version__, "results": encoded}
+    if functions is not None:
+        payload["functions"] = [function.to_dict() for function in functions]
+    if project_data:
+        payload["project_data"] = project_data
+    return payload
+
+
+def decode_results(payload: Dict[str, Any], file_path: str) -> List[CheckResult]:
+    """Restore check results from a cached payload.
+
+    Args:
+        payload: Payload produced by encode_results
+        file_path: Path of the file the results are restored for
+
+    Returns:
+        List of check results
+    """
+    results = []
+    for data in payload.get("results", []):
+        result = CheckResult.from_dict(data)
+        for failure in result.failure_locations:
+            if failure.file_path == FILE_PATH_PLACEHOLDER:
+                failure.file_path = file_path
+        results.append(result)
+    return results
+
+
+def decode_functions(payload: Dict[str, Any]) -> Optional[List[FunctionFacts]]:
+    """Restore the function facts stored with cached results.
+
+    Args:
+        payload: Payload produced by encode_results
+
+    Returns:
+        Function facts of the file, or None if none were stored
+    """
+    if "functions" not in payload:
+        return None
+    return [FunctionFacts.from_dict(data) for data in payload["functions"]]
+
+
+class ResultCache(ABC):
+    """Abstract base class for result cache backends."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a single cache entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached payload, or None on a miss
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store a cache entry.
+
+        Args:
+            key: Cache key
+            payload: JSON-serializable payload
+        """
+        pass
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up several cache entries at once.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary mapping the keys that were found to their payloads
+        """
+        found = {}
+        for key in keys:
+            payload = self.get(key)
+            if payload is not None:
+                found[key] = payload
+        return found
+
+
+class MemoryResultCache(ResultCache):
+    """In-process cache backend, bounded by a maximum number of entries."""
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        """Initialize the memory cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting
+        """
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a single cache entry."""
+        payload = self._entries.pop(key, None)
+        if payload is not None:
+            # Re-insert to keep recently used entries at the end
+            self._entries[key] = payload
+        return payload
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store a cache entry, evicting the least recently used one if full."""
+        self._entries.pop(key, None)
+        self._entries[key] = payload
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+
+class LocalResultCache(ResultCache):
+    """Cache backend storing one JSON file per entry in a local directory."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the local cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a single cache entry."""
+        if not is_valid_key(key):
+            return None
+        try:
+            with open(self._entry_path(key), encoding="utf-8") as f:
+                payload: Dict[str, Any] = json.load(f)
+                return payload
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store a cache entry atomically."""
+        if not is_valid_key(key):
+            raise ValueError(f"Invalid cache key: {key}")
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
+
+
+class HttpResultCache(ResultCache):
+    """Cache backend talking to a remote content-addressed HTTP store.
+
+    The protocol is the one served by ``src-check cache-server``:
+
+    - ``GET /v1/cache/<key>`` returns the payload, or 404 on a miss
+    - ``PUT /v1/cache/<key>`` stores the request body as the payload
+    - ``POST /v1/cache/batch`` with ``{"keys": [...]}`` returns
+      ``{"entries": {key: payload}}`` for the keys that were found
+
+    Network failures are treated as cache misses; after the first failure the
+    backend stops contacting the server for the rest of the run.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, base_url: str, timeout: float = 5.0) -> None:
+        """Initialize the HTTP cache client.
+
+        Args:
+            base_url: Base URL of the cache server (e.g. http://cache:8765)
+            timeout: Timeout in seconds for each request
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._disabled = False
+
+    def _request(
+        self, method: str, path: str, body: Optional[bytes] = None
+    ) -> Optional[bytes]:
+        if self._disabled:
+            return None
+
+        request = urllib.request.Request(
+            f"{self.base_url}{path}", data=body, method=method
+        )
+        if body is not None:
+            request.add_header("Content-Type", "application/json")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data: bytes = response.read()
+                return data
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                logger.warning(f"Remote cache {method} {path} failed: HTTP {e.code}")
+            return None
+        except (urllib.error.URLError, OSError) as e:
+            logger.warning(f"Remote cache unavailable, disabling it: {e}")
+            self._disabled = True
+            return None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a single cache entry."""
+        data = self._request("GET", f"/v1/cache/{key}")
+        if data is None:
+            return None
+        try:
+            payload: Dict[str, Any] = json.loads(data)
+            return payload
+        except ValueError:
+            return None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up several cache entries with batched requests."""
+        key_list = list(dict.fromkeys(keys))
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(key_list), self.BATCH_SIZE):
+            batch = key_list[start : start + self.BATCH_SIZE]
+            body = json.dumps({"keys": batch}).encode("utf-8")
+            data = self._request("POST", "/v1/cache/batch", body)
+            if data is None:
+                break
+            try:
+                found.update(json.loads(data).get("entries", {}))
+            except (ValueError, AttributeError):
+                logger.warning("Remote cache returned a malformed batch response")
+        return found
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store a cache entry on the server."""
+        self._request("PUT", f"/v1/cache/{key}", json.dumps(payload).encode("utf-8"))
+
+
+class LayeredResultCache(ResultCache):
+    """Cache that consults several backends in order.
+
+    Entries found in a later (slower) layer are copied into the earlier ones,
+    and new entries are written to every layer.
+    """
+
+    def __init__(self, layers: Sequence[ResultCache]) -> None:
+        """Initialize the layered cache.
+
+        Args:
+            layers: Backends ordered from fastest to slowest
+        """
+        self.layers = list(layers)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a single cache entry."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up several cache entries, layer by layer."""
+        missing = list(keys)
+        found: Dict[str, Dict[str, Any]] = {}
+        for index, layer in enumerate(self.layers):
+            if not missing:
+                break
+            hits = layer.get_many(missing)
+            for key, payload in hits.items():
+                for faster_layer in self.layers[:index]:
+                    faster_layer.put(key, payload)
+            found.update(hits)
+            missing = [key for key in missing if key not in hits]
+        return found
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store a cache entry in every layer."""
+        for layer in self.layers:
+            layer.put(key, payload)
+
+
+def create_result_cache(
+    cache_dir: Optional[str] = None, cache_url: Optional[str] = None
+) -> Optional[ResultCache]:
+    """Create the cache backend for the given settings.
+
+    Args:
+        cache_dir: Local cache directory, or None for no local cache
+        cache_url: Remote cache server URL, or None for no remote cache
+
+    Returns:
+        Configured cache, or None if neither setting is given
+    """
+    layers: List[ResultCache] = []
+    if cache_dir:
+        layers.append(LocalResultCache(Path(cache_dir)))
+    if cache_url:
+        layers.append(HttpResultCache(cache_url))
+
+    if not layers:
+        return None
+    if len(layers) == 1:
+        return layers[0]
+    return LayeredResultCache(layers)
@@ -0,0 +1,124 @@
+"""Reference implementation of the src-check remote cache protocol.
+
+The server is built on the standard library only, so that a shared result
+cache can be run (and tested) without any additional infrastructure. Entries
+are stored on disk through LocalResultCache.
+"""
+
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src_check.core.cache import LocalResultCache, is_valid_key
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "/v1/cache/"
+MAX_BODY_SIZE = 64 * 1024 * 1024  # 64MB
+
+
+class CacheRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for content-addressed GET/PUT and batched lookups."""
+
+    server: "CacheServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """Return a single cache entry."""
+        key = self._parse_key()
+        if key is None:
+            return
+
+        payload = self.server.storage.get(key)
+        if payload is None:
+            self._send_json(404, {"error": "not found"})
+        else:
+            self._send_json(200, payload)
+
+    def do_PUT(self) -> None:
+        """Store a single cache entry."""
+        key = self._parse_key()
+        if key is None:
+            return
+
+        payload = self._read_json()
+        if not isinstance(payload, dict):
+            self._send_json(400, {"error": "payload must be a JSON object"})
+            return
+
+        self.server.storage.put(key, payload)
+        self._send_json(201, {"stored": key})
+
+    def do_POST(self) -> None:
+        """Look up several cache entries at once."""
+        if self.path != f"{CACHE_PREFIX}batch":
+            self._send_json(404, {"error": "not found"})
+            return
+
+        request = self._read_json()
+        keys = request.get("keys") if isinstance(request, dict) else None
+        if not isinstance(keys, list):
+            self._send_json(400, {"error": "expected {'keys': [...]}"})
+            return
+
+        valid_keys = [key for key in keys if isinstance(key, str) and is_valid_key(key)]
+        entries = self.server.storage.get_many(valid_keys)
+        self._send_json(200, {"entries": entries})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Route access logs through the logging module."""
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _parse_key(self) -> Optional[str]:
+        if not self.path.startswith(CACHE_PREFIX):
+            self._send_json(404, {"error": "not found"})
+            return None
+
+        key = self.path[len(CACHE_PREFIX) :]
+        if not is_valid_key(key):
+            self._send_json(400, {"error": "invalid cache key"})
+            return None
+        return key
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0 or length > MAX_BODY_SIZE:
+            return None
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return None
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class CacheServer(ThreadingHTTPServer):
+    """Threaded HTTP server backed by a local cache directory."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], storage_dir: Path) -> None:
+        """Initialize the cache server.
+
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port
+            storage_dir: Directory where cache entries are stored
+        """
+        super().__init__(address, CacheRequestHandler)
+        self.storage = LocalResultCache(storage_dir)
+
+    @property
+    def url(self) -> str:
+        """Base URL clients should use to reach this server."""
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
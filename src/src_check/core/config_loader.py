@@ -2,13 +2,10 @@
 
 import json
 import logging
+import sys
 from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Optional, cast
 
-import yaml
-
-# Remove unused import
-
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +43,8 @@ class SrcCheckConfig:
         self.max_file_size = data.get("max_file_size", 1048576)  # 1MB default
         self.parallel = data.get("parallel", False)
         self.cache_enabled = data.get("cache_enabled", False)
+        self.cache_dir = data.get("cache_dir", ".src-check-cache")
+        self.cache_url = data.get("cache_url")
 
     def get_checker_config(self, checker_name: str) -> Dict[str, Any]:
         """Get configuration for a specific checker.
@@ -132,6 +131,8 @@ class ConfigLoader:
         "max_file_size": 1048576,
         "parallel": False,
         "cache_enabled": False,
+        "cache_dir": ".src-check-cache",
+        "cache_url": None,
     }
 
     # Supported config file names
@@ -212,6 +213,8 @@ class ConfigLoader:
 
     def _load_yaml(self, path: Path) -> Dict[str, Any]:
         """Load YAML configuration file."""
+        import yaml
+
         with open(path) as f:
             return yaml.safe_load(f) or {}
 
@@ -223,14 +226,20 @@ class ConfigLoader:
 
     def _load_pyproject_toml(self, path: Path) -> Dict[str, Any]:
         """Load configuration from pyproject.toml."""
-        try:
-            import toml
-        except ImportError:
-            logger.warning("toml package not installed, cannot read pyproject.toml")
-            return {}
+        if sys.version_info >= (3, 11):
+            import tomllib
 
-        with open(path) as f:
-            data = toml.load(f)
+            with open(path, "rb") as binary_file:
+                data = tomllib.load(binary_file)
+        else:
+            try:
+                import toml
+            except ImportError:
+                logger.warning("toml package not installed, cannot read pyproject.toml")
+                return {}
+
+            with open(path) as f:
+                data = toml.load(f)
 
         # Extract src-check configuration
         tool_config = data.get("tool", {})
@@ -0,0 +1,130 @@
+"""Source file discovery that visits each physical file once."""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FileKey = Tuple[int, int]
+
+
+@dataclass
+class DiscoveredFile:
+    """A physical file found during discovery."""
+
+    path: Path
+    aliases: List[Path] = field(default_factory=list)
+
+
+class FileWalker:
+    """Directory walker keyed by ``(st_dev, st_ino)``.
+
+    Symlinked directories are followed, but a directory that is already one
+    of its own ancestors is skipped, so symlink loops terminate. Files that
+    are reachable through several paths are reported once, with the other
+    paths recorded as aliases.
+    """
+
+    def __init__(
+        self,
+        suffix: str = ".py",
+        skip_dir: Optional[Callable[[Path], bool]] = None,
+        on_directory: Optional[Callable[[Path, List[str]], None]] = None,
+    ):
+        """Initialize the walker.
+
+        Args:
+            suffix: File name suffix to collect
+            skip_dir: Optional predicate for directories that should be pruned
+            on_directory: Optional callback given each listed directory and
+                the names of its entries
+        """
+        self.suffix = suffix
+        self.skip_dir = skip_dir
+        self.on_directory = on_directory
+        self.cycles: List[Path] = []
+        self._files: Dict[FileKey, DiscoveredFile] = {}
+
+    def walk(self, root: Path, recursive: bool = True) -> None:
+        """Collect files below a directory.
+
+        Args:
+            root: Directory to walk
+            recursive: Whether to descend into subdirectories
+        """
+        try:
+            root_stat = root.stat()
+        except OSError as e:
+            logger.warning(f"Cannot access {root}: {e}")
+            return
+
+        stack: List[Tuple[Path, FrozenSet[FileKey]]] = [
+            (root, frozenset([(root_stat.st_dev, root_stat.st_ino)]))
+        ]
+        while stack:
+            directory, ancestors = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError as e:
+                logger.warning(f"Cannot read directory {directory}: {e}")
+                continue
+            if self.on_directory is not None:
+                self.on_directory(directory, [entry.name for entry in entries])
+
+            subdirectories = []
+            for entry in entries:
+                path = directory / entry.name
+                try:
+                    is_dir = entry.is_dir()
+                    if not is_dir and not entry.name.endswith(self.suffix):
+                        continue
+                    st = entry.stat()  # Follows symlinks
+                except OSError:
+                    continue  # Broken symlink or vanished entry
+
+                key = (st.st_dev, st.st_ino)
+                if is_dir:
+                    if not recursive or (self.skip_dir and self.skip_dir(path)):
+                        continue
+                    if key in ancestors:
+                        logger.warning(f"Symlink cycle detected at {path}")
+                        self.cycles.append(path)
+                        continue
+                    subdirectories.append((path, ancestors | {key}))
+                elif entry.is_file():
+                    self._add_file(key, path)
+
+            # Reverse so that directories are visited in name order
+            stack.extend(reversed(subdirectories))
+
+    def _add_file(self, key: FileKey, path: Path) -> None:
+        discovered = self._files.get(key)
+        if discovered is None:
+            self._files[key] = DiscoveredFile(path)
+        else:
+            discovered.aliases.append(path)
+
+    def files(self) -> List[DiscoveredFile]:
+        """Return the discovered files in discovery order.
+
+        For files with aliases, a path without symlinks in it is preferred
+        as the primary path.
+        """
+        for discovered in self._files.values():
+            if discovered.aliases and _is_symlinked(discovered.path):
+                candidates = [discovered.path, *discovered.aliases]
+                primary = next(
+                    (p for p in candidates if not _is_symlinked(p)), discovered.path
+                )
+                candidates.remove(primary)
+                discovered.path, discovered.aliases = primary, candidates
+        return list(self._files.values())
+
+
+def _is_symlinked(path: Path) -> bool:
+    """Check whether a path goes through a symlink."""
+    return os.path.realpath(path) != os.path.abspath(path)
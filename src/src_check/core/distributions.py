@@ -0,0 +1,201 @@
+"""
+Index of the distributions installed in the running environment.
+
+Reading the metadata of every installed distribution is slow on large
+environments, and both the license and the dependency checker need it. The
+index records each distribution's name, version, top-level modules and
+license once; it is cached per environment next to the entry-point index
+and rebuilt only when the ``site-packages`` state changes.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import logging
+import re
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from src_check.core.manifest import (
+    default_cache_dir,
+    environment_fingerprint,
+    write_manifest,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the recorded fields change, so that old indexes are rebuilt
+INDEX_VERSION = 1
+
+# License identifiers and the patterns used to recognise them in license
+# files and distribution metadata
+LICENSE_PATTERNS: Dict[str, str] = {
+    "MIT": r"MIT License|Permission is hereby granted, free of charge|^MIT$",
+    "Apache-2.0": r"Apache License.*Version 2\.0|apache.*2\.0|^Apache-2\.0$",
+    "GPL-3.0": r"GNU GENERAL PUBLIC LICENSE.*Version 3|GPL-3\.0|GPLv3",
+    "GPL-2.0": r"GNU GENERAL PUBLIC LICENSE.*Version 2|GPL-2\.0|GPLv2",
+    "BSD-3-Clause": r"BSD 3-Clause License|Redistribution and use in source and binary forms|^BSD-3-Clause$",
+    "BSD-2-Clause": r"BSD 2-Clause License|^BSD-2-Clause$",
+    "ISC": r"ISC License|^ISC$",
+    "LGPL-3.0": r"GNU LESSER GENERAL PUBLIC LICENSE.*Version 3|LGPL-3\.0|LGPLv3",
+    "LGPL-2.1": r"GNU LESSER GENERAL PUBLIC LICENSE.*Version 2\.1|LGPL-2\.1|LGPLv2\.1",
+    "MPL-2.0": r"Mozilla Public License.*Version 2\.0|MPL-2\.0",
+    "Unlicense": r"This is free and unencumbered software released into the public domain|^Unlicense$",
+}
+
+_COMPILED_PATTERNS: List[Tuple[str, Pattern[str]]] = [
+    (license_id, re.compile(pattern, re.IGNORECASE | re.DOTALL))
+    for license_id, pattern in LICENSE_PATTERNS.items()
+]
+
+
+def identify_license(text: str) -> Optional[str]:
+    """Return the identifier of the first license pattern matching a text."""
+    for license_id, pattern in _COMPILED_PATTERNS:
+        if pattern.search(text):
+            return license_id
+    return None
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a distribution name as in PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+@dataclass(frozen=True)
+class DistributionInfo:
+    """Metadata of one installed distribution."""
+
+    name: str
+    version: str
+    top_level: Tuple[str, ...]
+    license: Optional[str]
+    license_id: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DistributionInfo":
+        """Create a DistributionInfo from a dictionary produced by asdict."""
+        return cls(
+            name=data["name"],
+            version=data.get("version", ""),
+            top_level=tuple(data.get("top_level", ())),
+            license=data.get("license"),
+            license_id=data.get("license_id"),
+        )
+
+
+class DistributionIndex:
+    """Installed distributions, looked up by normalized name."""
+
+    def __init__(self, distributions: List[DistributionInfo]):
+        """Initialize the index.
+
+        Args:
+            distributions: Distributions in ``sys.path`` order
+        """
+        self.distributions = distributions
+        self._by_name: Dict[str, DistributionInfo] = {}
+        for info in distributions:
+            self._by_name.setdefault(normalize_name(info.name), info)
+
+    def __iter__(self) -> Iterator[DistributionInfo]:
+        return iter(self.distributions)
+
+    def __len__(self) -> int:
+        return len(self.distributions)
+
+    def get(self, name: str) -> Optional[DistributionInfo]:
+        """Look up a distribution by name, ignoring case and separators."""
+        return self._by_name.get(normalize_name(name))
+
+
+def scan_distributions() -> List[DistributionInfo]:
+    """Read the metadata of every installed distribution.
+
+    A distribution found more than once on ``sys.path`` is recorded once,
+    as the first copy is the one that gets imported.
+    """
+    infos: List[DistributionInfo] = []
+    seen = set()
+    for dist in importlib.metadata.distributions():
+        metadata = dist.metadata
+        name = metadata.get("Name", "Unknown")
+        if not isinstance(name, str) or normalize_name(name) in seen:
+            continue
+        seen.add(normalize_name(name))
+
+        version = metadata.get("Version") or ""
+        license_text = metadata.get("License") or None
+        try:
+            top_level_text = dist.read_text("top_level.txt")
+        except Exception:
+            top_level_text = None
+        top_level = (
+            tuple(line for line in top_level_text.split() if line)
+            if isinstance(top_level_text, str)
+            else ()
+        )
+        infos.append(
+            DistributionInfo(
+                name=name,
+                version=version if isinstance(version, str) else "",
+                top_level=top_level,
+                license=license_text,
+                license_id=identify_license(license_text) if license_text else None,
+            )
+        )
+    return infos
+
+
+# Indexes already loaded by this process, keyed by cache file
+_loaded: Dict[Path, Tuple[str, DistributionIndex]] = {}
+
+
+def load_distribution_index(cache_dir: Optional[Path] = None) -> DistributionIndex:
+    """Load the cached distribution index, rebuilding it if the environment changed.
+
+    Args:
+        cache_dir: Directory for the index, defaults to the user cache
+
+    Returns:
+        Index of the installed distributions
+    """
+    fingerprint = environment_fingerprint()
+    environment = hashlib.sha256(sys.prefix.encode("utf-8")).hexdigest()[:16]
+    path = (cache_dir or default_cache_dir()) / f"distributions-{environment}.json"
+
+    loaded = _loaded.get(path)
+    if loaded is not None and loaded[0] == fingerprint:
+        return loaded[1]
+
+    index: Optional[DistributionIndex] = None
+    try:
+        data: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        if (
+            data.get("version") == INDEX_VERSION
+            and data.get("fingerprint") == fingerprint
+        ):
+            index = DistributionIndex(
+                [DistributionInfo.from_dict(d) for d in data["distributions"]]
+            )
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    if index is None:
+        index = DistributionIndex(scan_distributions())
+        try:
+            write_manifest(
+                {
+                    "version": INDEX_VERSION,
+                    "fingerprint": fingerprint,
+                    "distributions": [asdict(d) for d in index.distributions],
+                },
+                path,
+            )
+        except OSError as e:
+            logger.debug(f"Could not cache distribution index: {e}")
+
+    _loaded[path] = (fingerprint, index)
+    return index
@@ -2,17 +2,49 @@
 
 import ast
 import logging
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from src_check.core.base import BaseChecker
+from src_check.core.cache import (
+    ResultCache,
+    compute_cache_key,
+    config_fingerprint,
+    decode_functions,
+    decode_results,
+    encode_results,
+)
+from src_check.core.discovery import FileWalker
+from src_check.core.functions import FunctionFacts, function_facts
+from src_check.core.import_graph import import_graph
+from src_check.core.imports import scan_imports
+from src_check.core.modules import local_imports, module_index
+from src_check.core.profile import FileProfile
+from src_check.core.project import project_roots
+from src_check.core.references import test_references
 from src_check.core.registry import registry
+from src_check.core.scopes import scope_analyses
+from src_check.core.target_version import target_versions
 from src_check.models.check_result import CheckResult
 from src_check.models.config import SrcCheckConfig
+from src_check.models.source_lines import source_lines
+from src_check.models.suppressions import suppressions
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CheckerStats:
+    """How often a checker ran or was skipped, and the time it took."""
+
+    runs: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+
 class AnalysisEngine:
     """Engine for analyzing files and directories using multiple checkers."""
 
@@ -20,12 +52,16 @@ class AnalysisEngine:
         self,
         checkers: Union[List[str], List[BaseChecker]],
         config: Optional[SrcCheckConfig] = None,
+        cache: Optional[ResultCache] = None,
+        executor: Optional[Executor] = None,
     ):
         """Initialize the analysis engine.
 
         Args:
             checkers: List of checker names or checker instances to run
             config: Optional configuration object
+            cache: Optional result cache consulted before running checkers
+            executor: Optional worker pool used to read files concurrently
         """
         self.checkers: List[BaseChecker] = []
 
@@ -42,6 +78,16 @@ class AnalysisEngine:
                 self.checkers.append(checker)
 
         self.config = config or SrcCheckConfig()
+        self.cache = cache
+        self.executor = executor
+        self._fingerprint: Optional[str] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Per-checker run/skip counts and time spent, keyed by checker name
+        self.stats: Dict[str, CheckerStats] = {}
+        self._profiling: Optional[bool] = None
+        # Other paths of files reached through symlinks, keyed by primary path
+        self.aliases: Dict[str, List[str]] = {}
 
     def analyze_file(self, file_path: Path) -> List[CheckResult]:
         """Analyze a single file with all checkers.
@@ -52,33 +98,203 @@ class AnalysisEngine:
         Returns:
             List of check results from all checkers
         """
-        results: List[CheckResult] = []
-
         if not file_path.exists():
             logger.warning(f"File not found: {file_path}")
-            return results
+            return []
 
         if not file_path.is_file():
             logger.warning(f"Not a file: {file_path}")
-            return results
+            return []
+
+        content = self._read_file(file_path)
+        if content is None:
+            return []
+
+        return self.analyze_source(content, file_path)
+
+    def analyze_source(self, content: str, file_path: Path) -> List[CheckResult]:
+        """Analyze source code held in memory, such as an unsaved editor buffer.
+
+        Args:
+            content: Source code to analyze
+            file_path: Path the source belongs to (need not match disk content)
+
+        Returns:
+            List of check results from all checkers
+        """
+        cached = None
+        if self.cache is not None:
+            cached = self.cache.get(self._cache_key(content, file_path))
+        return self._analyze_content(file_path, content, cached)
 
-        # Parse the Python file
+    def _read_file(self, file_path: Path) -> Optional[str]:
+        """Read a source file, logging and returning None on failure."""
         try:
             with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-            ast_tree = ast.parse(content, filename=str(file_path))
+                return f.read()
         except Exception as e:
-            logger.error(f"Error parsing {file_path}: {e}")
+            logger.error(f"Error reading {file_path}: {e}")
+            return None
+
+    def _cache_key(self, content: str, file_path: Path) -> str:
+        """Compute the cache key of a file's content for the current checkers.
+
+        Besides the content, findings depend on where the file sits in its
+        project (module and layer names, test files) and on whatever else
+        the checkers report through cache_context.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = config_fingerprint(self.checkers)
+        relative = file_path.relative_to(project_roots.root_of(file_path))
+        context = [relative.as_posix()]
+        context.extend(
+            checker.cache_context(str(file_path)) for checker in self.checkers
+        )
+        return compute_cache_key(content, self._fingerprint, "\0".join(context))
+
+    def _analyze_content(
+        self,
+        file_path: Path,
+        content: str,
+        cached: Optional[Dict[str, Any]] = None,
+    ) -> List[CheckResult]:
+        """Analyze already-read file content, using a cached payload if given.
+
+        Args:
+            file_path: Path of the file the content belongs to
+            content: Source code to analyze
+            cached: Cache payload looked up for the content, if any
+
+        Returns:
+            List of check results from all checkers
+        """
+        # Cached results are already filtered, but project phases still
+        # report findings in the file
+        suppressions.record(str(file_path), content)
+
+        if cached is not None:
+            self.cache_hits += 1
+            # Checkers collecting project data still need to see every file;
+            # whatever they report per file is already in the cached payload,
+            # and so is the data of checkers that can restore it. Only the
+            # others check the file again, with the cached function facts.
+            stored = cached.get("project_data", {})
+            pending = []
+            for checker in self._project_checkers():
+                data = stored.get(self._checker_name(checker))
+                if data is None:
+                    pending.append(checker)
+                else:
+                    checker.restore_project_data(str(file_path), data)
+            if pending:
+                self._run_checkers(
+                    file_path, content, pending, decode_functions(cached)
+                )
+            results = decode_results(cached, str(file_path))
+            self._record_source(file_path, content, results)
             return results
 
+        results, functions = self._run_checkers(file_path, content)
+        self._record_source(file_path, content, results)
+
+        if self.cache is not None:
+            self.cache_misses += 1
+            project_data = {}
+            for checker in self._project_checkers():
+                data = checker.project_data(str(file_path))
+                if data is not None:
+                    project_data[self._checker_name(checker)] = data
+            self.cache.put(
+                self._cache_key(content, file_path),
+                encode_results(results, str(file_path), functions, project_data),
+            )
+        return results
+
+    @staticmethod
+    def _record_source(
+        file_path: Path, content: str, results: List[CheckResult]
+    ) -> None:
+        """Keep the content of a file with findings for resolving its snippets."""
+        if any(result.failure_locations for result in results):
+            source_lines.record(str(file_path), content)
+
+    def _run_checkers(
+        self,
+        file_path: Path,
+        content: str,
+        checkers: Optional[List[BaseChecker]] = None,
+        functions: Optional[List[FunctionFacts]] = None,
+    ) -> Tuple[List[CheckResult], Optional[List[FunctionFacts]]]:
+        """Run checkers on content, parsing it only if some checker needs the AST.
+
+        Text-only and import-only checkers still run when the file does not
+        parse.
+
+        Args:
+            file_path: Path of the file the content belongs to
+            content: Source code to analyze
+            checkers: Checkers to run, defaults to all of them
+            functions: Function facts of the content restored from the cache
+
+        Returns:
+            Check results from the checkers, and the function facts of the
+            content if any checker used them
+        """
+        results: List[CheckResult] = []
+        checkers = self.checkers if checkers is None else checkers
+
+        # Checkers a comment silences for the whole file are not run at all
+        suppressed = suppressions.of(str(file_path))
+        if suppressed is not None:
+            kept = []
+            for checker in checkers:
+                checker_name = self._checker_name(checker)
+                if suppressed.skips_checker(checker_name):
+                    self.stats.setdefault(checker_name, CheckerStats()).skipped += 1
+                else:
+                    kept.append(checker)
+            checkers = kept
+
+        # Parse the Python file, unless every checker can do without the AST
+        ast_tree: Optional[ast.AST] = None
+        if any(self._needs_ast(checker) for checker in checkers):
+            try:
+                ast_tree = ast.parse(content, filename=str(file_path))
+            except Exception as e:
+                logger.error(f"Error parsing {file_path}: {e}")
+        if ast_tree is not None and functions is not None:
+            function_facts.seed(ast_tree, functions)
+        import_tree: Optional[ast.AST] = ast_tree
+
+        # Profile the file once so that checkers that cannot trigger are skipped
+        profile = None
+        if ast_tree is not None and self._uses_profiles():
+            profile = FileProfile(ast_tree, content)
+
         # Run each checker
-        for checker in self.checkers:
+        for checker in checkers:
+            checker_name = self._checker_name(checker)
+            stats = self.stats.setdefault(checker_name, CheckerStats())
+            text_only = self._capability(checker, "needs_text", False)
+            if not text_only and self._needs_ast(checker) and ast_tree is None:
+                continue  # Unparsable file
+            if profile is not None and not profile.may_trigger(checker):
+                stats.skipped += 1
+                continue
+
+            started = time.perf_counter()
             try:
                 # Try check_file method first (for mock compatibility)
                 if hasattr(checker, "check_file"):
                     checker_result = checker.check_file(file_path)
-                else:
+                elif text_only:
+                    checker_result = checker.check_source(content, str(file_path))
+                elif ast_tree is not None and self._needs_ast(checker):
                     checker_result = checker.check(ast_tree, str(file_path))
+                else:
+                    if import_tree is None:
+                        import_tree = scan_imports(content)
+                    checker_result = checker.check(import_tree, str(file_path))
 
                 if checker_result:
                     # Check if it's a single result or list
@@ -86,12 +302,136 @@ class AnalysisEngine:
                         results.extend(checker_result)
                     else:
                         results.append(checker_result)
+            except Exception as e:
+                logger.error(f"Error running {checker_name} on {file_path}: {e}")
+            finally:
+                stats.runs += 1
+                stats.seconds += time.perf_counter() - started
+
+        # Checkers share one scope analysis and one set of function facts
+        # per file, built by the first to ask
+        if ast_tree is not None:
+            functions = function_facts.peek(ast_tree)
+        scope_analyses.clear()
+        function_facts.clear()
+        return self._drop_suppressed(results), functions
+
+    @staticmethod
+    def _drop_suppressed(results: List[CheckResult]) -> List[CheckResult]:
+        """Drop silenced findings that a checker recorded without asking.
+
+        Args:
+            results: Check results as returned by the checkers
+
+        Returns:
+            The results, without silenced findings and results left empty
+        """
+        if not suppressions:
+            return results
+        kept = []
+        for result in results:
+            if result.failure_locations:
+                result.failure_locations = [
+                    location
+                    for location in result.failure_locations
+                    if suppressions.allows(
+                        location.file_path,
+                        location.line,
+                        location.message,
+                        result.checker_name,
+                        result.rule_id,
+                    )
+                ]
+                if not result.failure_locations:
+                    continue
+            kept.append(result)
+        return kept
+
+    @staticmethod
+    def _capability(checker: BaseChecker, flag: str, default: bool) -> bool:
+        """Read a capability flag from a checker's class."""
+        value = getattr(type(checker), flag, default)
+        return value if isinstance(value, bool) else default
+
+    def _needs_ast(self, checker: BaseChecker) -> bool:
+        """Check whether a checker must be given the fully parsed file."""
+        return self._capability(checker, "needs_ast", True) and not (
+            self._capability(checker, "needs_text", False)
+        )
+
+    def _project_checkers(self) -> List[BaseChecker]:
+        """Return the checkers that must see every file, cached or not."""
+        return [
+            c
+            for c in self.checkers
+            if self._capability(c, "project_only", False)
+            or self._capability(c, "collects_project_data", False)
+        ]
+
+    def _project_phase_checkers(self) -> List[BaseChecker]:
+        """Return the checkers with a project phase, project-only or not."""
+        return [
+            c
+            for c in self.checkers
+            if self._capability(c, "project_only", False)
+            or getattr(type(c), "check_project", None)
+            not in (None, BaseChecker.check_project)
+        ]
+
+    def _run_project_checkers(self, project_root: Path) -> List[CheckResult]:
+        """Collect the project-level findings of checkers with a project phase.
+
+        Args:
+            project_root: Root directory of the analyzed project
+
+        Returns:
+            List of project-level check results
+        """
+        results: List[CheckResult] = []
+        for checker in self._project_phase_checkers():
+            try:
+                results.extend(checker.check_project(project_root))
             except Exception as e:
                 logger.error(
-                    f"Error running {checker.name if hasattr(checker, 'name') else type(checker).__name__} on {file_path}: {e}"
+                    f"Error running {self._checker_name(checker)} "
+                    f"on project {project_root}: {e}"
                 )
+        return self._drop_suppressed(results)
 
-        return results
+    def _update_import_graph(self, contents: Dict[Path, str]) -> None:
+        """Bring the shared import graph up to date with a run's files.
+
+        Imports are taken from the import scanner rather than from the
+        checkers' parse, so files answered from the result cache count too.
+        Unchanged files leave the graph, and its derived data, untouched.
+
+        Args:
+            contents: Source code of every file in the run
+        """
+        modules = []
+        for file_path, content in contents.items():
+            module = module_index.module_name(file_path)
+            if not module:
+                continue
+            targets = local_imports(scan_imports(content), file_path)
+            import_graph.set_imports(module, str(file_path), targets)
+            modules.append(module)
+        import_graph.retain(modules)
+
+    def _uses_profiles(self) -> bool:
+        """Check whether any checker declares triggers worth profiling for."""
+        if self._profiling is None:
+            self._profiling = any(
+                isinstance(getattr(type(checker), attr, None), frozenset)
+                for checker in self.checkers
+                for attr in ("interesting_nodes", "trigger_tokens")
+            )
+        return self._profiling
+
+    @staticmethod
+    def _checker_name(checker: BaseChecker) -> str:
+        """Return a display name for a checker, tolerating incomplete ones."""
+        return checker.name if hasattr(checker, "name") else type(checker).__name__
 
     def analyze_directory(
         self, dir_path: Path, recursive: bool = True
@@ -115,19 +455,106 @@ class AnalysisEngine:
             logger.warning(f"Not a directory: {dir_path}")
             return results
 
-        # Find all Python files
-        pattern = "**/*.py" if recursive else "*.py"
-        python_files = list(dir_path.glob(pattern))
+        # Find all Python files, once per physical file
+        # Directory listings double as the project-root map and module index
+        # for this run
+        project_roots.clear()
+        module_index.clear()
+        target_versions.clear()
+        test_references.clear()
+        walker = FileWalker(
+            skip_dir=lambda d: bool(self._get_excluded_files([d])),
+            on_directory=self._record_listing,
+        )
+        walker.walk(dir_path, recursive=recursive)
+        discovered = walker.files()
+        python_files = [f.path for f in discovered]
+        for python_file in python_files:
+            module_index.add_file(python_file)
 
         # Apply exclusions from config
         excluded_files = self._get_excluded_files(python_files)
         files_to_check = [f for f in python_files if f not in excluded_files]
+        aliases = {
+            str(f.path): [str(alias) for alias in f.aliases]
+            for f in discovered
+            if f.aliases
+        }
 
         logger.info(f"Found {len(files_to_check)} Python files to analyze")
 
+        # Read every file up front so that cache lookups can be batched
+        if self.executor is not None:
+            read_results = list(self.executor.map(self._read_file, files_to_check))
+        else:
+            read_results = [self._read_file(f) for f in files_to_check]
+        contents: Dict[Path, str] = {
+            file_path: content
+            for file_path, content in zip(files_to_check, read_results)
+            if content is not None
+        }
+
+        if self._project_phase_checkers():
+            self._update_import_graph(contents)
+
+        results = self.analyze_sources(contents)
+        self._attach_aliases(results, aliases)
+
+        # Let checkers with a project phase report once every file has been seen
+        project_root = project_roots.root_of_dir(dir_path)
+        if not project_roots.is_root(project_root):
+            project_root = dir_path
+        project_results = self._run_project_checkers(project_root)
+        if project_results:
+            results.setdefault(str(dir_path), []).extend(project_results)
+        return results
+
+    @staticmethod
+    def _record_listing(directory: Path, names: List[str]) -> None:
+        """Feed a directory listing read during discovery to the project maps."""
+        project_roots.record_listing(directory, names)
+        module_index.record_listing(directory, names)
+
+    def _attach_aliases(
+        self, results: Dict[str, List[CheckResult]], aliases: Dict[str, List[str]]
+    ) -> None:
+        """Record the other paths of aliased files on their failure locations.
+
+        Args:
+            results: Results keyed by the primary path of each file
+            aliases: Other paths of each file, keyed by its primary path
+        """
+        self.aliases.update(aliases)
+        for file_path, paths in aliases.items():
+            for result in results.get(file_path, []):
+                for location in result.failure_locations:
+                    if location.file_path == file_path:
+                        location.aliases = list(paths)
+
+    def analyze_sources(self, sources: Dict[Path, str]) -> Dict[str, List[CheckResult]]:
+        """Analyze a set of in-memory sources, batching the cache lookups.
+
+        Args:
+            sources: Mapping of file paths to their source code
+
+        Returns:
+            Dictionary mapping file paths to their check results
+        """
+        results: Dict[str, List[CheckResult]] = {}
+
+        keys: Dict[Path, str] = {}
+        cached: Dict[str, Dict[str, Any]] = {}
+        if self.cache is not None and sources:
+            keys = {
+                path: self._cache_key(content, path)
+                for path, content in sources.items()
+            }
+            cached = self.cache.get_many(set(keys.values()))
+
         # Analyze each file
-        for file_path in files_to_check:
-            file_results = self.analyze_file(file_path)
+        for file_path, content in sources.items():
+            payload = cached.get(keys[file_path]) if cached else None
+            file_results = self._analyze_content(file_path, content, payload)
             if file_results:
                 results[str(file_path)] = file_results
 
@@ -0,0 +1,299 @@
+"""
+Per-function facts shared by the checkers.
+
+One walk over a parsed file records what the documentation, type-hint,
+naming, complexity and test checkers look at for every function and
+method: its signature with annotations, docstring, decorators and McCabe
+complexity. Records hold no AST nodes, so they can be cached next to the
+results of a file. The engine keeps the facts of the file being checked,
+like its scope analysis, and drops them when moving on.
+"""
+
+import ast
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+
+@dataclass(frozen=True)
+class ArgumentFacts:
+    """A parameter of a function."""
+
+    name: str
+    # Annotation as written, e.g. "List[str]"; None if there is none
+    annotation: Optional[str] = None
+    # "posonly", "positional", "vararg", "kwonly" or "kwarg"
+    kind: str = "positional"
+
+
+@dataclass(frozen=True)
+class FunctionFacts:
+    """Signature and summary of one function or method."""
+
+    name: str
+    # Qualified name within the module, e.g. "Service.run" or
+    # "outer.<locals>.inner", as in __qualname__
+    qualname: str
+    line: int
+    column: int
+    end_line: Optional[int]
+    is_async: bool
+    # Defined directly in a class body
+    is_method: bool
+    # Defined inside another function, at any depth
+    is_nested: bool
+    args: Tuple[ArgumentFacts, ...]
+    returns: Optional[str]
+    docstring: Optional[str]
+    decorators: Tuple[str, ...]
+    complexity: int
+    # The body is a single return of a name or attribute, e.g. a getter
+    returns_attribute: bool = False
+
+    def positional_args(self) -> List[ArgumentFacts]:
+        """Return the parameters listed before any '*', after any '/'."""
+        return [arg for arg in self.args if arg.kind == "positional"]
+
+    def has_arg(self, kind: str) -> bool:
+        """Check whether the function takes a parameter of the given kind."""
+        return any(arg.kind == kind for arg in self.args)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary for JSON serialization."""
+        return {
+            "name": self.name,
+            "qualname": self.qualname,
+            "line": self.line,
+            "column": self.column,
+            "end_line": self.end_line,
+            "is_async": self.is_async,
+            "is_method": self.is_method,
+            "is_nested": self.is_nested,
+            "args": [[arg.name, arg.annotation, arg.kind] for arg in self.args],
+            "returns": self.returns,
+            "docstring": self.docstring,
+            "decorators": list(self.decorators),
+            "complexity": self.complexity,
+            "returns_attribute": self.returns_attribute,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FunctionFacts":
+        """Create FunctionFacts from a dictionary produced by to_dict."""
+        return cls(
+            name=data["name"],
+            qualname=data.get("qualname", data["name"]),
+            line=data.get("line", 0),
+            column=data.get("column", 0),
+            end_line=data.get("end_line"),
+            is_async=data.get("is_async", False),
+            is_method=data.get("is_method", False),
+            is_nested=data.get("is_nested", False),
+            args=tuple(ArgumentFacts(*arg) for arg in data.get("args", [])),
+            returns=data.get("returns"),
+            docstring=data.get("docstring"),
+            decorators=tuple(data.get("decorators", [])),
+            complexity=data.get("complexity", 1),
+            returns_attribute=data.get("returns_attribute", False),
+        )
+
+
+def expression_text(node: Optional[ast.AST]) -> Optional[str]:
+    """Spell an annotation or decorator compactly, like the source would.
+
+    Names, attributes, constants, subscripts and unions are spelled out;
+    call arguments and other expressions are elided as "...".
+
+    Args:
+        node: Expression to spell
+
+    Returns:
+        Text of the expression, or None if there is none
+    """
+    if node is None:
+        return None
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return f"{expression_text(node.value)}.{node.attr}"
+    if isinstance(node, ast.Constant):
+        return "..." if node.value is Ellipsis else repr(node.value)
+    if isinstance(node, ast.Subscript):
+        inner: ast.AST = node.slice
+        if isinstance(inner, ast.Index):  # Python < 3.9
+            inner = inner.value
+        return f"{expression_text(node.value)}[{expression_text(inner)}]"
+    if isinstance(node, (ast.Tuple, ast.List)):
+        items = ", ".join(expression_text(item) or "..." for item in node.elts)
+        return f"[{items}]" if isinstance(node, ast.List) else items
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return f"{expression_text(node.left)} | {expression_text(node.right)}"
+    if isinstance(node, ast.Call):
+        return f"{expression_text(node.func)}(...)"
+    return "..."
+
+
+def _arguments(arguments: ast.arguments) -> Tuple[ArgumentFacts, ...]:
+    """List the parameters of a function in declaration order."""
+    found = [
+        ArgumentFacts(arg.arg, expression_text(arg.annotation), "posonly")
+        for arg in getattr(arguments, "posonlyargs", [])
+    ]
+    found.extend(
+        ArgumentFacts(arg.arg, expression_text(arg.annotation), "positional")
+        for arg in arguments.args
+    )
+    if arguments.vararg is not None:
+        vararg = arguments.vararg
+        found.append(
+            ArgumentFacts(vararg.arg, expression_text(vararg.annotation), "vararg")
+        )
+    found.extend(
+        ArgumentFacts(arg.arg, expression_text(arg.annotation), "kwonly")
+        for arg in arguments.kwonlyargs
+    )
+    if arguments.kwarg is not None:
+        kwarg = arguments.kwarg
+        found.append(
+            ArgumentFacts(kwarg.arg, expression_text(kwarg.annotation), "kwarg")
+        )
+    return tuple(found)
+
+
+def decision_points(node: ast.AST) -> int:
+    """Return the number of decision points a single node adds."""
+    if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor)):
+        return 1
+    if isinstance(node, ast.BoolOp):
+        # Each 'and' or 'or' adds a branch
+        return len(node.values) - 1
+    if isinstance(node, (ast.ExceptHandler, ast.Assert, ast.comprehension)):
+        return 1
+    return 0
+
+
+def _returns_attribute(node: FunctionNode) -> bool:
+    """Check whether a function only returns a name or an attribute."""
+    if len(node.body) != 1:
+        return False
+    statement = node.body[0]
+    return isinstance(statement, ast.Return) and isinstance(
+        statement.value, (ast.Attribute, ast.Name)
+    )
+
+
+def extract_functions(tree: ast.AST) -> List[FunctionFacts]:
+    """Record the facts of every function in a tree with a single walk.
+
+    The walk is iterative and post-order, keeping one complexity counter
+    per open function, so the decision points of a nested function count
+    towards that function only.
+
+    Args:
+        tree: Tree to analyze, e.g. a parsed module
+
+    Returns:
+        Facts of each function, in source order
+    """
+    found: List[FunctionFacts] = []
+    counters: List[int] = []
+    # Names of the enclosing classes and functions, and whether each is a class
+    scopes: List[Tuple[str, bool]] = []
+    stack: List[Tuple[ast.AST, bool]] = [(tree, False)]
+    while stack:
+        node, leaving = stack.pop()
+        if leaving:
+            scopes.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                found.append(_facts(node, scopes, counters.pop()))
+            continue
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            counters.append(1)  # Base complexity
+            scopes.append((node.name, False))
+            stack.append((node, True))
+        else:
+            if isinstance(node, ast.ClassDef):
+                scopes.append((node.name, True))
+                stack.append((node, True))
+            if counters:
+                counters[-1] += decision_points(node)
+        children = list(ast.iter_child_nodes(node))
+        stack.extend((child, False) for child in reversed(children))
+
+    found.sort(key=lambda facts: (facts.line, facts.column))
+    return found
+
+
+def _facts(
+    node: FunctionNode, scopes: List[Tuple[str, bool]], complexity: int
+) -> FunctionFacts:
+    """Build the record of a function once its subtree has been walked."""
+    parts = []
+    for name, is_class in scopes:
+        parts.append(name)
+        if not is_class:
+            parts.append("<locals>")
+    parts.append(node.name)
+    return FunctionFacts(
+        name=node.name,
+        qualname=".".join(parts),
+        line=node.lineno,
+        column=node.col_offset,
+        end_line=getattr(node, "end_lineno", None),
+        is_async=isinstance(node, ast.AsyncFunctionDef),
+        is_method=bool(scopes) and scopes[-1][1],
+        is_nested=any(not is_class for _, is_class in scopes),
+        args=_arguments(node.args),
+        returns=expression_text(node.returns),
+        docstring=ast.get_docstring(node),
+        decorators=tuple(
+            expression_text(decorator) or "..." for decorator in node.decorator_list
+        ),
+        complexity=complexity,
+        returns_attribute=_returns_attribute(node),
+    )
+
+
+class FunctionFactsCache:
+    """Lazily extracted function facts of the file currently being checked."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        # Tree and facts are replaced together, as in ScopeAnalysisCache
+        self._entry: Optional[Tuple[ast.AST, List[FunctionFacts]]] = None
+        self.builds = 0
+
+    def get(self, tree: ast.AST) -> List[FunctionFacts]:
+        """Return the function facts of a tree, extracting them on first use.
+
+        Args:
+            tree: Parsed file, the same object every checker receives
+
+        Returns:
+            Facts of each function, in source order
+        """
+        entry = self._entry
+        if entry is not None and entry[0] is tree:
+            return entry[1]
+        functions = extract_functions(tree)
+        self._entry = (tree, functions)
+        self.builds += 1
+        return functions
+
+    def peek(self, tree: ast.AST) -> Optional[List[FunctionFacts]]:
+        """Return the facts of a tree if some checker asked for them."""
+        entry = self._entry
+        return entry[1] if entry is not None and entry[0] is tree else None
+
+    def seed(self, tree: ast.AST, functions: List[FunctionFacts]) -> None:
+        """Provide facts restored from the result cache for a tree."""
+        self._entry = (tree, functions)
+
+    def clear(self) -> None:
+        """Drop the cached facts, e.g. once a file has been checked."""
+        self._entry = None
+
+
+# Shared instance, cleared by the engine after each file
+function_facts = FunctionFactsCache()
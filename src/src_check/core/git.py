@@ -0,0 +1,147 @@
+"""Git helpers for analyzing staged content in pre-commit hooks."""
+
+import logging
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+class GitError(Exception):
+    """Raised when a git command fails."""
+
+    pass
+
+
+def _run_git(args: List[str], cwd: Path, input_data: Optional[bytes] = None) -> bytes:
+    """Run a git command and return its standard output.
+
+    Args:
+        args: Arguments after ``git``
+        cwd: Directory to run the command in
+        input_data: Optional bytes written to the command's standard input
+
+    Returns:
+        Raw standard output
+
+    Raises:
+        GitError: If git is missing or the command fails
+    """
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=str(cwd),
+            input=input_data,
+            capture_output=True,
+            check=False,
+        )
+    except OSError as e:
+        raise GitError(f"Could not run git: {e}") from e
+
+    if completed.returncode != 0:
+        message = completed.stderr.decode("utf-8", errors="replace").strip()
+        raise GitError(f"git {args[0]} failed: {message}")
+    return completed.stdout
+
+
+def read_file_list(stream: TextIO) -> List[str]:
+    """Read file paths from a stream.
+
+    Paths may be separated by newlines or NUL characters, so both
+    ``git diff --name-only`` and ``git diff --name-only -z`` can be piped in.
+
+    Args:
+        stream: Text stream to read from
+
+    Returns:
+        List of non-empty paths in input order
+    """
+    data = stream.read()
+    separator = "\0" if "\0" in data else "\n"
+    return [line.strip("\r") for line in data.split(separator) if line.strip()]
+
+
+def repository_root(cwd: Path) -> Path:
+    """Return the top-level directory of the repository containing cwd."""
+    output = _run_git(["rev-parse", "--show-toplevel"], cwd)
+    return Path(output.decode("utf-8").strip())
+
+
+def staged_files(cwd: Path) -> List[Path]:
+    """List files added, copied, modified or renamed in the index.
+
+    Args:
+        cwd: Directory inside the repository
+
+    Returns:
+        Staged paths, relative to cwd
+    """
+    root = repository_root(cwd)
+    output = _run_git(
+        ["diff", "--cached", "--name-only", "--diff-filter=ACMR", "-z"], root
+    )
+    return [
+        Path(os.path.relpath(root / name, cwd.resolve()))
+        for name in output.decode("utf-8").split("\0")
+        if name
+    ]
+
+
+def read_staged_blobs(paths: List[Path], cwd: Path) -> Dict[Path, str]:
+    """Read the staged content of files with one ``git cat-file --batch`` call.
+
+    Args:
+        paths: File paths, absolute or relative to cwd
+        cwd: Directory inside the repository
+
+    Returns:
+        Mapping of the given paths to their staged source. Paths that are
+        not in the index, not blobs or not valid UTF-8 are left out.
+    """
+    if not paths:
+        return {}
+
+    root = repository_root(cwd).resolve()
+    requested: List[Path] = []
+    names: List[str] = []
+    for path in paths:
+        absolute = path if path.is_absolute() else cwd / path
+        relative = os.path.relpath(os.path.realpath(absolute), root)
+        if relative.startswith(os.pardir) or "\n" in relative:
+            logger.warning(f"Not in the repository: {path}")
+            continue
+        requested.append(path)
+        names.append(":" + Path(relative).as_posix())
+
+    if not names:
+        return {}
+
+    output = _run_git(
+        ["cat-file", "--batch"], root, ("\n".join(names) + "\n").encode("utf-8")
+    )
+
+    blobs: Dict[Path, str] = {}
+    offset = 0
+    for path in requested:
+        header_end = output.index(b"\n", offset)
+        header = output[offset:header_end].decode("utf-8", errors="replace").split()
+        offset = header_end + 1
+        if len(header) != 3 or not header[2].isdigit():
+            # "<object> missing" or "<object> ambiguous"
+            logger.warning(f"Not staged: {path}")
+            continue
+
+        size = int(header[2])
+        content = output[offset : offset + size]
+        offset += size + 1  # Content is followed by a newline
+        if header[1] != "blob":
+            continue
+
+        try:
+            blobs[path] = content.decode("utf-8")
+        except UnicodeDecodeError as e:
+            logger.error(f"Error decoding staged {path}: {e}")
+
+    return blobs
@@ -0,0 +1,103 @@
+"""
+Graph algorithms over module import graphs.
+
+Graphs are plain mappings from a node to the nodes it points to. Nodes that
+only appear as targets are allowed. Everything is iterative, so graphs with
+very long import chains do not hit the recursion limit.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+Graph = Mapping[str, Iterable[str]]
+
+
+def strongly_connected_components(graph: Graph) -> List[List[str]]:
+    """Find the strongly connected components of a graph with Tarjan's algorithm.
+
+    Runs in O(V + E) after sorting each node's successors, which makes the
+    result independent of set iteration order.
+
+    Args:
+        graph: Mapping from each node to its successors
+
+    Returns:
+        Components in reverse topological order, each listed from the node
+        through which it was first entered
+    """
+    successors: Dict[str, List[str]] = {
+        node: sorted(targets) for node, targets in graph.items()
+    }
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    def enter(node: str) -> Tuple[str, Iterator[str]]:
+        index[node] = lowlink[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        return node, iter(successors.get(node, ()))
+
+    for root in sorted(successors):
+        if root in index:
+            continue
+        work = [enter(root)]
+        while work:
+            node, targets = work[-1]
+            for target in targets:
+                if target not in index:
+                    work.append(enter(target))
+                    break
+                if target in on_stack:
+                    lowlink[node] = min(lowlink[node], index[target])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component[::-1])
+    return components
+
+
+def is_cyclic(component: List[str], graph: Graph) -> bool:
+    """Check whether a component contains a cycle (or a self-import)."""
+    return len(component) > 1 or component[0] in graph.get(component[0], ())
+
+
+def shortest_cycle(start: str, members: Set[str], graph: Graph) -> List[str]:
+    """Find a shortest cycle through a node, staying inside a component.
+
+    Args:
+        start: Node the cycle starts and ends at
+        members: Nodes of the strongly connected component of ``start``
+        graph: Mapping from each node to its successors
+
+    Returns:
+        The cycle as a path beginning and ending with ``start``
+    """
+    previous: Dict[str, Optional[str]] = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for target in sorted(graph.get(node, ())):
+            if target == start:
+                path = [node]
+                step = previous[node]
+                while step is not None:
+                    path.append(step)
+                    step = previous[step]
+                return [*reversed(path), start]
+            if target in members and target not in previous:
+                previous[target] = node
+                queue.append(target)
+    return [start]
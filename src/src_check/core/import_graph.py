@@ -0,0 +1,233 @@
+"""
+Project-wide import graph shared by the checkers.
+
+The engine records the project modules every discovered file imports.
+Fan-in and fan-out are maintained on every update. Reachability is kept as
+one bitmask per module (a bit per label, e.g. per architecture layer). When
+a few files change, only their importers are recomputed.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+
+@dataclass(frozen=True)
+class ModuleMetrics:
+    """Coupling metrics of one module."""
+
+    fan_in: int
+    fan_out: int
+
+    @property
+    def instability(self) -> float:
+        """Fan-out over total coupling: 0 is maximally stable, 1 unstable."""
+        total = self.fan_in + self.fan_out
+        return self.fan_out / total if total else 0.0
+
+
+class ImportGraph:
+    """Directed graph of imports between the modules of a project."""
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self.successors: Dict[str, Set[str]] = {}
+        self.predecessors: Dict[str, Set[str]] = {}
+        self.files: Dict[str, str] = {}
+        # One tracker per labelling, living as long as the graph, so that
+        # checker instances recreated for every run reuse the masks
+        self._trackers: Dict[Callable[[str], int], LabelReachability] = {}
+
+    def __contains__(self, module: object) -> bool:
+        return module in self.files
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def modules(self) -> List[str]:
+        """Return the modules with a recorded file, sorted by name."""
+        return sorted(self.files)
+
+    def set_imports(self, module: str, file_path: str, targets: Iterable[str]) -> bool:
+        """Record the project modules a module imports.
+
+        Args:
+            module: Dotted name of the importing module
+            file_path: File defining the module
+            targets: Dotted names of the imported project modules
+
+        Returns:
+            True if the module's imports changed
+        """
+        self.files[module] = file_path
+        self.predecessors.setdefault(module, set())
+        new = set(targets) - {module}
+        old = self.successors.get(module, set())
+        if module in self.successors and new == old:
+            return False
+
+        for target in old - new:
+            self.predecessors[target].discard(module)
+        for target in new - old:
+            self.predecessors.setdefault(target, set()).add(module)
+        self.successors[module] = new
+        self._notify([module])
+        return True
+
+    def retain(self, modules: Iterable[str]) -> None:
+        """Drop every module not listed, e.g. files deleted since the last run.
+
+        Args:
+            modules: Modules to keep
+        """
+        keep = set(modules)
+        removed = [module for module in self.files if module not in keep]
+        if not removed:
+            return
+
+        changed: Set[str] = set()
+        for module in removed:
+            for target in self.successors.pop(module, set()):
+                self.predecessors.get(target, set()).discard(module)
+            changed.update(self.predecessors.get(module, ()))
+            del self.files[module]
+        for module in removed:
+            if not self.predecessors.get(module):
+                self.predecessors.pop(module, None)
+        self._notify(sorted(changed - set(removed)), removed)
+
+    def metrics(self, module: str) -> ModuleMetrics:
+        """Return the fan-in and fan-out of a module within the project."""
+        return ModuleMetrics(
+            fan_in=len(self.predecessors.get(module, ())),
+            fan_out=len(self.successors.get(module, ())),
+        )
+
+    def path(self, source: str, accept: Callable[[str], bool]) -> List[str]:
+        """Find a shortest import path to a module matching a predicate.
+
+        Args:
+            source: Module to start from
+            accept: Predicate for the module to reach (source excluded)
+
+        Returns:
+            The path from source to the first accepted module, or [] if none
+        """
+        previous: Dict[str, Optional[str]] = {source: None}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for target in sorted(self.successors.get(node, ())):
+                if target in previous:
+                    continue
+                previous[target] = node
+                if accept(target):
+                    path = [target]
+                    step = previous[target]
+                    while step is not None:
+                        path.append(step)
+                        step = previous[step]
+                    return path[::-1]
+                queue.append(target)
+        return []
+
+    def reachability(self, label: Callable[[str], int]) -> "LabelReachability":
+        """Return reachability masks for a labelling, kept up to date on change.
+
+        Args:
+            label: Bitmask of labels carried by a module itself; pass the
+                same function on every run to reuse its masks
+
+        Returns:
+            Reachability tracker observing this graph, shared by every caller
+            with the same label function
+        """
+        tracker = self._trackers.get(label)
+        if tracker is None:
+            tracker = self._trackers[label] = LabelReachability(self, label)
+        return tracker
+
+    def clear(self) -> None:
+        """Forget every module."""
+        self.retain(())
+
+    def _notify(self, changed: Iterable[str], removed: Iterable[str] = ()) -> None:
+        changed = list(changed)
+        removed = list(removed)
+        for tracker in self._trackers.values():
+            tracker.invalidate(changed, removed)
+
+
+class LabelReachability:
+    """Bitmask of the labels reachable from each module through its imports.
+
+    The mask of a module includes its own labels. Masks are recomputed
+    lazily, and only for modules that can reach a changed one.
+    """
+
+    def __init__(self, graph: ImportGraph, label: Callable[[str], int]):
+        """Initialize the tracker; prefer ImportGraph.reachability().
+
+        Args:
+            graph: Graph to follow
+            label: Bitmask of labels carried by a module itself
+        """
+        self.graph = graph
+        self.label = label
+        self._masks: Dict[str, int] = {}
+        self._own: Dict[str, int] = {}
+        self._dirty: Set[str] = set(graph.files)
+        self.recomputed = 0
+
+    def invalidate(self, changed: Iterable[str], removed: Iterable[str]) -> None:
+        """Mark modules whose imports changed, and forget removed ones."""
+        for module in removed:
+            self._masks.pop(module, None)
+            self._own.pop(module, None)
+            self._dirty.discard(module)
+        self._dirty.update(changed)
+
+    def mask(self, module: str) -> int:
+        """Return the labels reachable from a module, including its own."""
+        if self._dirty:
+            self._refresh()
+        mask = self._masks.get(module)
+        return mask if mask is not None else self._own_label(module)
+
+    def _own_label(self, module: str) -> int:
+        own = self._own.get(module)
+        if own is None:
+            own = self._own[module] = self.label(module)
+        return own
+
+    def _refresh(self) -> None:
+        """Recompute the masks of every module that reaches a dirty one."""
+        graph = self.graph
+        affected: Set[str] = set()
+        queue = deque(self._dirty)
+        while queue:
+            module = queue.popleft()
+            if module in affected:
+                continue
+            affected.add(module)
+            queue.extend(graph.predecessors.get(module, ()))
+        self._dirty.clear()
+
+        # Restart the affected modules from their own labels and propagate
+        # to a fixed point; masks only grow, so cycles terminate
+        for module in affected:
+            self._masks[module] = self._own_label(module)
+        worklist = deque(sorted(affected))
+        while worklist:
+            module = worklist.popleft()
+            mask = self._masks[module]
+            for target in graph.successors.get(module, ()):
+                mask |= self._masks.get(target, self._own_label(target))
+            if mask != self._masks[module]:
+                self._masks[module] = mask
+                worklist.extend(graph.predecessors.get(module, ()))
+        self.recomputed += len(affected)
+
+
+# Shared instance, updated by the engine for checkers with a project phase
+import_graph = ImportGraph()
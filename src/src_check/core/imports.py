@@ -0,0 +1,70 @@
+"""
+Fast import scanner for checkers that only look at import statements.
+
+Parsing a whole file just to read its imports is wasteful, and a single
+syntax error anywhere in the file would hide them all. The scanner picks
+out the lines that start an ``import``/``from`` statement and parses only
+those, so it also works on files that do not parse as a whole.
+"""
+
+import ast
+import re
+from typing import List
+
+IMPORT_START = re.compile(r"^[ \t]*(?:import|from)[ \t\\]")
+TRIPLE_QUOTE = re.compile(r"\"\"\"|'''")
+
+
+def _statement_lines(lines: List[str], start: int) -> int:
+    """Return the index after the last physical line of a statement."""
+    end = start
+    depth = 0
+    while end < len(lines):
+        code = lines[end].split("#", 1)[0]
+        depth += code.count("(") - code.count(")")
+        end += 1
+        if depth <= 0 and not code.rstrip().endswith("\\"):
+            break
+    return end
+
+
+def scan_imports(source: str) -> ast.Module:
+    """Collect the import statements of a source file.
+
+    Import lines inside triple-quoted strings are skipped by tracking an
+    approximate string state; statements that do not parse on their own
+    are ignored.
+
+    Args:
+        source: Source code to scan
+
+    Returns:
+        Module holding the file's ``Import`` and ``ImportFrom`` nodes with
+        their original line numbers and column offsets
+    """
+    lines = source.splitlines()
+    body: List[ast.stmt] = []
+    in_string = False
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if not in_string and IMPORT_START.match(line):
+            end = _statement_lines(lines, index)
+            statement = "\n".join(lines[index:end])
+            indent = len(line) - len(line.lstrip())
+            try:
+                tree = ast.parse(statement[indent:])
+            except SyntaxError:
+                index += 1
+                continue
+            for node in tree.body:
+                if isinstance(node, (ast.Import, ast.ImportFrom)):
+                    ast.increment_lineno(node, index)
+                    node.col_offset += indent
+                    body.append(node)
+            index = end
+            continue
+        if len(TRIPLE_QUOTE.findall(line)) % 2:
+            in_string = not in_string
+        index += 1
+    return ast.Module(body=body, type_ignores=[])
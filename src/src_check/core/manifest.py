@@ -0,0 +1,305 @@
+"""
+Checker manifest for lazy plugin loading.
+
+A manifest maps checker class names to the module defining them, together
+with the checker's name, category and version, so that the registry can
+import only the checkers a run actually uses. The manifest for the built-in
+rules ships as ``src_check/rules/manifest.json`` and is regenerated with
+``python -m src_check.core.manifest`` before a release. When it is missing
+or out of date, the manifest is rebuilt once and cached per user.
+
+Third-party checkers are registered under the ``src_check.checkers``
+entry-point group, e.g. ``todo = my_plugins.todo:TodoChecker``. Their index
+is cached per environment and rebuilt only when the ``site-packages`` state
+changes.
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pkgutil
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src_check import __version__
+from src_check.core.base import BaseChecker
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "manifest.json"
+ENTRY_POINT_GROUP = "src_check.checkers"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Description of a checker that can be imported on demand."""
+
+    name: str
+    module: str
+    checker_name: str
+    category: str
+    version: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ManifestEntry":
+        """Create a ManifestEntry from a dictionary produced by asdict."""
+        return cls(
+            name=data["name"],
+            module=data["module"],
+            checker_name=data.get("checker_name", data["name"]),
+            category=data.get("category", "general"),
+            version=data.get("version", ""),
+        )
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user directory for cached src-check metadata."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "src-check"
+
+
+def package_modules(package_name: str) -> List[str]:
+    """List the plain modules of a package without importing them."""
+    package = importlib.import_module(package_name)
+    return sorted(
+        modname
+        for _importer, modname, ispkg in pkgutil.iter_modules(package.__path__)
+        if not ispkg and modname != "__main__"
+    )
+
+
+def find_checker_classes(module: Any) -> List[type]:
+    """Find the BaseChecker subclasses defined in a module."""
+    classes = []
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if (
+            isinstance(attr, type)
+            and issubclass(attr, BaseChecker)
+            and attr is not BaseChecker
+        ):
+            classes.append(attr)
+    return classes
+
+
+def build_manifest(package_name: str) -> Dict[str, Any]:
+    """Import every module of a package and describe its checkers.
+
+    Args:
+        package_name: Package containing checker modules
+
+    Returns:
+        JSON-serializable manifest
+    """
+    entries = []
+    modules = package_modules(package_name)
+    for modname in modules:
+        module_name = f"{package_name}.{modname}"
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            logger.error(f"Error importing module {module_name}: {e}")
+            continue
+
+        for checker_class in find_checker_classes(module):
+            if checker_class.__module__ != module_name:
+                continue  # Imported from elsewhere; listed under its own module
+            checker = checker_class()
+            entry = ManifestEntry(
+                name=checker_class.__name__,
+                module=module_name,
+                checker_name=checker.name,
+                category=checker.category,
+                version=__version__,
+            )
+            entries.append(asdict(entry))
+
+    return {
+        "version": __version__,
+        "package": package_name,
+        "modules": modules,
+        "checkers": entries,
+    }
+
+
+def _read_manifest(path: Path, package_name: str) -> Optional[Dict[str, Any]]:
+    """Read a manifest, returning None if it is missing or out of date."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest: Dict[str, Any] = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        manifest.get("version") != __version__
+        or manifest.get("package") != package_name
+        or manifest.get("modules") != package_modules(package_name)
+    ):
+        logger.debug(f"Ignoring stale checker manifest {path}")
+        return None
+    return manifest
+
+
+def write_manifest(manifest: Dict[str, Any], path: Path) -> None:
+    """Write a manifest atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_name, path)
+    except OSError:
+        os.unlink(tmp_name)
+        raise
+
+
+def prebuilt_manifest_path(package_name: str) -> Path:
+    """Return where the manifest shipped with a package lives."""
+    package = importlib.import_module(package_name)
+    return Path(next(iter(package.__path__))) / MANIFEST_FILE_NAME
+
+
+def load_manifest(
+    package_name: str, cache_dir: Optional[Path] = None
+) -> List[ManifestEntry]:
+    """Load the checker manifest of a package.
+
+    The manifest shipped with the package is used when it is current.
+    Otherwise a cached manifest is used, or the package is scanned once and
+    the result cached.
+
+    Args:
+        package_name: Package containing checker modules
+        cache_dir: Directory for the cached manifest, defaults to the user cache
+
+    Returns:
+        Entries for every checker in the package
+    """
+    manifest = _read_manifest(prebuilt_manifest_path(package_name), package_name)
+
+    if manifest is None:
+        cache_path = (cache_dir or default_cache_dir()) / (
+            f"manifest-{package_name}.json"
+        )
+        manifest = _read_manifest(cache_path, package_name)
+        if manifest is None:
+            manifest = build_manifest(package_name)
+            try:
+                write_manifest(manifest, cache_path)
+            except OSError as e:
+                logger.debug(f"Could not cache checker manifest: {e}")
+
+    return [ManifestEntry.from_dict(entry) for entry in manifest["checkers"]]
+
+
+def environment_fingerprint() -> str:
+    """Fingerprint the installed distributions of the running environment.
+
+    Installing, upgrading or removing a distribution adds or removes
+    ``*.dist-info`` entries, which changes the modification time of the
+    directory on ``sys.path`` holding them.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{sys.prefix}\0{sys.version}\0{__version__}".encode())
+    cwd = os.getcwd()
+    for entry in sys.path:
+        if not entry or entry == cwd:
+            continue  # The working directory changes all the time
+        try:
+            mtime = os.stat(entry).st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"\0{entry}\0{mtime}".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def scan_entry_points() -> List[ManifestEntry]:
+    """Describe the checkers registered under the entry-point group.
+
+    Every installed distribution's metadata is read, and each advertised
+    checker is imported once to record its name and category.
+    """
+    from importlib.metadata import distributions
+
+    entries: List[ManifestEntry] = []
+    seen = set()
+    for dist in distributions():
+        for entry_point in dist.entry_points:
+            if entry_point.group != ENTRY_POINT_GROUP:
+                continue
+            if entry_point.value in seen:
+                continue  # Same distribution found twice on sys.path
+            seen.add(entry_point.value)
+            try:
+                checker_class = entry_point.load()
+                checker = checker_class()
+            except Exception as e:
+                logger.error(f"Error loading checker entry point {entry_point}: {e}")
+                continue
+            if not isinstance(checker, BaseChecker):
+                logger.warning(f"Entry point {entry_point.name} is not a checker")
+                continue
+            entries.append(
+                ManifestEntry(
+                    name=checker_class.__name__,
+                    module=checker_class.__module__,
+                    checker_name=checker.name,
+                    category=checker.category,
+                    version=dist.metadata["Version"] or "",
+                )
+            )
+    return entries
+
+
+def load_entry_point_index(cache_dir: Optional[Path] = None) -> List[ManifestEntry]:
+    """Load the cached entry-point index, rebuilding it if the environment changed.
+
+    Args:
+        cache_dir: Directory for the index, defaults to the user cache
+
+    Returns:
+        Entries for every third-party checker
+    """
+    fingerprint = environment_fingerprint()
+    environment = hashlib.sha256(sys.prefix.encode("utf-8")).hexdigest()[:16]
+    path = (cache_dir or default_cache_dir()) / f"entry-points-{environment}.json"
+    try:
+        with open(path, encoding="utf-8") as f:
+            index: Dict[str, Any] = json.load(f)
+        if index.get("fingerprint") == fingerprint:
+            return [ManifestEntry.from_dict(entry) for entry in index["checkers"]]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    entries = scan_entry_points()
+    index = {
+        "fingerprint": fingerprint,
+        "checkers": [asdict(entry) for entry in entries],
+    }
+    try:
+        write_manifest(index, path)
+    except OSError as e:
+        logger.debug(f"Could not cache entry-point index: {e}")
+    return entries
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Regenerate the manifest shipped with a checker package."""
+    args = sys.argv[1:] if argv is None else argv
+    package_name = args[0] if args else "src_check.rules"
+    path = prebuilt_manifest_path(package_name)
+    manifest = build_manifest(package_name)
+    write_manifest(manifest, path)
+    print(f"✅ Wrote {len(manifest['checkers'])} checkers to {path}")
+
+
+if __name__ == "__main__":
+    main()
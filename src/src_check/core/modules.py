@@ -0,0 +1,196 @@
+"""
+Project module index and standard-library module names.
+
+Classifying an import as local, standard library or third party used to
+mean probing the filesystem from every importing file upwards. The engine
+now records the dotted name of every discovered file once per run, so the
+classification becomes a set lookup.
+"""
+
+import ast
+import os
+import pkgutil
+import sys
+import sysconfig
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Union
+
+
+@lru_cache(maxsize=None)
+def stdlib_module_names() -> FrozenSet[str]:
+    """Return the top-level module names of the standard library.
+
+    ``sys.stdlib_module_names`` is used where available (Python 3.10+).
+    Older interpreters list the standard library directory instead.
+    """
+    names = getattr(sys, "stdlib_module_names", None)
+    if names is not None:
+        return frozenset(names)
+
+    stdlib = sysconfig.get_paths()["stdlib"]
+    directories = [stdlib, os.path.join(stdlib, "lib-dynload")]
+    found = {module.name for module in pkgutil.iter_modules(directories)}
+    found.update(sys.builtin_module_names)
+    found.discard("__main__")
+    return frozenset(found)
+
+
+class ModuleIndex:
+    """Map from dotted module names to the project files defining them."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.modules: Dict[str, Path] = {}
+        self.top_level: Set[str] = set()
+        self._names: Dict[Path, str] = {}
+        self._is_package: Dict[Path, bool] = {}
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+    def clear(self) -> None:
+        """Forget everything, e.g. at the start of a new run."""
+        self.modules.clear()
+        self.top_level.clear()
+        self._names.clear()
+        self._is_package.clear()
+
+    def record_listing(self, directory: Path, names: Iterable[str]) -> None:
+        """Record whether a listed directory is a regular package.
+
+        Args:
+            directory: Directory that was listed
+            names: Names of its entries
+        """
+        self._is_package[directory] = "__init__.py" in names
+
+    def _package(self, directory: Path) -> bool:
+        is_package = self._is_package.get(directory)
+        if is_package is None:
+            is_package = (directory / "__init__.py").exists()
+            self._is_package[directory] = is_package
+        return is_package
+
+    def add_file(self, file_path: Path) -> str:
+        """Add a source file under the dotted name it is imported as.
+
+        The name is taken relative to the nearest ancestor directory that
+        is not a package, i.e. the directory that would be on ``sys.path``.
+
+        Args:
+            file_path: Path of a Python source file
+
+        Returns:
+            Dotted module name of the file
+        """
+        parts: List[str] = [] if file_path.stem == "__init__" else [file_path.stem]
+        directory = file_path.parent
+        while self._package(directory) and directory.parent != directory:
+            parts.append(directory.name)
+            directory = directory.parent
+        name = ".".join(reversed(parts))
+
+        if name:
+            self.modules.setdefault(name, file_path)
+            self.top_level.add(name.split(".")[0])
+        self._names[file_path] = name
+        return name
+
+    def module_name(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Return the dotted name of an indexed file, or None."""
+        return self._names.get(Path(file_path))
+
+    def covers(self, file_path: Union[str, Path]) -> bool:
+        """Check whether a file was indexed in this run."""
+        return Path(file_path) in self._names
+
+    def is_local(self, module_name: str) -> bool:
+        """Check whether a module, or its top-level package, is in the project."""
+        return module_name in self.modules or (
+            module_name.split(".")[0] in self.top_level
+        )
+
+    def resolve(self, module_name: str) -> Optional[str]:
+        """Return the longest indexed prefix of a dotted module name.
+
+        ``from pkg.mod import name`` imports ``pkg.mod``, but the dotted
+        path of ``import pkg.mod.name`` may also end in an attribute.
+
+        Args:
+            module_name: Dotted name as written in an import
+
+        Returns:
+            The indexed module it refers to, or None if it is not local
+        """
+        parts = module_name.split(".")
+        while parts:
+            candidate = ".".join(parts)
+            if candidate in self.modules:
+                return candidate
+            parts.pop()
+        return None
+
+
+# Shared instance, rebuilt by the engine at the start of each directory run
+module_index = ModuleIndex()
+
+
+def _from_import_targets(
+    node: ast.ImportFrom, module: str, is_package: bool, index: ModuleIndex
+) -> List[str]:
+    """List the dotted names a from-import refers to.
+
+    ``from pkg import name`` refers to ``pkg.name`` if that is a project
+    submodule and to ``pkg`` otherwise. Relative imports are resolved
+    against the importing module.
+    """
+    base = node.module or ""
+    if node.level:
+        package = module.split(".")
+        if not is_package:
+            package = package[:-1]
+        if node.level > 1:
+            package = package[: len(package) - node.level + 1]
+        base = ".".join(part for part in [*package, base] if part)
+    if not base:
+        return []
+    return [
+        f"{base}.{alias.name}" if f"{base}.{alias.name}" in index.modules else base
+        for alias in node.names
+    ]
+
+
+def local_imports(
+    tree: ast.AST, file_path: Path, index: Optional[ModuleIndex] = None
+) -> Set[str]:
+    """Resolve the imports of an indexed file to the project modules they load.
+
+    Args:
+        tree: Parsed file, or a module holding just its import statements
+        file_path: Path of the file, which must be in the index
+        index: Module index to resolve against, defaults to the shared one
+
+    Returns:
+        Dotted names of the project modules imported, without the file itself
+    """
+    if index is None:
+        index = module_index
+    module = index.module_name(file_path)
+    if module is None:
+        return set()
+
+    is_package = Path(file_path).stem == "__init__"
+    names: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            names.extend(_from_import_targets(node, module, is_package, index))
+
+    targets = set()
+    for name in names:
+        target = index.resolve(name)
+        if target is not None and target != module:
+            targets.add(target)
+    return targets
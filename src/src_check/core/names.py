@@ -0,0 +1,99 @@
+"""
+Qualified names of the expressions a file calls.
+
+Checkers match calls such as ``os.system`` or ``pickle.loads`` against
+known names. The resolver rewrites a dotted name through the file's import
+aliases, so ``import os as o; o.system()`` and ``from os import system;
+system()`` both resolve to ``os.system``. Names are memoized per node, and
+an attribute chain reuses the name of its prefix.
+"""
+
+import ast
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from src_check.core.scopes import ImportBinding
+
+
+def import_aliases(bindings: Iterable["ImportBinding"]) -> Dict[str, str]:
+    """Map names bound by imports to the qualified names they stand for.
+
+    Args:
+        bindings: Imports of a file, in source order
+
+    Returns:
+        Mapping from the local name to the module or object it refers to
+    """
+    aliases: Dict[str, str] = {}
+    for binding in bindings:
+        node = binding.node
+        if isinstance(node, ast.ImportFrom):
+            renamed = not node.level  # Relative imports name project modules
+        else:
+            # "import os.path" binds "os" to the module os itself
+            renamed = any(alias.asname == binding.name for alias in node.names)
+        if renamed:
+            aliases[binding.name] = binding.qualified_name
+        else:
+            aliases.pop(binding.name, None)
+    return aliases
+
+
+class NameResolver:
+    """Resolve names and attribute chains to qualified names for one file."""
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        """Initialize the resolver.
+
+        Args:
+            aliases: Local names bound by imports and what they refer to
+        """
+        self.aliases = aliases or {}
+        self._dotted: Dict[ast.AST, Optional[str]] = {}
+        self._qualified: Dict[ast.AST, Optional[str]] = {}
+
+    def dotted(self, node: ast.AST) -> Optional[str]:
+        """Return the dotted name an expression spells, e.g. ``o.system``.
+
+        Args:
+            node: Expression to name, typically the function of a call
+
+        Returns:
+            The dotted name, or None unless node is a name or attribute chain
+        """
+        if node in self._dotted:
+            return self._dotted[node]
+        if isinstance(node, ast.Name):
+            name: Optional[str] = node.id
+        elif isinstance(node, ast.Attribute):
+            prefix = self.dotted(node.value)
+            name = f"{prefix}.{node.attr}" if prefix is not None else None
+        else:
+            name = None
+        self._dotted[node] = name
+        return name
+
+    def qualified(self, node: ast.AST) -> Optional[str]:
+        """Return the qualified name an expression refers to, e.g. ``os.system``.
+
+        The first part of the dotted name is replaced by what the import
+        binding it refers to. Names not bound by imports, such as builtins,
+        are returned as written.
+
+        Args:
+            node: Expression to name, typically the function of a call
+
+        Returns:
+            The qualified name, or None unless node is a name or attribute chain
+        """
+        if node in self._qualified:
+            return self._qualified[node]
+        if isinstance(node, ast.Name):
+            name: Optional[str] = self.aliases.get(node.id, node.id)
+        elif isinstance(node, ast.Attribute):
+            prefix = self.qualified(node.value)
+            name = f"{prefix}.{node.attr}" if prefix is not None else None
+        else:
+            name = None
+        self._qualified[node] = name
+        return name
@@ -0,0 +1,58 @@
+"""Cheap per-file profile used to skip checkers that cannot trigger."""
+
+import ast
+from collections import Counter
+from typing import TYPE_CHECKING, Optional, Type
+from typing import Counter as CounterType
+
+if TYPE_CHECKING:
+    from src_check.core.base import BaseChecker
+
+
+class FileProfile:
+    """Node-type histogram and literal lookup for one parsed file."""
+
+    def __init__(self, tree: ast.AST, source: str):
+        """Build the profile with a single walk over the tree.
+
+        Args:
+            tree: Parsed AST of the file
+            source: Source code of the file
+        """
+        self.node_types: CounterType[Type[ast.AST]] = Counter(
+            type(node) for node in ast.walk(tree)
+        )
+        self._source = source
+        self._lowered: Optional[str] = None
+
+    def has_token(self, token: str) -> bool:
+        """Check whether a literal occurs in the source, ignoring case.
+
+        This over-approximates: a token inside a comment or a longer
+        identifier also counts as present.
+        """
+        if self._lowered is None:
+            self._lowered = self._source.lower()
+        return token in self._lowered
+
+    def may_trigger(self, checker: "BaseChecker") -> bool:
+        """Check whether a checker's declared triggers occur in the file.
+
+        Args:
+            checker: Checker whose interest declarations are consulted
+
+        Returns:
+            False only if the checker provably has nothing to report
+        """
+        checker_class = type(checker)
+        nodes = getattr(checker_class, "interesting_nodes", None)
+        if isinstance(nodes, frozenset) and not any(
+            node_type in self.node_types for node_type in nodes
+        ):
+            return False
+
+        tokens = getattr(checker_class, "trigger_tokens", None)
+        return not (
+            isinstance(tokens, frozenset)
+            and not any(self.has_token(token) for token in tokens)
+        )
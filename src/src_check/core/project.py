@@ -0,0 +1,94 @@
+"""
+Project-root resolution shared by the checkers.
+
+Finding the project a file belongs to means walking up its parents and
+probing each one for marker files. ``ProjectRoots`` memoizes the answer per
+directory, and the engine seeds it from the directory listings it reads
+during discovery anyway, so most lookups never touch the filesystem.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+
+# Files or directories whose presence marks the root of a project
+ROOT_MARKERS: Tuple[str, ...] = (
+    "pyproject.toml",
+    "setup.py",
+    "requirements.txt",
+    ".git",
+)
+
+
+class ProjectRoots:
+    """Memoized directory-to-project-root map."""
+
+    def __init__(self, markers: Tuple[str, ...] = ROOT_MARKERS):
+        """Initialize an empty map.
+
+        Args:
+            markers: Names whose presence marks a project root
+        """
+        self.markers = markers
+        self._has_marker: Dict[Path, bool] = {}
+        self._roots: Dict[Path, Path] = {}
+
+    def clear(self) -> None:
+        """Forget everything, e.g. at the start of a new run."""
+        self._has_marker.clear()
+        self._roots.clear()
+
+    def record_listing(self, directory: Path, names: Iterable[str]) -> None:
+        """Record the entries of a directory that was listed anyway.
+
+        Args:
+            directory: Directory that was listed
+            names: Names of its entries
+        """
+        self._has_marker[directory] = not set(self.markers).isdisjoint(names)
+
+    def is_root(self, directory: Path) -> bool:
+        """Check whether a directory holds one of the root markers."""
+        has_marker = self._has_marker.get(directory)
+        if has_marker is None:
+            has_marker = any((directory / name).exists() for name in self.markers)
+            self._has_marker[directory] = has_marker
+        return has_marker
+
+    def root_of_dir(self, directory: Path) -> Path:
+        """Return the nearest directory at or above one that is a project root.
+
+        Args:
+            directory: Directory to start from
+
+        Returns:
+            The project root, or the top-most ancestor if there is none
+        """
+        visited: List[Path] = []
+        current = directory
+        while current not in self._roots:
+            visited.append(current)
+            if current.parent == current or self.is_root(current):
+                root = current
+                break
+            current = current.parent
+        else:
+            root = self._roots[current]
+
+        for path in visited:
+            self._roots[path] = root
+        return root
+
+    def root_of(self, file_path: Union[str, Path]) -> Path:
+        """Return the project root of a file.
+
+        Args:
+            file_path: Path to a file
+
+        Returns:
+            The project root, or the top-most ancestor if there is none
+        """
+        return self.root_of_dir(Path(file_path).parent)
+
+
+# Shared instance, reset by the engine at the start of each directory run
+project_roots = ProjectRoots()
@@ -0,0 +1,82 @@
+"""
+Project-wide index of the names test files refer to.
+
+Test files record the qualified names they import, call or otherwise load,
+e.g. ``pkg.mod.func`` for ``from pkg import mod; mod.func()``, and the
+attribute names they use, which stand in for methods called on instances.
+The counts of every file are kept together, so asking whether any test
+refers to a name is one dictionary lookup however large the project is.
+A file checked again replaces what it recorded before.
+"""
+
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+
+class ReferenceIndex:
+    """Names referenced by a set of files, counted across the files."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._files: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        self._names: Dict[str, int] = {}
+        self._attributes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of files in the index."""
+        return len(self._files)
+
+    def add_file(
+        self, file_path: str, names: Iterable[str], attributes: Iterable[str]
+    ) -> None:
+        """Record the names a file refers to, replacing its earlier record.
+
+        Args:
+            file_path: Path of the referring file
+            names: Qualified names the file imports or loads
+            attributes: Attribute names the file loads
+        """
+        self.remove_file(file_path)
+        entry = (frozenset(names), frozenset(attributes))
+        self._files[file_path] = entry
+        self._count(self._names, entry[0], 1)
+        self._count(self._attributes, entry[1], 1)
+
+    def file_names(
+        self, file_path: str
+    ) -> Optional[Tuple[FrozenSet[str], FrozenSet[str]]]:
+        """Return the names and attributes recorded for a file, if any."""
+        return self._files.get(file_path)
+
+    def remove_file(self, file_path: str) -> None:
+        """Forget what a file refers to."""
+        entry = self._files.pop(file_path, None)
+        if entry is not None:
+            self._count(self._names, entry[0], -1)
+            self._count(self._attributes, entry[1], -1)
+
+    def is_referenced(self, qualified_name: str) -> bool:
+        """Check whether any file refers to a qualified name, e.g. ``pkg.mod.func``."""
+        return qualified_name in self._names
+
+    def uses_attribute(self, name: str) -> bool:
+        """Check whether any file loads an attribute of the given name."""
+        return name in self._attributes
+
+    def clear(self) -> None:
+        """Forget every file."""
+        self._files.clear()
+        self._names.clear()
+        self._attributes.clear()
+
+    @staticmethod
+    def _count(counts: Dict[str, int], names: FrozenSet[str], delta: int) -> None:
+        for name in names:
+            count = counts.get(name, 0) + delta
+            if count:
+                counts[name] = count
+            else:
+                del counts[name]
+
+
+# Shared instance, fed by TestQualityChecker from the test files it checks
+test_references = ReferenceIndex()
@@ -3,9 +3,15 @@
 import importlib
 import logging
 import pkgutil
-from typing import Dict, List, Type
+from typing import Callable, Dict, List, Optional, Type
 
 from src_check.core.base import BaseChecker
+from src_check.core.manifest import (
+    ManifestEntry,
+    find_checker_classes,
+    load_entry_point_index,
+    load_manifest,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +23,8 @@ class PluginRegistry:
         """Initialize the plugin registry."""
         self._checkers: Dict[str, Type[BaseChecker]] = {}
         self._instances: Dict[str, BaseChecker] = {}
+        # Checkers known from a manifest whose modules are not imported yet
+        self._lazy: Dict[str, ManifestEntry] = {}
 
     def register(self, checker_class: Type[BaseChecker]) -> None:
         """Register a checker class.
@@ -25,10 +33,13 @@ class PluginRegistry:
             checker_class: The checker class to register
         """
         name = checker_class.__name__
+        if self._checkers.get(name) is checker_class:
+            return  # Already registered, e.g. by a repeated discovery
         if name in self._checkers:
             logger.warning(f"Checker {name} is already registered, overwriting")
 
         self._checkers[name] = checker_class
+        self._lazy.pop(name, None)
         logger.info(f"Registered checker: {name}")
 
     def get_checker(self, name: str) -> BaseChecker:
@@ -43,6 +54,8 @@ class PluginRegistry:
         Raises:
             KeyError: If checker is not registered
         """
+        if name in self._lazy:
+            self._load(name)
         if name not in self._checkers:
             raise KeyError(f"Checker '{name}' is not registered")
 
@@ -52,19 +65,90 @@ class PluginRegistry:
 
         return self._instances[name]
 
-    def get_all_checkers(self) -> List[BaseChecker]:
+    def get_all_checkers(
+        self, enabled: Optional[Callable[[str], bool]] = None
+    ) -> List[BaseChecker]:
         """Get instances of all registered checkers.
 
+        Args:
+            enabled: Optional predicate on checker names; checkers it rejects
+                are skipped without importing their modules
+
         Returns:
             List of checker instances
         """
         checkers = []
-        for name in self._checkers:
-            checkers.append(self.get_checker(name))
+        for name in self.list_checkers():
+            if enabled is not None and not enabled(name):
+                continue
+            try:
+                checkers.append(self.get_checker(name))
+            except KeyError as e:
+                logger.error(f"Error loading checker {name}: {e}")
         return checkers
 
-    def discover_plugins(self, package_name: str = "src_check.rules") -> None:
-        """Discover and register all checker plugins in a package.
+    def discover_plugins(
+        self, package_name: str = "src_check.rules", entry_points: bool = True
+    ) -> None:
+        """Discover all checker plugins in a package and installed distributions.
+
+        Checkers are listed from the package's manifest and imported only
+        when first requested. Without a usable manifest, every module in the
+        package is imported and scanned.
+
+        Args:
+            package_name: Name of the package to search for plugins
+            entry_points: Whether to also discover checkers registered under
+                the ``src_check.checkers`` entry-point group
+        """
+        try:
+            entries = load_manifest(package_name)
+        except Exception as e:
+            logger.warning(f"No checker manifest for {package_name}: {e}")
+            self._import_package(package_name)
+        else:
+            self._add_entries(entries)
+
+        if entry_points:
+            self.discover_entry_points()
+
+    def discover_entry_points(self) -> None:
+        """Discover third-party checkers from the cached entry-point index."""
+        try:
+            entries = load_entry_point_index()
+        except Exception as e:
+            logger.error(f"Error discovering checker entry points: {e}")
+            return
+        self._add_entries(entries)
+
+    def _add_entries(self, entries: List[ManifestEntry]) -> None:
+        """Remember manifest entries so that their checkers load on demand."""
+        for entry in entries:
+            known = self._checkers.get(entry.name)
+            if known is not None and known.__module__ == entry.module:
+                continue
+            if known is not None or entry.name in self._lazy:
+                if self._lazy.get(entry.name) != entry:
+                    logger.warning(
+                        f"Checker {entry.name} from {entry.module} conflicts "
+                        "with an already discovered checker, skipping"
+                    )
+                continue
+            self._lazy[entry.name] = entry
+
+    def _load(self, name: str) -> None:
+        """Import the module of a lazily discovered checker and register it."""
+        entry = self._lazy.pop(name)
+        try:
+            module = importlib.import_module(entry.module)
+            checker_class = getattr(module, entry.name)
+        except Exception as e:
+            logger.error(f"Error importing checker {name} from {entry.module}: {e}")
+            return
+        self.register(checker_class)
+
+    def _import_package(self, package_name: str) -> None:
+        """Import every module in a package and register its checkers.
 
         Args:
             package_name: Name of the package to search for plugins
@@ -90,19 +174,9 @@ class PluginRegistry:
                 try:
                     module = importlib.import_module(module_name)
 
-                    # Look for BaseChecker subclasses
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-
-                        # Check if it's a class and subclass of BaseChecker
-                        if (
-                            isinstance(attr, type)
-                            and issubclass(attr, BaseChecker)
-                            and attr is not BaseChecker
-                        ):
-
-                            # Register the checker
-                            self.register(attr)
+                    # Register the BaseChecker subclasses it defines
+                    for checker_class in find_checker_classes(module):
+                        self.register(checker_class)
 
                 except Exception as e:
                     logger.error(f"Error importing module {module_name}: {e}")
@@ -116,12 +190,22 @@ class PluginRegistry:
         Returns:
             List of checker names
         """
-        return list(self._checkers.keys())
+        return list(self._checkers) + [
+            name for name in self._lazy if name not in self._checkers
+        ]
+
+    def reset_instances(self) -> None:
+        """Drop cached checker instances so the next run starts from fresh state.
+
+        Registered classes are kept, so no plugin modules are imported again.
+        """
+        self._instances.clear()
 
     def clear(self) -> None:
         """Clear all registered checkers."""
         self._checkers.clear()
         self._instances.clear()
+        self._lazy.clear()
 
     def is_registered(self, name: str) -> bool:
         """Check if a checker is registered.
@@ -132,7 +216,7 @@ class PluginRegistry:
         Returns:
             True if registered, False otherwise
         """
-        return name in self._checkers
+        return name in self._checkers or name in self._lazy
 
 
 # Global registry instance
@@ -0,0 +1,296 @@
+"""
+Per-file scope and def-use analysis shared by the checkers.
+
+One walk over a parsed file records the names each scope binds and loads,
+the names each loop body rebinds or may modify in place, and the imports.
+Checkers query it instead of re-walking subtrees. The engine keeps the
+analysis of the file being checked and drops it when moving on.
+"""
+
+import ast
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from src_check.core.names import NameResolver, import_aliases
+
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+COMPREHENSION_NODES = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+LOOP_NODES = (ast.For, ast.AsyncFor, ast.While)
+
+
+@dataclass
+class Scope:
+    """Names bound and loaded directly in one scope."""
+
+    node: ast.AST
+    parent: Optional["Scope"]
+    assigned: Set[str] = field(default_factory=set)
+    loaded: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class LoopBody:
+    """Names a loop may change from one iteration to the next.
+
+    Covers the loop target, the body and, for while loops, the condition;
+    the iterable and the else clause run once. Nested functions and
+    comprehensions are separate scopes and do not count.
+    """
+
+    node: ast.AST
+    assigned: Set[str] = field(default_factory=set)
+    # Heuristic: bases of attribute and item stores, receivers of method
+    # calls and names deleted from
+    mutated: Set[str] = field(default_factory=set)
+
+    def modifies(self, name: str) -> bool:
+        """Check whether a name may hold a different value in a later iteration."""
+        return name in self.assigned or name in self.mutated
+
+
+@dataclass(frozen=True)
+class ImportBinding:
+    """A name bound by an import statement."""
+
+    name: str
+    node: Union[ast.Import, ast.ImportFrom]
+    qualified_name: str
+
+
+# A node to visit, with the scope and the loop bodies it belongs to
+Frame = Tuple[ast.AST, Scope, Tuple[LoopBody, ...]]
+
+# Nodes carrying nothing the analysis records
+LEAF_NODES = (
+    ast.expr_context,
+    ast.operator,
+    ast.boolop,
+    ast.cmpop,
+    ast.unaryop,
+    ast.Constant,
+)
+
+
+def _children(node: ast.AST) -> List[ast.AST]:
+    """List the child nodes of a node that may hold names, in field order."""
+    children: List[ast.AST] = []
+    for name in node._fields:
+        value = getattr(node, name, None)
+        if isinstance(value, list):
+            children.extend(
+                item
+                for item in value
+                if isinstance(item, ast.AST) and not isinstance(item, LEAF_NODES)
+            )
+        elif isinstance(value, ast.AST) and not isinstance(value, LEAF_NODES):
+            children.append(value)
+    return children
+
+
+def _root_name(node: ast.AST) -> Optional[str]:
+    """Return the name an attribute or subscript chain starts from."""
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        node = node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+class ScopeAnalysis:
+    """Scope and def-use facts of one parsed file."""
+
+    def __init__(self, tree: ast.AST):
+        """Analyze a tree with a single iterative walk.
+
+        Args:
+            tree: Parsed file, or any subtree to analyze on its own
+        """
+        self.scopes: Dict[ast.AST, Scope] = {}
+        self.loops: Dict[ast.AST, LoopBody] = {}
+        self.imports: List[ImportBinding] = []
+        # Every identifier used as a name, in any context
+        self.names: Set[str] = set()
+        self._resolver: Optional[NameResolver] = None
+
+        root = Scope(tree, None)
+        self.scopes[tree] = root
+        stack: List[Frame] = [(tree, root, ())]
+        names = self.names
+        while stack:
+            node, scope, loops = stack.pop()
+            if type(node) is ast.Name:
+                # Most nodes are names, so they take the short path
+                names.add(node.id)
+                if type(node.ctx) is ast.Load:
+                    scope.loaded.add(node.id)
+                else:
+                    self._bind(node.id, scope, loops)
+                continue
+            children = self._record(node, scope, loops)
+            stack.extend(reversed(children))
+
+    @property
+    def resolver(self) -> NameResolver:
+        """Return the file's qualified-name resolver, created on first use."""
+        if self._resolver is None:
+            self._resolver = NameResolver(import_aliases(self.imports))
+        return self._resolver
+
+    def scope(self, node: ast.AST) -> Optional[Scope]:
+        """Return the scope a module, function, class or comprehension opens."""
+        return self.scopes.get(node)
+
+    def loop(self, node: ast.AST) -> Optional[LoopBody]:
+        """Return the def-use facts of a for or while loop."""
+        return self.loops.get(node)
+
+    def _bind(self, name: str, scope: Scope, loops: Tuple[LoopBody, ...]) -> None:
+        scope.assigned.add(name)
+        for loop in loops:
+            loop.assigned.add(name)
+
+    def _mutate(self, name: Optional[str], loops: Tuple[LoopBody, ...]) -> None:
+        if name is not None:
+            for loop in loops:
+                loop.mutated.add(name)
+
+    def _record(
+        self, node: ast.AST, scope: Scope, loops: Tuple[LoopBody, ...]
+    ) -> List[Frame]:
+        """Record the facts of one node and return its children with context."""
+        inner = [(child, scope, loops) for child in _children(node)]
+
+        if isinstance(node, (ast.Attribute, ast.Subscript)):
+            if not isinstance(node.ctx, ast.Load):
+                self._mutate(_root_name(node.value), loops)
+        elif isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Attribute):
+                self._mutate(_root_name(node.func.value), loops)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            self._record_import(node, scope, loops)
+        elif isinstance(node, ast.ExceptHandler):
+            if node.name:
+                self._bind(node.name, scope, loops)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            for name in node.names:
+                self._bind(name, scope, loops)
+        elif isinstance(node, LOOP_NODES):
+            body = self.loops[node] = LoopBody(node)
+            once = (
+                {node.iter, *node.orelse}
+                if isinstance(node, (ast.For, ast.AsyncFor))
+                else set(node.orelse)
+            )
+            inner = [
+                (child, scope, loops if child in once else (*loops, body))
+                for child, _, _ in inner
+            ]
+        elif isinstance(node, (*FUNCTION_NODES, ast.ClassDef)):
+            inner = self._enter_definition(node, scope, loops)
+        elif isinstance(node, COMPREHENSION_NODES):
+            inner = self._enter_comprehension(node, scope, loops)
+        return inner
+
+    def _record_import(
+        self,
+        node: Union[ast.Import, ast.ImportFrom],
+        scope: Scope,
+        loops: Tuple[LoopBody, ...],
+    ) -> None:
+        for alias in node.names:
+            if alias.name == "*":
+                continue
+            if isinstance(node, ast.Import):
+                name = alias.asname or alias.name.split(".")[0]
+                qualified = alias.name
+            else:
+                name = alias.asname or alias.name
+                qualified = f"{node.module}.{alias.name}" if node.module else alias.name
+            self._bind(name, scope, loops)
+            self.imports.append(ImportBinding(name, node, qualified))
+
+    def _enter_definition(
+        self, node: ast.AST, scope: Scope, loops: Tuple[LoopBody, ...]
+    ) -> List[Frame]:
+        """Split a function or class into parts evaluated outside and inside it."""
+        inner_scope = self.scopes[node] = Scope(node, scope)
+        if not isinstance(node, ast.Lambda):
+            self._bind(node.name, scope, loops)  # type: ignore[attr-defined]
+
+        if isinstance(node, FUNCTION_NODES):
+            arguments = node.args
+            for arg in [
+                *getattr(arguments, "posonlyargs", []),
+                *arguments.args,
+                *arguments.kwonlyargs,
+                arguments.vararg,
+                arguments.kwarg,
+            ]:
+                if arg is not None:
+                    inner_scope.assigned.add(arg.arg)
+            outside = {*arguments.defaults, *arguments.kw_defaults}
+        else:
+            outside = {*node.bases, *node.keywords}  # type: ignore[attr-defined]
+        outside.update(getattr(node, "decorator_list", []))
+
+        children: List[Frame] = []
+        for child in _children(node):
+            # Defaults are evaluated where the function is defined
+            parts = _children(child) if isinstance(child, ast.arguments) else [child]
+            for part in parts:
+                if part in outside:
+                    children.append((part, scope, loops))
+                else:
+                    children.append((part, inner_scope, ()))
+        return children
+
+    def _enter_comprehension(
+        self, node: ast.AST, scope: Scope, loops: Tuple[LoopBody, ...]
+    ) -> List[Frame]:
+        """Give a comprehension its own scope; its first iterable is outside."""
+        inner_scope = self.scopes[node] = Scope(node, scope)
+        first_iter = node.generators[0].iter  # type: ignore[attr-defined]
+
+        children: List[Frame] = []
+        for child in _children(node):
+            if isinstance(child, ast.comprehension) and child.iter is first_iter:
+                children.append((child.target, inner_scope, ()))
+                children.append((child.iter, scope, loops))
+                children.extend((c, inner_scope, ()) for c in child.ifs)
+            else:
+                children.append((child, inner_scope, ()))
+        return children
+
+
+class ScopeAnalysisCache:
+    """Lazily computed analysis of the file currently being checked."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        # Tree and analysis are replaced together, so concurrent runs at
+        # worst recompute an analysis, never return another file's
+        self._entry: Optional[Tuple[ast.AST, ScopeAnalysis]] = None
+        self.builds = 0
+
+    def get(self, tree: ast.AST) -> ScopeAnalysis:
+        """Return the analysis of a tree, computing it on first use.
+
+        Args:
+            tree: Parsed file, the same object every checker receives
+
+        Returns:
+            Scope and def-use facts of the tree
+        """
+        entry = self._entry
+        if entry is not None and entry[0] is tree:
+            return entry[1]
+        analysis = ScopeAnalysis(tree)
+        self._entry = (tree, analysis)
+        self.builds += 1
+        return analysis
+
+    def clear(self) -> None:
+        """Drop the cached analysis, e.g. once a file has been checked."""
+        self._entry = None
+
+
+# Shared instance, cleared by the engine after each file
+scope_analyses = ScopeAnalysisCache()
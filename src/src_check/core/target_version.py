@@ -0,0 +1,100 @@
+"""
+Minimum Python version targeted by the project a file belongs to.
+
+Version-dependent rules only make sense for projects that can use the
+replacement they suggest. The lower bound of ``[project] requires-python``
+in the project's pyproject.toml is read once per project root; projects
+that declare none are assumed to target the running interpreter.
+"""
+
+import logging
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import toml
+
+from src_check.core.project import project_roots
+
+logger = logging.getLogger(__name__)
+
+PythonVersion = Tuple[int, int]
+
+# Clauses of a version specifier that bound the version from below
+LOWER_BOUND_RE = re.compile(r"^\s*(?:>=|~=|==|>)\s*(\d+)(?:\.(\d+))?")
+
+
+def parse_requires_python(specifier: str) -> Optional[PythonVersion]:
+    """Return the lowest Python version a requires-python specifier allows.
+
+    Args:
+        specifier: Version specifier, e.g. ``">=3.8,<4"``
+
+    Returns:
+        Major and minor version of the lower bound, or None if there is none
+    """
+    bounds = []
+    for clause in specifier.split(","):
+        match = LOWER_BOUND_RE.match(clause)
+        if match:
+            bounds.append((int(match.group(1)), int(match.group(2) or 0)))
+    return max(bounds) if bounds else None
+
+
+class TargetVersions:
+    """Memoized project-root-to-minimum-Python-version map."""
+
+    def __init__(self, default: Optional[PythonVersion] = None):
+        """Initialize an empty map.
+
+        Args:
+            default: Version of projects declaring none, defaults to the
+                running interpreter
+        """
+        self.default: PythonVersion = default or (
+            sys.version_info[0],
+            sys.version_info[1],
+        )
+        self._versions: Dict[Path, PythonVersion] = {}
+
+    def clear(self) -> None:
+        """Forget everything, e.g. at the start of a new run."""
+        self._versions.clear()
+
+    def of_root(self, root: Path) -> PythonVersion:
+        """Return the minimum Python version of a project.
+
+        Args:
+            root: Project root directory
+
+        Returns:
+            Major and minor version the project must support
+        """
+        version = self._versions.get(root)
+        if version is None:
+            version = self._read(root / "pyproject.toml") or self.default
+            self._versions[root] = version
+        return version
+
+    def of(self, file_path: Union[str, Path]) -> PythonVersion:
+        """Return the minimum Python version of the project a file belongs to."""
+        return self.of_root(project_roots.root_of(file_path))
+
+    @staticmethod
+    def _read(pyproject: Path) -> Optional[PythonVersion]:
+        """Read the requires-python lower bound from a pyproject.toml."""
+        if not pyproject.is_file():
+            return None
+        try:
+            with open(pyproject) as f:
+                data = toml.load(f)
+        except Exception as e:
+            logger.warning(f"Error reading {pyproject}: {e}")
+            return None
+        specifier = data.get("project", {}).get("requires-python")
+        return parse_requires_python(specifier) if specifier else None
+
+
+# Shared instance, reset by the engine at the start of each directory run
+target_versions = TargetVersions()
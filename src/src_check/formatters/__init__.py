@@ -1,17 +1,18 @@
 """Output formatters for src-check results."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-from src_check.models.check_result import CheckResult
-from src_check.models.simple_kpi_score import KpiScore
+if TYPE_CHECKING:
+    from src_check.models.check_result import CheckResult
+    from src_check.models.simple_kpi_score import KpiScore
 
 
 class BaseFormatter(ABC):
     """Abstract base class for output formatters."""
 
     @abstractmethod
-    def format(self, results: Dict[str, List[CheckResult]], kpi: KpiScore) -> str:
+    def format(self, results: Dict[str, List["CheckResult"]], kpi: "KpiScore") -> str:
         """Format check results and KPI score.
 
         Args:
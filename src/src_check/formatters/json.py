@@ -56,7 +56,8 @@ class JsonFormatter(BaseFormatter):
                             "line": loc.line,
                             "column": loc.column,
                             "message": loc.message,
-                            "code_snippet": loc.code_snippet,
+                            "code_snippet": loc.snippet(),
+                            "aliases": loc.aliases,
                         }
                         for loc in result.failure_locations
                     ],
@@ -78,6 +78,9 @@ class MarkdownFormatter(BaseFormatter):
                             loc = result.failure_locations[0]
                             location = f"L{loc.line}" if loc.line else "File"
                             message = loc.message.replace("|", "\\|")  # Escape pipes
+                            if loc.aliases:
+                                also = ", ".join(f"`{a}`" for a in loc.aliases)
+                                message += f" (also: {also})"
                         else:
                             location = "File"
                             message = "No specific location"
@@ -143,6 +143,8 @@ class TextFormatter(BaseFormatter):
             location = f"Line {loc.line}" if loc.line else "File-level"
             message = loc.message if loc.message else result.title
             lines.append(f"      - {location}: {message}")
+            if loc.aliases:
+                lines.append(f"        (also: {', '.join(loc.aliases)})")
 
         return "\n".join(lines)
 
@@ -6,6 +6,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from src_check.models.source_lines import source_lines
+from src_check.models.suppressions import suppressions
+
 
 class Severity(Enum):
     """Severity levels for issues."""
@@ -19,7 +22,12 @@ class Severity(Enum):
 
 @dataclass
 class FailureLocation:
-    """Represents a location where a check failed."""
+    """Represents a location where a check failed.
+
+    A location spanning a range (end_line set) without an explicit
+    code_snippet shows the source text of the range, cut from the shared
+    source line table when a formatter asks for it.
+    """
 
     file_path: str
     line: int
@@ -28,6 +36,8 @@ class FailureLocation:
     end_column: Optional[int] = None
     message: str = ""
     code_snippet: Optional[str] = None
+    # Other paths of the same physical file, e.g. through symlinks
+    aliases: List[str] = field(default_factory=list)
 
     def __str__(self) -> str:
         """String representation of failure location."""
@@ -38,6 +48,19 @@ class FailureLocation:
             location += f" - {self.message}"
         return location
 
+    def snippet(self) -> Optional[str]:
+        """Return the code to show for the location, resolving it on demand.
+
+        Returns:
+            The explicit code_snippet, else the source text of the range, or
+            None if neither is available
+        """
+        if self.code_snippet is not None or self.end_line is None:
+            return self.code_snippet
+        return source_lines.segment(
+            self.file_path, self.line, self.column, self.end_line, self.end_column
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -48,8 +71,23 @@ class FailureLocation:
             "end_column": self.end_column,
             "message": self.message,
             "code_snippet": self.code_snippet,
+            "aliases": self.aliases,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FailureLocation":
+        """Create FailureLocation from a dictionary produced by to_dict."""
+        return cls(
+            file_path=data.get("file_path", ""),
+            line=data.get("line", 0),
+            column=data.get("column"),
+            end_line=data.get("end_line"),
+            end_column=data.get("end_column"),
+            message=data.get("message", ""),
+            code_snippet=data.get("code_snippet"),
+            aliases=list(data.get("aliases", [])),
+        )
+
 
 @dataclass
 class CheckResult:
@@ -83,7 +121,11 @@ class CheckResult:
         column: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
-        """Add a failure location."""
+        """Add a failure location, unless a comment in the file silences it."""
+        if not suppressions.allows(
+            file_path, line, message, self.checker_name, self.rule_id
+        ):
+            return
         failure = FailureLocation(
             file_path=file_path, line=line, column=column, message=message, **kwargs
         )
@@ -105,6 +147,23 @@ class CheckResult:
             "rule_id": self.rule_id,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CheckResult":
+        """Create CheckResult from a dictionary produced by to_dict."""
+        return cls(
+            title=data.get("title", ""),
+            checker_name=data.get("checker_name", ""),
+            failure_locations=[
+                FailureLocation.from_dict(loc) for loc in data.get("failures", [])
+            ],
+            fix_policy=data.get("fix_policy", ""),
+            fix_example_code=data.get("fix_example_code"),
+            severity=Severity(data.get("severity", Severity.MEDIUM.value)),
+            category=data.get("category", "general"),
+            metadata=data.get("metadata", {}),
+            rule_id=data.get("rule_id"),
+        )
+
     def format_report(self, verbose: bool = False) -> str:
         """Format the result as a human-readable report."""
         lines = []
@@ -124,8 +183,9 @@ class CheckResult:
 
             for i, loc in enumerate(self.failure_locations, 1):
                 lines.append(f"{i}. {loc}")
-                if verbose and loc.code_snippet:
-                    lines.append(f"   Code: {loc.code_snippet}")
+                snippet = loc.snippet() if verbose else None
+                if snippet:
+                    lines.append(f"   Code: {snippet}")
 
             # Fix policy
             if self.fix_policy:
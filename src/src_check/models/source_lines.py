@@ -0,0 +1,105 @@
+"""
+Source text of checked files, for resolving code snippets on demand.
+
+Failure locations record line and column ranges rather than code. The
+engine keeps the content of every file with findings here, and a snippet
+is cut from it only when a formatter asks for one. Contents are split into
+lines on first use, so files whose snippets are never shown are not split.
+
+Long-lived processes must keep the table bounded: the daemon clears it
+before every request and the language server discards closed buffers.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# Line breaks as Python's tokenizer sees them, unlike str.splitlines
+LINE_BREAK_RE = re.compile(r"\r\n?|\n")
+
+
+class SourceLineTable:
+    """Line tables of checked files, keyed by file path."""
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._contents: Dict[str, str] = {}
+        self._lines: Dict[str, List[str]] = {}
+
+    def record(self, file_path: str, content: str) -> None:
+        """Keep the content of a file, replacing any earlier version.
+
+        Args:
+            file_path: Path the failure locations of the file refer to
+            content: Source code the file was checked with
+        """
+        self._contents[file_path] = content
+        self._lines.pop(file_path, None)
+
+    def lines(self, file_path: str) -> Optional[List[str]]:
+        """Return the lines of a file, splitting its content on first use.
+
+        Args:
+            file_path: Path of a recorded file
+
+        Returns:
+            Lines without their line endings, or None if the file is unknown
+        """
+        lines = self._lines.get(file_path)
+        if lines is None:
+            content = self._contents.get(file_path)
+            if content is None:
+                return None
+            lines = self._lines[file_path] = LINE_BREAK_RE.split(content)
+        return lines
+
+    def segment(
+        self,
+        file_path: str,
+        line: int,
+        column: Optional[int] = None,
+        end_line: Optional[int] = None,
+        end_column: Optional[int] = None,
+    ) -> Optional[str]:
+        """Return the source text of a range, like ast.get_source_segment.
+
+        Columns are UTF-8 byte offsets, as in the AST.
+
+        Args:
+            file_path: Path of a recorded file
+            line: First line, 1-based
+            column: Offset of the start in the first line
+            end_line: Last line, defaults to the first one
+            end_column: Offset of the end in the last line
+
+        Returns:
+            The text of the range, or None if the file or lines are unknown
+        """
+        lines = self.lines(file_path)
+        end_line = line if end_line is None else end_line
+        if lines is None or not 1 <= line <= end_line <= len(lines):
+            return None
+
+        selected = [text.encode("utf-8") for text in lines[line - 1 : end_line]]
+        if end_column is not None:
+            selected[-1] = selected[-1][:end_column]
+        if column is not None:
+            selected[0] = selected[0][column:]
+        return "\n".join(text.decode("utf-8", "replace") for text in selected)
+
+    def discard(self, file_path: str) -> None:
+        """Forget a single file, if it was recorded.
+
+        Args:
+            file_path: Path the file was recorded with
+        """
+        self._contents.pop(file_path, None)
+        self._lines.pop(file_path, None)
+
+    def clear(self) -> None:
+        """Forget every recorded file."""
+        self._contents.clear()
+        self._lines.clear()
+
+
+# Shared instance, filled by the engine and read when snippets are formatted
+source_lines = SourceLineTable()
@@ -0,0 +1,199 @@
+"""
+Inline suppression comments of checked files.
+
+A finding is silenced by a comment on the line it is reported at::
+
+    result = result + chunk  # src-check: ignore[PERF003]
+
+The bracketed list names rule codes (``PERF003``, ``DEPR001``), result rule
+ids (``DOC001``) or checker names (``security``); without it every finding
+on the line is silenced. ``# src-check: ignore-file[...]`` anywhere in a
+file applies to the whole file, and a checker named there, or every
+checker for a bare ``ignore-file``, is not run on the file at all.
+
+Comments are found with one tokenize pass per file, so the marker inside
+a string literal does not count, and only for files that contain it.
+Checkers consult the index before recording a finding.
+"""
+
+import io
+import re
+import tokenize
+from typing import Dict, FrozenSet, Iterable, Optional
+
+# Marker looked for before tokenizing a file
+MARKER = "src-check:"
+
+SUPPRESSION_RE = re.compile(
+    r"#\s*src-check:\s*(?P<kind>ignore-file|ignore)\b(?:\[(?P<codes>[^\]]*)\])?"
+)
+
+# Rule code a message starts with, e.g. "[PERF003] ..." or "DEPR001: ..."
+MESSAGE_CODE_RE = re.compile(r"\[?([A-Z][A-Z0-9]*[0-9])\]?:?\s")
+
+# Codes of a suppression; None silences everything
+Codes = Optional[FrozenSet[str]]
+
+
+def message_code(message: str) -> Optional[str]:
+    """Return the rule code a finding's message starts with, if any."""
+    match = MESSAGE_CODE_RE.match(message)
+    return match.group(1) if match else None
+
+
+def _merge(current: Codes, codes: Codes) -> Codes:
+    """Combine two suppressions of the same scope."""
+    if current is None or codes is None:
+        return None
+    return current | codes
+
+
+class SuppressionIndex:
+    """Suppressions of one file: rule codes silenced per line and file-wide."""
+
+    def __init__(self) -> None:
+        """Initialize an index that silences nothing."""
+        self.lines: Dict[int, Codes] = {}
+        self.file_wide: Codes = frozenset()
+
+    def __bool__(self) -> bool:
+        """Check whether the index silences anything."""
+        return bool(self.lines) or self.file_wide != frozenset()
+
+    @classmethod
+    def from_source(cls, content: str) -> "SuppressionIndex":
+        """Collect the suppression comments of a file.
+
+        Args:
+            content: Source code of the file
+
+        Returns:
+            Index of the comments found, empty if there are none
+        """
+        index = cls()
+        if MARKER not in content:
+            return index
+
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(content).readline):
+                if token.type == tokenize.COMMENT and MARKER in token.string:
+                    index._add(token.start[0], token.string)
+        except (tokenize.TokenError, IndentationError, SyntaxError):
+            pass  # Keep the comments before the error
+        return index
+
+    def _add(self, line: int, comment: str) -> None:
+        """Record the suppression a comment declares, if any."""
+        match = SUPPRESSION_RE.search(comment)
+        if match is None:
+            return
+        codes: Codes = None
+        if match.group("codes") is not None:
+            codes = frozenset(
+                code.strip() for code in match.group("codes").split(",") if code.strip()
+            )
+        if match.group("kind") == "ignore-file":
+            self.file_wide = _merge(self.file_wide, codes)
+        else:
+            self.lines[line] = _merge(self.lines.get(line, frozenset()), codes)
+
+    def skips_checker(self, checker_name: str) -> bool:
+        """Check whether a checker is silenced for the whole file."""
+        return self.file_wide is None or checker_name in self.file_wide
+
+    def suppresses(self, line: int, message: str, names: Iterable[str] = ()) -> bool:
+        """Check whether a finding is silenced.
+
+        Args:
+            line: Line the finding is reported at
+            message: Message of the finding, which may start with a rule code
+            names: Other names the finding goes by, e.g. checker and rule id
+
+        Returns:
+            True if a comment silences the finding
+        """
+        if self.file_wide is None:
+            return True
+        codes = self.lines.get(line, frozenset())
+        if codes is None:
+            return True
+        codes = codes | self.file_wide
+        if not codes:
+            return False
+        return message_code(message) in codes or any(name in codes for name in names)
+
+
+class SuppressionTable:
+    """Suppression indexes of checked files, keyed by file path."""
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        # Only files with suppressions are kept
+        self._indexes: Dict[str, SuppressionIndex] = {}
+
+    def __bool__(self) -> bool:
+        """Check whether any file has suppressions."""
+        return bool(self._indexes)
+
+    def record(self, file_path: str, content: str) -> SuppressionIndex:
+        """Index the suppressions of a file, replacing any earlier version.
+
+        Args:
+            file_path: Path findings in the file are reported with
+            content: Source code the file is checked with
+
+        Returns:
+            Index of the file's suppressions
+        """
+        index = SuppressionIndex.from_source(content)
+        if index:
+            self._indexes[file_path] = index
+        else:
+            self._indexes.pop(file_path, None)
+        return index
+
+    def of(self, file_path: str) -> Optional[SuppressionIndex]:
+        """Return the index of a file, or None if nothing in it is silenced."""
+        return self._indexes.get(file_path)
+
+    def allows(
+        self,
+        file_path: str,
+        line: int,
+        message: str,
+        checker_name: Optional[str] = None,
+        rule_id: Optional[str] = None,
+    ) -> bool:
+        """Check whether a finding should be recorded.
+
+        Args:
+            file_path: File the finding is reported in
+            line: Line the finding is reported at
+            message: Message of the finding
+            checker_name: Name of the reporting checker
+            rule_id: Rule id of the result the finding belongs to
+
+        Returns:
+            False if a comment in the file silences the finding
+        """
+        index = self._indexes.get(file_path)
+        if index is None:
+            return True
+        names = [name for name in (checker_name, rule_id) if name]
+        return not index.suppresses(line, message, names)
+
+    def discard(self, file_path: str) -> None:
+        """Forget a single file, if it was recorded.
+
+        Args:
+            file_path: Path the file was recorded with
+        """
+        self._indexes.pop(file_path, None)
+
+    def clear(self) -> None:
+        """Forget every recorded file."""
+        self._indexes.clear()
+
+
+# Shared instance, filled by the engine before the checkers of a file run
+suppressions = SuppressionTable()
@@ -1,17 +1,37 @@
 """
 Quality checker rules for src-check.
+
+Checker classes are imported on first access, so that importing one rule
+module does not import all of them.
 """
 
-from src_check.rules.architecture import ArchitectureChecker
-from src_check.rules.code_quality import CodeQualityChecker
-from src_check.rules.dependency import DependencyChecker
-from src_check.rules.deprecation import DeprecationChecker
-from src_check.rules.documentation import DocumentationChecker
-from src_check.rules.license import LicenseChecker
-from src_check.rules.performance import PerformanceChecker
-from src_check.rules.security import SecurityChecker
-from src_check.rules.test_quality import TestQualityChecker
-from src_check.rules.type_hints import TypeHintChecker
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from src_check.rules.architecture import ArchitectureChecker
+    from src_check.rules.code_quality import CodeQualityChecker
+    from src_check.rules.dependency import DependencyChecker
+    from src_check.rules.deprecation import DeprecationChecker
+    from src_check.rules.documentation import DocumentationChecker
+    from src_check.rules.license import LicenseChecker
+    from src_check.rules.performance import PerformanceChecker
+    from src_check.rules.security import SecurityChecker
+    from src_check.rules.test_quality import TestQualityChecker
+    from src_check.rules.type_hints import TypeHintChecker
+
+_CHECKER_MODULES: Dict[str, str] = {
+    "ArchitectureChecker": "architecture",
+    "CodeQualityChecker": "code_quality",
+    "DependencyChecker": "dependency",
+    "DeprecationChecker": "deprecation",
+    "DocumentationChecker": "documentation",
+    "LicenseChecker": "license",
+    "PerformanceChecker": "performance",
+    "SecurityChecker": "security",
+    "TestQualityChecker": "test_quality",
+    "TypeHintChecker": "type_hints",
+}
 
 __all__ = [
     "ArchitectureChecker",
@@ -25,3 +45,11 @@ __all__ = [
     "TestQualityChecker",
     "TypeHintChecker",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import checker classes on first access."""
+    if name in _CHECKER_MODULES:
+        module = importlib.import_module(f"{__name__}.{_CHECKER_MODULES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
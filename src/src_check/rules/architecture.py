@@ -4,15 +4,21 @@ Architecture quality checkers.
 
 import ast
 from collections import defaultdict
-from typing import ClassVar, Dict, List, Optional, Set, Union
+from pathlib import Path
+from typing import Callable, ClassVar, Dict, List, Optional, Set, Union
 
 from src_check.core.base import BaseChecker
+from src_check.core.import_graph import import_graph
 from src_check.models import CheckResult, Severity
 
 
 class ArchitectureChecker(BaseChecker):
     """Checks for architectural issues and design problems."""
 
+    # Project-wide thresholds, counting imports between project modules only
+    MAX_FAN_IN: ClassVar[int] = 10
+    MAX_FAN_OUT: ClassVar[int] = 10
+
     @property
     def name(self) -> str:
         return "architecture"
@@ -66,6 +72,90 @@ class ArchitectureChecker(BaseChecker):
 
         return None
 
+    def check_project(self, project_root: Path) -> List[CheckResult]:
+        """Check coupling and layering across the whole project import graph.
+
+        Reports modules that reach a layer they must not depend on only
+        through other modules (direct imports are reported per file), and
+        hub modules with both high fan-in and high fan-out.
+        """
+        # Kept by the shared graph, so only changed modules are recomputed
+        # when a daemon analyzes the project again
+        reachability = import_graph.reachability(layer_mask)
+        result = self.create_result("Project architecture")
+
+        for module in import_graph.modules():
+            file_path = import_graph.files[module]
+            layer = detect_layer(module)
+
+            forbidden = LAYER_FORBIDDEN_MASKS.get(layer, 0) if layer else 0
+            reached = reachability.mask(module) & forbidden
+            direct = 0
+            for target in import_graph.successors.get(module, ()):
+                direct |= layer_mask(target)
+            transitive = reached & ~direct
+            if transitive:
+                path = import_graph.path(module, layer_matcher(transitive))
+                reached_layer = detect_layer(path[-1])
+                result.add_failure(
+                    file_path=file_path,
+                    line=1,
+                    column=0,
+                    message=f"Transitive layer violation: {layer} layer reaches {reached_layer} layer via {' -> '.join(path)}",
+                    code_snippet=" -> ".join(path),
+                )
+
+            metrics = import_graph.metrics(module)
+            if metrics.fan_in > self.MAX_FAN_IN and metrics.fan_out > self.MAX_FAN_OUT:
+                result.add_failure(
+                    file_path=file_path,
+                    line=1,
+                    column=0,
+                    message=f"Hub module: fan-in {metrics.fan_in}, fan-out {metrics.fan_out} (instability {metrics.instability:.2f})",
+                    code_snippet=module,
+                )
+
+        if result.failure_count == 0:
+            return []
+        result.severity = Severity.MEDIUM
+        result.fix_policy = (
+            "Project architecture improvements:\n"
+            "1. Route dependencies from lower to higher layers through interfaces\n"
+            "2. Split hub modules so that changes do not ripple in both directions"
+        )
+        return [result]
+
+
+# Layers as bits, and the layers each one must not depend on
+LAYER_BITS: Dict[str, int] = {"ui": 1, "business": 2, "data": 4}
+LAYER_FORBIDDEN_MASKS: Dict[str, int] = {
+    "data": LAYER_BITS["ui"] | LAYER_BITS["business"],
+    "business": LAYER_BITS["ui"],
+}
+
+
+def detect_layer(path: str) -> Optional[str]:
+    """Detect which layer a module or file path belongs to."""
+    path_lower = path.lower()
+
+    for layer, patterns in LayerViolationVisitor.LAYER_PATTERNS.items():
+        for pattern in patterns:
+            if pattern in path_lower:
+                return layer
+
+    return None
+
+
+def layer_mask(module: str) -> int:
+    """Return the layer bit of a module, or 0 if it belongs to no layer."""
+    layer = detect_layer(module)
+    return LAYER_BITS[layer] if layer else 0
+
+
+def layer_matcher(mask: int) -> Callable[[str], bool]:
+    """Return a predicate matching modules in any of the layers of a mask."""
+    return lambda module: bool(layer_mask(module) & mask)
+
 
 class CircularImportVisitor(ast.NodeVisitor):
     """Detects potential circular imports."""
@@ -165,21 +255,15 @@ class LayerViolationVisitor(ast.NodeVisitor):
                     line=node.lineno,
                     column=node.col_offset,
                     message=f"Layer violation: {self.current_layer} layer importing from {imported_layer} layer",
-                    code_snippet=f"from {node.module} import ...",
+                    end_line=node.end_lineno,
+                    end_column=node.end_col_offset,
                 )
 
         self.generic_visit(node)
 
     def _detect_layer(self, path: str) -> Optional[str]:
         """Detect which layer a module belongs to."""
-        path_lower = path.lower()
-
-        for layer, patterns in self.LAYER_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in path_lower:
-                    return layer
-
-        return None
+        return detect_layer(path)
 
     def _is_layer_violation(self, from_layer: str, to_layer: str) -> bool:
         """Check if import violates layer architecture."""
@@ -4,9 +4,11 @@ Code quality checkers.
 
 import ast
 import re
-from typing import Dict, Optional, Set, Tuple, Union
+from typing import Dict, Optional, Set, Tuple
 
 from src_check.core.base import BaseChecker
+from src_check.core.functions import FunctionFacts, function_facts
+from src_check.core.scopes import scope_analyses
 from src_check.models import CheckResult, Severity
 
 
@@ -68,32 +70,37 @@ class NamingConventionVisitor(ast.NodeVisitor):
         self.file_path = file_path
         self.result = result
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+    def visit_Module(self, node: ast.Module) -> None:
+        """Check class and variable names, then function names from the facts."""
+        start = len(self.result.failure_locations)
+        self.generic_visit(node)
+        for function in function_facts.get(node):
+            self._check_function(function)
+
+        # Report in source order, as a single traversal would
+        found = self.result.failure_locations[start:]
+        found.sort(key=lambda location: location.line)
+        self.result.failure_locations[start:] = found
+
+    def _check_function(self, function: FunctionFacts) -> None:
         """Check function naming."""
         # Skip visit_* methods (AST visitor pattern)
-        if node.name.startswith("visit_"):
-            self.generic_visit(node)
+        if function.name.startswith("visit_"):
             return
 
         if (
-            not self._is_snake_case(node.name)
-            and not node.name.startswith("_")
-            and not (node.name.startswith("__") and node.name.endswith("__"))
+            not self._is_snake_case(function.name)
+            and not function.name.startswith("_")
+            and not (function.name.startswith("__") and function.name.endswith("__"))
         ):
             self.result.add_failure(
                 file_path=self.file_path,
-                line=node.lineno,
-                column=node.col_offset,
-                message=f"Function '{node.name}' should use snake_case naming",
-                code_snippet=f"def {node.name}(...)",
+                line=function.line,
+                column=function.column,
+                message=f"Function '{function.name}' should use snake_case naming",
+                code_snippet=f"def {function.name}(...)",
             )
 
-        self.generic_visit(node)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Check async function naming."""
-        self.visit_FunctionDef(node)  # type: ignore[arg-type]
-
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Check class naming."""
         if not self._is_pascal_case(node.name):
@@ -194,39 +201,17 @@ class ComplexityVisitor(ast.NodeVisitor):
         self.file_path = file_path
         self.result = result
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Check function complexity."""
-        complexity = self._calculate_complexity(node)
-
-        if complexity > self.MAX_COMPLEXITY:
-            self.result.add_failure(
-                file_path=self.file_path,
-                line=node.lineno,
-                column=node.col_offset,
-                message=f"Function '{node.name}' is too complex (complexity: {complexity}, max: {self.MAX_COMPLEXITY})",
-                code_snippet=f"def {node.name}(...)",
-            )
-
-        self.generic_visit(node)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Check async function complexity."""
-        self.visit_FunctionDef(node)  # type: ignore[arg-type]
-
-    def _calculate_complexity(self, node: ast.FunctionDef) -> int:
-        """Calculate McCabe cyclomatic complexity."""
-        complexity = 1  # Base complexity
-
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                # Each 'and' or 'or' adds a branch
-                complexity += len(child.values) - 1
-            elif isinstance(child, (ast.ExceptHandler, ast.Assert, ast.comprehension)):
-                complexity += 1
-
-        return complexity
+    def visit(self, node: ast.AST) -> None:
+        """Check the complexity of every function from the shared facts."""
+        for function in function_facts.get(node):
+            if function.complexity > self.MAX_COMPLEXITY:
+                self.result.add_failure(
+                    file_path=self.file_path,
+                    line=function.line,
+                    column=function.column,
+                    message=f"Function '{function.name}' is too complex (complexity: {function.complexity}, max: {self.MAX_COMPLEXITY})",
+                    code_snippet=f"def {function.name}(...)",
+                )
 
 
 class UnusedImportsVisitor(ast.NodeVisitor):
@@ -241,39 +226,16 @@ class UnusedImportsVisitor(ast.NodeVisitor):
         self.used_names: Set[str] = set()
         self._analyzed = False  # Flag to prevent duplicate analysis
 
-    def visit_Import(self, node: ast.Import) -> None:
-        """Track imports."""
-        for alias in node.names:
-            name = alias.asname if alias.asname else alias.name
-            self.imports[name] = (node.lineno, node.col_offset, alias.name)
-
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        """Track from imports."""
-        for alias in node.names:
-            name = alias.asname if alias.asname else alias.name
-            if name != "*":  # Ignore star imports
-                full_name = f"{node.module}.{alias.name}" if node.module else alias.name
-                self.imports[name] = (node.lineno, node.col_offset, full_name)
-
-        self.generic_visit(node)
-
-    def visit_Name(self, node: ast.Name) -> None:
-        """Track name usage."""
-        self.used_names.add(node.id)
-        self.generic_visit(node)
-
-    def visit_Attribute(self, node: ast.Attribute) -> None:
-        """Track attribute usage."""
-        # Get the root name
-        root: Union[ast.expr, ast.AST] = node
-        while isinstance(root, ast.Attribute):
-            root = root.value
-        if isinstance(root, ast.Name):
-            self.used_names.add(root.id)
-
-        self.generic_visit(node)
+    def visit(self, node: ast.AST) -> None:
+        """Collect imports and used names from the shared scope analysis."""
+        scopes = scope_analyses.get(node)
+        for binding in scopes.imports:
+            self.imports[binding.name] = (
+                binding.node.lineno,
+                binding.node.col_offset,
+                binding.qualified_name,
+            )
+        self.used_names |= scopes.names
 
     def finalize(self) -> None:
         """Check for unused imports (call after visiting)."""
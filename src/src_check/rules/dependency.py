@@ -1,14 +1,25 @@
 """Dependency health checker for Python projects."""
 
 import ast
-import importlib.metadata
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import ClassVar, Dict, List, Optional, Set
 
 import toml
 
 from src_check.core.base import BaseChecker
+from src_check.core.distributions import load_distribution_index
+from src_check.core.graph import (
+    is_cyclic,
+    shortest_cycle,
+    strongly_connected_components,
+)
+from src_check.core.modules import (
+    local_imports,
+    module_index,
+    stdlib_module_names,
+)
+from src_check.core.project import project_roots
 from src_check.models.check_result import CheckResult, Severity
 
 
@@ -32,6 +43,11 @@ class DependencyChecker(BaseChecker):
 
     priority = 7
 
+    # Only import statements are collected per file, and findings are
+    # reported by check_project() once the whole project has been seen
+    needs_ast: ClassVar[bool] = False
+    project_only: ClassVar[bool] = True
+
     def __init__(self) -> None:
         """Initialize the dependency checker."""
         super().__init__()
@@ -40,6 +56,7 @@ class DependencyChecker(BaseChecker):
         self.dev_dependencies: Set[str] = set()
         self.import_graph: Dict[str, Set[str]] = {}
         self.file_imports: Dict[str, Set[str]] = {}
+        self.module_files: Dict[str, str] = {}
 
     def check(self, ast_tree: ast.AST, file_path: str) -> Optional[CheckResult]:
         """Check for dependency issues."""
@@ -80,21 +97,25 @@ class DependencyChecker(BaseChecker):
                     module_name = alias.name.split(".")[0]
                     file_imports.add(module_name)
                     self.project_imports.add(module_name)
-            elif isinstance(node, ast.ImportFrom) and node.module:
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
                 module_name = node.module.split(".")[0]
                 file_imports.add(module_name)
                 self.project_imports.add(module_name)
 
         self.file_imports[str(file_path)] = file_imports
 
-        # Build import graph for circular dependency detection
-        rel_path = str(file_path.name)
-        if rel_path not in self.import_graph:
-            self.import_graph[rel_path] = set()
+        # Build import graph for circular dependency detection, keyed by
+        # fully qualified module names where the module index knows them
+        module = module_index.module_name(file_path) or file_path.stem
+        self.module_files[module] = str(file_path)
+        edges = self.import_graph.setdefault(module, set())
 
-        for imp in file_imports:
-            if self._is_local_import(imp, file_path):
-                self.import_graph[rel_path].add(imp)
+        if module_index.covers(file_path):
+            edges.update(local_imports(ast_tree, file_path))
+        else:
+            for imp in file_imports:
+                if self._is_local_import(imp, file_path):
+                    edges.add(imp)
 
     def _analyze_file_imports(self, file_path: Path, content: str) -> None:
         """Analyze imports in a Python file."""
@@ -129,9 +150,7 @@ class DependencyChecker(BaseChecker):
 
     def _is_project_root(self, file_path: Path) -> bool:
         """Check if we're at the project root level."""
-        root_indicators = ["pyproject.toml", "requirements.txt", "setup.py"]
-        parent = file_path.parent
-        return any((parent / indicator).exists() for indicator in root_indicators)
+        return project_roots.is_root(file_path.parent)
 
     def _parse_dependency_files(self, root_path: Path) -> None:
         """Parse dependency files in the project."""
@@ -198,42 +217,18 @@ class DependencyChecker(BaseChecker):
 
     def _is_local_import(self, module_name: str, file_path: Path) -> bool:
         """Check if an import is a local module."""
-        # Standard library modules
-        stdlib_modules = {
-            "os",
-            "sys",
-            "json",
-            "datetime",
-            "collections",
-            "itertools",
-            "functools",
-            "pathlib",
-            "typing",
-            "re",
-            "ast",
-            "math",
-            "random",
-            "string",
-            "textwrap",
-            "unicodedata",
-            "codecs",
-            "io",
-            "time",
-            "calendar",
-            "copy",
-            "pprint",
-            "enum",
-            "dataclasses",
-        }
-
-        if module_name in stdlib_modules:
+        if module_name in stdlib_module_names():
             return False
 
         # Check if it's a declared dependency
         if module_name.lower() in self.declared_dependencies:
             return False
 
-        # Check if module exists in the project
+        # Files discovered by the engine are classified by the module index
+        if module_index.covers(file_path):
+            return module_index.is_local(module_name)
+
+        # Otherwise check if module exists next to the file or above it
         project_root = file_path.parent
         while project_root.parent != project_root:
             if (project_root / module_name).exists() or (
@@ -245,48 +240,39 @@ class DependencyChecker(BaseChecker):
         return False
 
     def _check_circular_dependencies(self) -> List[CheckResult]:
-        """Check for circular dependencies."""
+        """Check for circular dependencies.
+
+        Every strongly connected component of the import graph with more
+        than one module (or a module importing itself) is reported once,
+        with a shortest cycle through it as the example.
+        """
         results = []
-        visited = set()
-        rec_stack = set()
-
-        def has_cycle(module: str, path: List[str]) -> Optional[List[str]]:
-            visited.add(module)
-            rec_stack.add(module)
-            path.append(module)
-
-            for neighbor in self.import_graph.get(module, []):
-                if neighbor not in visited and (
-                    cycle := has_cycle(neighbor, path.copy())
-                ):
-                    return cycle
-                elif neighbor in rec_stack:
-                    # Found a cycle
-                    cycle_start = path.index(neighbor)
-                    return [*path[cycle_start:], neighbor]
-
-            path.pop()
-            rec_stack.remove(module)
-            return None
-
-        for module in self.import_graph:
-            if module not in visited:
-                cycle = has_cycle(module, [])
-                if cycle:
-                    result = CheckResult(
-                        title=f"Circular dependency detected: {' -> '.join(cycle)}",
-                        checker_name=self.name,
-                        severity=Severity.HIGH,
-                        category=self.category,
-                        rule_id="DEP001",
-                    )
-                    result.add_failure(
-                        file_path=module,
-                        line=1,
-                        message=f"Circular dependency: {' -> '.join(cycle)}",
-                    )
-                    results.append(result)
 
+        for component in strongly_connected_components(self.import_graph):
+            if not is_cyclic(component, self.import_graph):
+                continue
+
+            start = min(component)
+            cycle = shortest_cycle(start, set(component), self.import_graph)
+            message = f"Circular dependency: {' -> '.join(cycle)}"
+            if len(component) > len(cycle) - 1:
+                message += f" (cycle group: {', '.join(sorted(component))})"
+
+            result = CheckResult(
+                title=f"Circular dependency detected: {' -> '.join(cycle)}",
+                checker_name=self.name,
+                severity=Severity.HIGH,
+                category=self.category,
+                rule_id="DEP001",
+            )
+            result.add_failure(
+                file_path=self.module_files.get(start, start),
+                line=1,
+                message=message,
+            )
+            results.append(result)
+
+        results.sort(key=lambda r: r.title)
         return results
 
     def _check_unused_dependencies(self) -> List[CheckResult]:
@@ -307,14 +293,16 @@ class DependencyChecker(BaseChecker):
             used_packages.add(package_name)
 
         # Check for unused dependencies
+        distributions = load_distribution_index()
         for dep in self.declared_dependencies:
             if dep not in used_packages and dep not in self.dev_dependencies:
                 # Check if it might be imported with a different name
                 try:
-                    metadata = importlib.metadata.distribution(dep)
-                    top_level = metadata.read_text("top_level.txt")
-                    if top_level:
-                        modules = top_level.strip().split("\n")
+                    dist = distributions.get(dep)
+                    if dist is None:
+                        raise LookupError(dep)
+                    if dist.top_level:
+                        modules = dist.top_level
                         if not any(mod in self.project_imports for mod in modules):
                             result = CheckResult(
                                 title="Unused dependency detected",
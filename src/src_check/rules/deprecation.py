@@ -1,16 +1,171 @@
-"""廃止予定機能の使用を検出するチェッカー."""
+"""廃止予定機能の使用を検出するチェッカー.
+
+廃止予定のモジュールやAPIは ``deprecations.json`` のカタログに記述する。
+カタログはルールの種類と完全修飾名をキーとする表にコンパイルされ、
+プロジェクトの requires-python の下限では意味のないルール (代替手段が
+まだ無いもの、すでに削除されたもの) は取り除かれる。指摘の重大度も
+カタログに記述する。新しい廃止予定APIはカタログに追記するだけで検出できる。
+"""
 
 import ast
-import sys
-from typing import ClassVar, Dict, List, Optional, Set, Union
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Set, Type, Union
 
 from src_check.core.base import BaseChecker
+from src_check.core.names import NameResolver
+from src_check.core.scopes import scope_analyses
+from src_check.core.target_version import PythonVersion, target_versions
 from src_check.models.check_result import CheckResult, FailureLocation, Severity
+from src_check.models.suppressions import suppressions
+
+# パッケージに同梱される廃止予定APIのカタログ
+CATALOG_PATH = Path(__file__).with_name("deprecations.json")
+
+# ルールの種類: インポートされるモジュール、インポートされる名前、
+# 呼び出される関数、デコレータ
+RULE_KINDS = ("module", "import", "call", "decorator")
+
+# 重大度の高い順
+SEVERITY_ORDER = list(Severity)
+
+
+def _parse_version(text: Optional[str]) -> Optional[PythonVersion]:
+    """バージョン文字列 (例: "3.9") をタプルに変換する."""
+    if not text:
+        return None
+    major, minor = text.split(".")[:2]
+    return int(major), int(minor)
+
+
+@dataclass(frozen=True)
+class DeprecationRule:
+    """カタログの1ルール."""
+
+    code: str
+    kind: str
+    name: str
+    replacement: str
+    message: str
+    severity: Severity = Severity.MEDIUM
+    # 代替手段が使えるようになったバージョン。これより古いPythonを
+    # サポートするプロジェクトには提案しない
+    since: Optional[PythonVersion] = None
+    # 削除されたバージョン。これ以降だけをサポートするプロジェクトでは
+    # インポートの時点で失敗するため報告しない
+    removed: Optional[PythonVersion] = None
+    # from __future__ import annotations がある場合は報告しない
+    unless_future_annotations: bool = False
+
+    def applies_to(self, version: PythonVersion) -> bool:
+        """対象バージョンのプロジェクトでこのルールが意味を持つか判定する."""
+        if self.removed is not None and version >= self.removed:
+            return False
+        return self.since is None or version >= self.since
+
+
+def load_catalog(path: Path = CATALOG_PATH) -> List[DeprecationRule]:
+    """カタログファイルを読み込んでルールの一覧を返す.
+
+    Args:
+        path: カタログファイルのパス
+
+    Returns:
+        メッセージを展開済みのルールの一覧
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    rules = []
+    for group in data.get("groups", []):
+        kind = group["kind"]
+        if kind not in RULE_KINDS:
+            raise ValueError(f"Unknown deprecation rule kind: {kind}")
+        for entry in group["rules"]:
+            fields = {**group, **entry}
+            name = fields["name"]
+            message = fields["message"].format(
+                name=name,
+                attr=name.rsplit(".", 1)[-1],
+                replacement=fields["replacement"],
+                since=fields.get("since", ""),
+            )
+            rules.append(
+                DeprecationRule(
+                    code=fields["code"],
+                    kind=kind,
+                    name=name,
+                    replacement=fields["replacement"],
+                    message=message,
+                    severity=Severity(fields.get("severity", "medium")),
+                    since=_parse_version(fields.get("since")),
+                    removed=_parse_version(fields.get("removed")),
+                    unless_future_annotations=fields.get(
+                        "unless_future_annotations", False
+                    ),
+                )
+            )
+    return rules
+
+
+class DispatchTable:
+    """対象バージョンで意味を持つルールを、種類と完全修飾名で引く表."""
+
+    def __init__(self, rules: List[DeprecationRule]) -> None:
+        """初期化.
+
+        Args:
+            rules: 表に含めるルール
+        """
+        self.modules: Dict[str, DeprecationRule] = {}
+        self.imports: Dict[str, DeprecationRule] = {}
+        self.calls: Dict[str, DeprecationRule] = {}
+        self.decorators: Dict[str, DeprecationRule] = {}
+        tables = {
+            "module": self.modules,
+            "import": self.imports,
+            "call": self.calls,
+            "decorator": self.decorators,
+        }
+        for rule in rules:
+            tables[rule.kind][rule.name] = rule
+
+
+@lru_cache(maxsize=None)
+def _catalog() -> List[DeprecationRule]:
+    """同梱のカタログを一度だけ読み込む."""
+    return load_catalog()
+
+
+@lru_cache(maxsize=None)
+def catalog_digest(path: Path = CATALOG_PATH) -> str:
+    """カタログファイルの内容のハッシュを返す (結果キャッシュのキーに使う)."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def dispatch_table(version: PythonVersion) -> DispatchTable:
+    """対象バージョン向けに絞り込んだ表を返す (バージョンごとに一度だけ構築).
+
+    Args:
+        version: プロジェクトがサポートする最小のPythonバージョン
+
+    Returns:
+        対象バージョンで意味を持つルールだけを含む表
+    """
+    return DispatchTable([rule for rule in _catalog() if rule.applies_to(version)])
 
 
 class DeprecationChecker(BaseChecker):
     """廃止予定機能の使用を検出するチェッカー."""
 
+    interesting_nodes: ClassVar[FrozenSet[Type[ast.AST]]] = frozenset(
+        {ast.Import, ast.ImportFrom, ast.FunctionDef, ast.Call, ast.BinOp}
+    )
+
     @property
     def name(self) -> str:
         """チェッカーの名前を返す."""
@@ -26,51 +181,31 @@ class DeprecationChecker(BaseChecker):
         """チェッカーのカテゴリを返す."""
         return "code_quality"
 
-    # Python標準ライブラリの廃止予定モジュール/関数
-    DEPRECATED_MODULES: ClassVar[Dict[str, str]] = {
-        "imp": "importlib",
-        "asyncore": "asyncio",
-        "asynchat": "asyncio",
-        "smtpd": "aiosmtpd or other alternatives",
-    }
-
-    # collections の古いAPI
-    DEPRECATED_COLLECTIONS: ClassVar[Dict[str, str]] = {
-        "MutableMapping": "collections.abc.MutableMapping",
-        "MutableSet": "collections.abc.MutableSet",
-        "MutableSequence": "collections.abc.MutableSequence",
-        "Mapping": "collections.abc.Mapping",
-        "Set": "collections.abc.Set",
-        "Sequence": "collections.abc.Sequence",
-        "Iterable": "collections.abc.Iterable",
-        "Iterator": "collections.abc.Iterator",
-        "Generator": "collections.abc.Generator",
-        "Callable": "collections.abc.Callable",
-    }
-
-    # typing モジュールの古い書き方 (Python 3.9+)
-    DEPRECATED_TYPING: ClassVar[Dict[str, str]] = {
-        "List": "list",
-        "Dict": "dict",
-        "Set": "set",
-        "Tuple": "tuple",
-        "Type": "type",
-        "FrozenSet": "frozenset",
-    }
-
-    # asyncioの古いAPI
-    DEPRECATED_ASYNCIO: ClassVar[Dict[str, str]] = {
-        "ensure_future": "create_task",
-        "@coroutine": "async def",
-    }
-
-    def __init__(self) -> None:
-        """初期化."""
+    def __init__(self, target_version: Optional[PythonVersion] = None) -> None:
+        """初期化.
+
+        Args:
+            target_version: 対象とするPythonの最小バージョン。省略時は
+                プロジェクトの requires-python から決める
+        """
         super().__init__()
+        self.target_version = target_version
         self.deprecated_imports: Set[str] = set()
         self.current_module: str = ""
         self.has_future_annotations = False
 
+    def cache_context(self, file_path: str) -> str:
+        """検出結果を左右する対象バージョンとカタログを結果キャッシュのキーに加える.
+
+        Args:
+            file_path: チェック対象のファイルのパス
+
+        Returns:
+            対象バージョンとカタログのハッシュを表す文字列
+        """
+        major, minor = self.target_version or target_versions.of(file_path)
+        return f"python{major}.{minor}:{catalog_digest()}"
+
     def check(self, ast_tree: ast.AST, file_path: str) -> Optional[CheckResult]:
         """ASTをチェックして廃止予定機能の使用を検出する."""
         self.current_module = file_path
@@ -78,14 +213,14 @@ class DeprecationChecker(BaseChecker):
         self.has_future_annotations = False
 
         # future annotationsのインポートをチェック
-        for node in ast.walk(ast_tree):
-            if isinstance(node, ast.ImportFrom) and node.module == "__future__":
-                for alias in node.names:
-                    if alias.name == "annotations":
-                        self.has_future_annotations = True
-                        break
-
-        visitor = DeprecationVisitor(self)
+        scopes = scope_analyses.get(ast_tree)
+        self.has_future_annotations = any(
+            binding.qualified_name == "__future__.annotations"
+            for binding in scopes.imports
+        )
+
+        version = self.target_version or target_versions.of(file_path)
+        visitor = DeprecationVisitor(self, scopes.resolver, dispatch_table(version))
         visitor.visit(ast_tree)
 
         if not visitor.failures:
@@ -93,18 +228,28 @@ class DeprecationChecker(BaseChecker):
 
         result = self.create_result()
         result.failure_locations = visitor.failures
+        result.severity = visitor.severity
         return result
 
 
 class DeprecationVisitor(ast.NodeVisitor):
     """ASTを訪問して廃止予定機能を検出するビジター."""
 
-    def __init__(self, checker: DeprecationChecker) -> None:
+    def __init__(
+        self,
+        checker: DeprecationChecker,
+        resolver: Optional[NameResolver] = None,
+        table: Optional[DispatchTable] = None,
+    ) -> None:
         """初期化."""
         self.checker = checker
         self.failures: List[FailureLocation] = []
+        # 記録した指摘のうち最も高い重大度
+        self.severity = Severity.INFO
         self.current_function: str = ""
-        self.import_map: Dict[str, str] = {}  # alias -> module mapping
+        # インポートの別名を解決して完全修飾名を得る
+        self.resolver = resolver or NameResolver()
+        self.table = table or dispatch_table(target_versions.default)
 
     def add_failure(
         self,
@@ -116,11 +261,17 @@ class DeprecationVisitor(ast.NodeVisitor):
             ast.Call,
             ast.BinOp,
             ast.Attribute,
+            ast.Name,
+            ast.expr,
         ],
         message: str,
         severity: Severity = Severity.MEDIUM,
     ) -> None:
-        """失敗を追加する."""
+        """失敗を追加する (抑制コメントで黙らされた指摘は記録しない)."""
+        if not suppressions.allows(
+            self.checker.current_module, node.lineno, message, self.checker.name
+        ):
+            return
         self.failures.append(
             FailureLocation(
                 file_path=self.checker.current_module,
@@ -129,23 +280,17 @@ class DeprecationVisitor(ast.NodeVisitor):
                 message=message,
             )
         )
+        if SEVERITY_ORDER.index(severity) < SEVERITY_ORDER.index(self.severity):
+            self.severity = severity
 
     def visit_Import(self, node: ast.Import) -> None:
         """importステートメントを訪問."""
         for alias in node.names:
-            module_name = alias.name
-            import_alias = alias.asname or alias.name
-            self.import_map[import_alias] = module_name
-
             # DEPR001: 廃止予定モジュールのインポート
-            if module_name in DeprecationChecker.DEPRECATED_MODULES:
-                replacement = DeprecationChecker.DEPRECATED_MODULES[module_name]
-                self.add_failure(
-                    node,
-                    f"DEPR001: 廃止予定のモジュール '{module_name}' を使用しています。'{replacement}' を使用してください",
-                    Severity.MEDIUM,
-                )
-                self.checker.deprecated_imports.add(module_name)
+            rule = self.table.modules.get(alias.name)
+            if rule is not None:
+                self.add_failure(node, rule.message, rule.severity)
+                self.checker.deprecated_imports.add(alias.name)
         self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
@@ -155,46 +300,21 @@ class DeprecationVisitor(ast.NodeVisitor):
             return
 
         # DEPR001: 廃止予定モジュールからのインポート
-        if node.module in DeprecationChecker.DEPRECATED_MODULES:
-            replacement = DeprecationChecker.DEPRECATED_MODULES[node.module]
-            self.add_failure(
-                node,
-                f"DEPR001: 廃止予定のモジュール '{node.module}' を使用しています。'{replacement}' を使用してください",
-                Severity.MEDIUM,
-            )
+        rule = self.table.modules.get(node.module)
+        if rule is not None:
+            self.add_failure(node, rule.message, rule.severity)
             self.checker.deprecated_imports.add(node.module)
 
-        # DEPR001: collectionsの古いAPI
-        if node.module == "collections" and node.names:
-            for alias in node.names:
-                if (
-                    isinstance(alias.name, str)
-                    and alias.name in DeprecationChecker.DEPRECATED_COLLECTIONS
-                ):
-                    replacement = DeprecationChecker.DEPRECATED_COLLECTIONS[alias.name]
-                    self.add_failure(
-                        node,
-                        f"DEPR001: '{node.module}.{alias.name}' は廃止予定です。'{replacement}' を使用してください",
-                        Severity.MEDIUM,
-                    )
-
-        # DEPR005: typingモジュールの古い書き方（Python 3.9+）
-        if (
-            node.module == "typing"
-            and sys.version_info >= (3, 9)
-            and not self.checker.has_future_annotations
-        ):
+        # DEPR001/DEPR005: 廃止予定の名前のインポート (相対インポートは対象外)
+        if self.table.imports and not node.level:
             for alias in node.names:
-                if (
-                    isinstance(alias.name, str)
-                    and alias.name in DeprecationChecker.DEPRECATED_TYPING
+                rule = self.table.imports.get(f"{node.module}.{alias.name}")
+                if rule is None or (
+                    rule.unless_future_annotations
+                    and self.checker.has_future_annotations
                 ):
-                    replacement = DeprecationChecker.DEPRECATED_TYPING[alias.name]
-                    self.add_failure(
-                        node,
-                        f"DEPR005: Python 3.9+では 'typing.{alias.name}' の代わりに '{replacement}' を使用できます",
-                        Severity.INFO,
-                    )
+                    continue
+                self.add_failure(node, rule.message, rule.severity)
 
         # DEPR006: from module import * の使用
         if any(alias.name == "*" for alias in node.names):
@@ -211,18 +331,13 @@ class DeprecationVisitor(ast.NodeVisitor):
         old_function = self.current_function
         self.current_function = node.name
 
-        # DEPR002: @deprecatedデコレータまたはDeprecationWarningを含む関数の検出
-        for decorator in node.decorator_list:
-            if isinstance(decorator, ast.Name) and decorator.id == "deprecated":
-                # この関数自体が廃止予定としてマークされている
-                pass
-            elif isinstance(decorator, ast.Attribute) and decorator.attr == "coroutine":
-                # DEPR004: asyncio.coroutineデコレータの使用
-                self.add_failure(
-                    decorator,
-                    "DEPR004: '@coroutine' デコレータは廃止予定です。'async def' を使用してください",
-                    Severity.MEDIUM,
-                )
+        # DEPR004: 廃止予定のデコレータ (asyncio.coroutineなど)
+        if self.table.decorators:
+            for decorator in node.decorator_list:
+                name = self.resolver.qualified(decorator) or ""
+                rule = self.table.decorators.get(name)
+                if rule is not None:
+                    self.add_failure(decorator, rule.message, rule.severity)
 
         self.generic_visit(node)
         self.current_function = old_function
@@ -236,30 +351,11 @@ class DeprecationVisitor(ast.NodeVisitor):
 
     def visit_Call(self, node: ast.Call) -> None:
         """関数呼び出しを訪問."""
-        # DEPR002: warnings.warnでDeprecationWarningを発行している関数の呼び出し
-        if isinstance(node.func, ast.Attribute):
-            if (
-                isinstance(node.func.value, ast.Name)
-                and node.func.value.id == "warnings"
-                and node.func.attr == "warn"
-            ):
-                # DeprecationWarningを確認
-                for arg in node.args:
-                    if isinstance(arg, ast.Name) and arg.id == "DeprecationWarning":
-                        # この呼び出し自体は廃止予定の宣言なのでスキップ
-                        pass
-
-            # DEPR004: asyncio.ensure_futureの使用
-            if (
-                isinstance(node.func.value, ast.Name)
-                and node.func.value.id == "asyncio"
-                and node.func.attr == "ensure_future"
-            ):
-                self.add_failure(
-                    node,
-                    "DEPR004: 'asyncio.ensure_future' は 'asyncio.create_task' を使用することが推奨されます",
-                    Severity.INFO,
-                )
+        # DEPR004: 廃止予定の関数の呼び出し (別名でのインポートも含む)
+        if self.table.calls:
+            rule = self.table.calls.get(self.resolver.qualified(node.func) or "")
+            if rule is not None:
+                self.add_failure(node, rule.message, rule.severity)
 
         # DEPR003: 文字列フォーマットの古い書き方
         if (
@@ -3,9 +3,10 @@
 import ast
 import re
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Tuple
 
 from src_check.core.base import BaseChecker
+from src_check.core.functions import ArgumentFacts, FunctionFacts, function_facts
 from src_check.models.check_result import CheckResult, Severity
 
 
@@ -35,15 +36,10 @@ class DocstringVisitor(ast.NodeVisitor):
 
         self.generic_visit(node)
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Check function documentation."""
-        self._check_function_doc(node)
-        self.generic_visit(node)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Check async function documentation."""
-        self._check_function_doc(node)
-        self.generic_visit(node)
+        for function in function_facts.get(node):
+            self._check_function_doc(function)
+        # Report in source order, as a single traversal would
+        self.issues.sort(key=lambda issue: issue[0])
 
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Check class documentation."""
@@ -56,90 +52,70 @@ class DocstringVisitor(ast.NodeVisitor):
 
         self.generic_visit(node)
 
-    def _check_function_doc(
-        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
-    ) -> None:
+    def _check_function_doc(self, function: FunctionFacts) -> None:
         """Check function or method documentation.
 
         Args:
-            node: The function node to check
+            function: Facts of the function to check
         """
         # Skip private methods and dunder methods
-        if node.name.startswith("_"):
+        if function.name.startswith("_"):
             return
 
-        docstring = ast.get_docstring(node)
-
-        if not docstring:
+        if not function.docstring:
             self.issues.append(
-                (node.lineno, f"Missing docstring for function '{node.name}'")
+                (function.line, f"Missing docstring for function '{function.name}'")
             )
             return
 
         # Check docstring completeness
-        self._check_docstring_completeness(node, docstring)
+        self._check_docstring_completeness(function, function.docstring)
 
     def _check_docstring_completeness(
-        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], docstring: str
+        self, function: FunctionFacts, docstring: str
     ) -> None:
         """Check if docstring is complete with all necessary sections.
 
         Args:
-            node: The function node
+            function: Facts of the function
             docstring: The function's docstring
         """
-        # Get function signature info
-        has_params = len(node.args.args) > 0 or node.args.vararg or node.args.kwarg
-        has_return = node.returns is not None
-
         # Skip 'self' parameter for methods
-        params = node.args.args
-        if params and params[0].arg == "self":
+        params = function.positional_args()
+        if params and params[0].name == "self":
             params = params[1:]
-            has_params = len(params) > 0 or node.args.vararg or node.args.kwarg
 
         # Check for parameter documentation
-        if (
-            has_params
-            and params
-            and not self._has_param_documentation(docstring, params)
-        ):
+        if params and not self._has_param_documentation(docstring, params):
             self.issues.append(
                 (
-                    node.lineno,
-                    f"Function '{node.name}' has parameters but missing parameter documentation",
+                    function.line,
+                    f"Function '{function.name}' has parameters but missing parameter documentation",
                 )
             )
 
         # Check for return documentation (skip None returns)
-        if has_return and node.name != "__init__":
-            # Skip if return type is None
-            if node.returns and (
-                (hasattr(node.returns, "id") and node.returns.id == "None")
-                or (
-                    isinstance(node.returns, ast.Constant)
-                    and node.returns.value is None
-                )
-                or (
-                    isinstance(node.returns, ast.NameConstant)
-                    and node.returns.value is None
-                )
-            ):
-                return
-            if not self._has_return_documentation(docstring):
-                self.issues.append(
-                    (
-                        node.lineno,
-                        f"Function '{node.name}' has return type but missing return documentation",
-                    )
+        if (
+            function.returns is not None
+            and function.returns != "None"
+            and function.name != "__init__"
+            and not self._has_return_documentation(docstring)
+        ):
+            self.issues.append(
+                (
+                    function.line,
+                    f"Function '{function.name}' has return type but missing return documentation",
                 )
+            )
 
-    def _has_param_documentation(self, docstring: str, params: List[ast.arg]) -> bool:
+    def _has_param_documentation(
+        self, docstring: str, params: List[ArgumentFacts]
+    ) -> bool:
         """Check if docstring documents all parameters.
 
         Args:
             docstring: The docstring to check
-            params: List of parameter nodes
+            params: Parameters of the function
 
         Returns:
             True if all parameters are documented
@@ -150,7 +126,7 @@ class DocstringVisitor(ast.NodeVisitor):
 
         # Simple check for parameter names in docstring
         for param in params:
-            param_pattern = rf"\b{param.arg}\b.*:"
+            param_pattern = rf"\b{param.name}\b.*:"
             if not re.search(param_pattern, docstring):
                 return False
 
@@ -1,21 +1,27 @@
 """License compliance checker for Python projects."""
 
 import ast
-import importlib.metadata
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 import toml
 
 from src_check.core.base import BaseChecker
+from src_check.core.distributions import LICENSE_PATTERNS, load_distribution_index
+from src_check.core.project import project_roots
 from src_check.models.check_result import CheckResult, Severity
 
 
 class LicenseChecker(BaseChecker):
     """Check for license compliance and consistency issues."""
 
+    # Only the header of each file is inspected, so no AST is needed and
+    # files with syntax errors are still checked
+    needs_ast: ClassVar[bool] = False
+    needs_text: ClassVar[bool] = True
+
     @property
     def name(self) -> str:
         return "license"
@@ -32,19 +38,7 @@ class LicenseChecker(BaseChecker):
         """Initialize the license checker."""
         super().__init__()
         # Common license patterns for detection
-        self.license_patterns = {
-            "MIT": r"MIT License|Permission is hereby granted, free of charge|^MIT$",
-            "Apache-2.0": r"Apache License.*Version 2\.0|apache.*2\.0|^Apache-2\.0$",
-            "GPL-3.0": r"GNU GENERAL PUBLIC LICENSE.*Version 3|GPL-3\.0|GPLv3",
-            "GPL-2.0": r"GNU GENERAL PUBLIC LICENSE.*Version 2|GPL-2\.0|GPLv2",
-            "BSD-3-Clause": r"BSD 3-Clause License|Redistribution and use in source and binary forms|^BSD-3-Clause$",
-            "BSD-2-Clause": r"BSD 2-Clause License|^BSD-2-Clause$",
-            "ISC": r"ISC License|^ISC$",
-            "LGPL-3.0": r"GNU LESSER GENERAL PUBLIC LICENSE.*Version 3|LGPL-3\.0|LGPLv3",
-            "LGPL-2.1": r"GNU LESSER GENERAL PUBLIC LICENSE.*Version 2\.1|LGPL-2\.1|LGPLv2\.1",
-            "MPL-2.0": r"Mozilla Public License.*Version 2\.0|MPL-2\.0",
-            "Unlicense": r"This is free and unencumbered software released into the public domain|^Unlicense$",
-        }
+        self.license_patterns = dict(LICENSE_PATTERNS)
 
         # License compatibility matrix (simplified)
         self.compatibility_matrix = {
@@ -118,18 +112,25 @@ class LicenseChecker(BaseChecker):
 
     def check(self, ast_tree: ast.AST, file_path: str) -> Optional[CheckResult]:
         """Check license compliance for the file."""
+        return self._check(file_path, None)
+
+    def check_source(self, source: str, file_path: str) -> Optional[CheckResult]:
+        """Check license compliance for the file, given its source text."""
+        return self._check(file_path, source)
+
+    def _check(self, file_path: str, source: Optional[str]) -> Optional[CheckResult]:
+        """Run the project-level checks once and the header check per file.
+
+        Args:
+            file_path: Path to the file being checked
+            source: Source text of the file, read from disk if None
+
+        Returns:
+            CheckResult with findings, or None if no issues found
+        """
         result = self.create_result("License Compliance Check")
 
-        # Find project root
-        path = Path(file_path)
-        root_path = path.parent
-        while root_path.parent != root_path:
-            if any(
-                (root_path / name).exists()
-                for name in ["pyproject.toml", "setup.py", ".git"]
-            ):
-                break
-            root_path = root_path.parent
+        root_path = project_roots.root_of(file_path)
 
         # Check project-level license only once
         if not self._project_checked:
@@ -162,7 +163,7 @@ class LicenseChecker(BaseChecker):
                 self._check_dependency_licenses(detected_license, result)
 
         # Check copyright header in this specific file
-        self._check_copyright_header(file_path, result)
+        self._check_copyright_header(file_path, result, source)
 
         return result if result.failure_locations else None
 
@@ -263,9 +264,9 @@ class LicenseChecker(BaseChecker):
     ) -> None:
         """Check licenses of installed dependencies."""
         try:
-            for dist in importlib.metadata.distributions():
-                pkg_name = dist.metadata.get("Name", "Unknown")
-                pkg_license = dist.metadata.get("License", None)
+            for dist in load_distribution_index():
+                pkg_name = dist.name
+                pkg_license = dist.license
 
                 if not pkg_license:
                     result.metadata.setdefault("LIC008", []).append(pkg_name)
@@ -291,15 +292,11 @@ class LicenseChecker(BaseChecker):
                     # Set severity to MEDIUM if it's lower
                     result.severity = Severity.MEDIUM
 
-                # Check compatibility
+                # Check compatibility, using the license identified when the
+                # index was built
                 if project_license in self.compatibility_matrix:
                     compatible_licenses = self.compatibility_matrix[project_license]
-                    # Try to match the package license with known licenses
-                    pkg_license_type = None
-                    for license_name, pattern in self.license_patterns.items():
-                        if re.search(pattern, pkg_license, re.IGNORECASE | re.DOTALL):
-                            pkg_license_type = license_name
-                            break
+                    pkg_license_type = dist.license_id
 
                     if pkg_license_type and pkg_license_type not in compatible_licenses:
                         result.metadata.setdefault("LIC003", []).append(pkg_name)
@@ -314,11 +311,14 @@ class LicenseChecker(BaseChecker):
         except Exception:
             pass
 
-    def _check_copyright_header(self, file_path: str, result: CheckResult) -> None:
+    def _check_copyright_header(
+        self, file_path: str, result: CheckResult, content: Optional[str] = None
+    ) -> None:
         """Check for copyright headers in source files."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+            if content is None:
+                with open(file_path, encoding="utf-8") as f:
+                    content = f.read(1000)
 
             # Look for copyright in the first 1000 characters
             header = content[:1000]
@@ -3,15 +3,23 @@ Performance checker implementation.
 """
 
 import ast
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Tuple, Type, Union
 
 from src_check.core.base import BaseChecker
+from src_check.core.names import NameResolver
+from src_check.core.scopes import LoopBody, ScopeAnalysis, scope_analyses
 from src_check.models import CheckResult, FailureLocation
+from src_check.models.suppressions import suppressions
 
 
 class PerformanceChecker(BaseChecker):
     """Check for performance issues in Python code."""
 
+    interesting_nodes: ClassVar[FrozenSet[Type[ast.AST]]] = frozenset(
+        {ast.For, ast.While, ast.AugAssign, ast.BinOp, ast.ListComp, ast.Call}
+    )
+
     @property
     def name(self) -> str:
         return "performance"
@@ -27,7 +35,7 @@ class PerformanceChecker(BaseChecker):
     def check(self, ast_tree: ast.AST, file_path: str) -> Optional[CheckResult]:
         """Check for performance issues in the code."""
         result = self.create_result()
-        visitor = PerformanceVisitor(file_path)
+        visitor = PerformanceVisitor(file_path, scope_analyses.get(ast_tree))
         visitor.visit(ast_tree)
 
         for issue in visitor.issues:
@@ -36,15 +44,126 @@ class PerformanceChecker(BaseChecker):
         return result if result.failure_locations else None
 
 
+@dataclass
+class LoopContext:
+    """An enclosing loop, open while its subtree is being visited."""
+
+    node: ast.AST
+    # Names assigned a string literal directly in the loop body, with the
+    # number of such assignments
+    string_assignments: Dict[str, int] = field(default_factory=dict)
+    # PERF008 findings inside the loop, with the depth they were found at
+    concatenations: List[Tuple[int, FailureLocation]] = field(default_factory=list)
+
+
 class PerformanceVisitor(ast.NodeVisitor):
-    """AST visitor to detect performance issues."""
+    """AST visitor to detect performance issues.
+
+    The tree is traversed once. Enclosing loops are kept on a stack, and
+    findings that depend on a whole subtree (PERF004, PERF008) are written
+    into a slot reserved when the subtree is entered, so they are reported
+    in the same order as checks run at that node.
+    """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, scopes: Optional[ScopeAnalysis] = None):
         self.file_path = file_path
-        self.issues: List[FailureLocation] = []
+        self.scopes = scopes
+        self._plain_names = NameResolver()
         self.current_function: Optional[str] = None
-        self.loop_depth = 0
-        self.loop_invariants: Dict[int, List[ast.AST]] = {}
+        self.loops: List[LoopContext] = []
+        self._entries: List[Union[FailureLocation, List[FailureLocation]]] = []
+        self._string_loops: Dict[str, List[LoopContext]] = {}
+        self._depth = 0
+        self._comprehensions = 0
+
+    @property
+    def issues(self) -> List[FailureLocation]:
+        """Return the findings in report order."""
+        issues: List[FailureLocation] = []
+        for entry in self._entries:
+            if isinstance(entry, list):
+                issues.extend(entry)
+            else:
+                issues.append(entry)
+        return issues
+
+    @property
+    def loop_depth(self) -> int:
+        """Return the number of enclosing loops."""
+        return len(self.loops)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit the children of a node, tracking their depth in the tree."""
+        self._depth += 1
+        for name in node._fields:
+            value = getattr(node, name, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        self.visit(item)
+            elif isinstance(value, ast.AST):
+                self.visit(value)
+        self._depth -= 1
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        """Skip constants, which have no children to check."""
+
+    def _allows(self, node: ast.AST, message: str) -> bool:
+        """Check that no comment silences a finding at a node."""
+        return suppressions.allows(
+            self.file_path, node.lineno, message, "performance"  # type: ignore[attr-defined]
+        )
+
+    def _report(self, node: ast.AST, message: str) -> None:
+        if not self._allows(node, message):
+            return
+        self._entries.append(
+            FailureLocation(
+                file_path=self.file_path,
+                line=node.lineno,  # type: ignore[attr-defined]
+                column=node.col_offset,  # type: ignore[attr-defined]
+                message=message,
+            )
+        )
+
+    def _reserve(self) -> List[FailureLocation]:
+        slot: List[FailureLocation] = []
+        self._entries.append(slot)
+        return slot
+
+    def _visit_loop(self, context: LoopContext) -> None:
+        """Visit the subtree of a loop with its context on the stack."""
+        self.loops.append(context)
+        for name in context.string_assignments:
+            self._string_loops.setdefault(name, []).append(context)
+
+        self.generic_visit(context.node)
+
+        for name in context.string_assignments:
+            self._string_loops[name].pop()
+        self.loops.pop()
+
+    def visit_Module(self, node: ast.Module) -> None:
+        """Use the shared scope analysis of the module unless one was given."""
+        if self.scopes is None:
+            self.scopes = scope_analyses.get(node)
+        self.generic_visit(node)
+
+    def _loop_body(self, node: ast.AST) -> LoopBody:
+        """Return the def-use facts of a loop."""
+        body = self.scopes.loop(node) if self.scopes is not None else None
+        if body is None:
+            # Visiting a subtree without a scope analysis of the whole file
+            self.scopes = ScopeAnalysis(node)
+            body = self.scopes.loops[node]
+        return body
+
+    def _call_name(self, node: ast.Call) -> Optional[str]:
+        """Return the qualified name of the function a call invokes."""
+        resolver = (
+            self.scopes.resolver if self.scopes is not None else self._plain_names
+        )
+        return resolver.qualified(node.func)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Track current function context."""
@@ -62,13 +181,13 @@ class PerformanceVisitor(ast.NodeVisitor):
 
     def visit_For(self, node: ast.For) -> None:
         """Check for performance issues in loops."""
-        self.loop_depth += 1
+        context = LoopContext(node, self._string_assignments(node))
 
         # Check for loop invariants
         self._check_loop_invariants(node)
 
-        # Check for string concatenation in loops
-        self._check_string_concatenation_in_loop(node)
+        # String concatenation in the loop is found while visiting its body
+        concatenations = self._reserve()
 
         # Check for repeated function calls in loop condition
         if (
@@ -90,35 +209,27 @@ class PerformanceVisitor(ast.NodeVisitor):
                 )
             )
         ):
-            self.issues.append(
-                FailureLocation(
-                    file_path=self.file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    message="[PERF001] Function call in loop range may be evaluated multiple times. Consider storing the result in a variable before the loop",
-                )
+            self._report(
+                node,
+                "[PERF001] Function call in loop range may be evaluated multiple times. Consider storing the result in a variable before the loop",
             )
 
-        self.generic_visit(node)
-        self.loop_depth -= 1
+        self._visit_loop(context)
+
+        # Outermost findings first, as a breadth-first scan would list them
+        context.concatenations.sort(key=lambda item: item[0])
+        concatenations.extend(issue for _, issue in context.concatenations)
 
     def visit_While(self, node: ast.While) -> None:
         """Check for performance issues in while loops."""
-        self.loop_depth += 1
-
         # Check for function calls in while condition
         if isinstance(node.test, ast.Compare) and isinstance(node.test.left, ast.Call):
-            self.issues.append(
-                FailureLocation(
-                    file_path=self.file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    message="[PERF002] Function call in while condition is evaluated on each iteration. Consider caching the result if it doesn't change",
-                )
+            self._report(
+                node,
+                "[PERF002] Function call in while condition is evaluated on each iteration. Consider caching the result if it doesn't change",
             )
 
-        self.generic_visit(node)
-        self.loop_depth -= 1
+        self._visit_loop(LoopContext(node))
 
     def visit_AugAssign(self, node: ast.AugAssign) -> None:
         """Check for inefficient augmented assignments in loops."""
@@ -137,15 +248,12 @@ class PerformanceVisitor(ast.NodeVisitor):
                 )
             )
         ):
-            self.issues.append(
-                FailureLocation(
-                    file_path=self.file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    message="[PERF003] String concatenation in loop is inefficient. Use list.append() and ''.join() instead",
-                )
+            self._report(
+                node,
+                "[PERF003] String concatenation in loop is inefficient. Use list.append() and ''.join() instead",
             )
 
+        self._check_string_concatenation_in_loops(node)
         self.generic_visit(node)
 
     def visit_BinOp(self, node: ast.BinOp) -> None:
@@ -155,13 +263,9 @@ class PerformanceVisitor(ast.NodeVisitor):
             and isinstance(node.op, ast.Add)
             and (self._is_string_type(node.left) or self._is_string_type(node.right))
         ):
-            self.issues.append(
-                FailureLocation(
-                    file_path=self.file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    message="[PERF003] String concatenation in loop is inefficient. Use list.append() and ''.join() instead",
-                )
+            self._report(
+                node,
+                "[PERF003] String concatenation in loop is inefficient. Use list.append() and ''.join() instead",
             )
 
         self.generic_visit(node)
@@ -169,110 +273,106 @@ class PerformanceVisitor(ast.NodeVisitor):
     def visit_ListComp(self, node: ast.ListComp) -> None:
         """Check list comprehensions (usually good for performance)."""
         # List comprehensions are generally good, but check for nested ones
-        nested_count = sum(
-            1
-            for n in ast.walk(node)
-            if isinstance(n, (ast.ListComp, ast.SetComp, ast.DictComp))
-        )
-        if nested_count > 2:
-            self.issues.append(
+        slot = self._reserve()
+        before = self._comprehensions
+        self._comprehensions += 1
+        self.generic_visit(node)
+
+        message = "[PERF004] Deeply nested comprehensions may hurt readability and performance. Consider breaking into multiple steps"
+        if self._comprehensions - before > 2 and self._allows(node, message):
+            slot.append(
                 FailureLocation(
                     file_path=self.file_path,
                     line=node.lineno,
                     column=node.col_offset,
-                    message="[PERF004] Deeply nested comprehensions may hurt readability and performance. Consider breaking into multiple steps",
+                    message=message,
                 )
             )
 
+    def visit_SetComp(self, node: ast.SetComp) -> None:
+        """Count set comprehensions for PERF004."""
+        self._comprehensions += 1
+        self.generic_visit(node)
+
+    def visit_DictComp(self, node: ast.DictComp) -> None:
+        """Count dict comprehensions for PERF004."""
+        self._comprehensions += 1
         self.generic_visit(node)
 
     def visit_Call(self, node: ast.Call) -> None:
         """Check for performance issues in function calls."""
+        func_name = self._call_name(node)
+
         # Check for repeated list() conversions
-        if (
-            isinstance(node.func, ast.Name)
-            and node.func.id == "list"
-            and node.args
-            and isinstance(node.args[0], ast.Call)
-        ):
-            inner_call = node.args[0]
-            if isinstance(inner_call.func, ast.Name) and inner_call.func.id in [
-                "list",
-                "tuple",
-            ]:
-                self.issues.append(
-                    FailureLocation(
-                        file_path=self.file_path,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        message=f"[PERF005] Unnecessary type conversion: list({inner_call.func.id}(...)) is redundant",
-                    )
+        if func_name == "list" and node.args and isinstance(node.args[0], ast.Call):
+            inner_name = self._call_name(node.args[0])
+            if inner_name in ["list", "tuple"]:
+                self._report(
+                    node,
+                    f"[PERF005] Unnecessary type conversion: list({inner_name}(...)) is redundant",
                 )
 
         # Check for global function calls in tight loops
         if (
             self.loop_depth > 0
-            and isinstance(node.func, ast.Name)
-            and node.func.id in ["len", "sum", "max", "min"]
-            and self._is_loop_invariant(node)
+            and func_name in ["len", "sum", "max", "min"]
+            and self._is_loop_invariant(node, self._loop_body(self.loops[-1].node))
         ):
-            self.issues.append(
-                FailureLocation(
-                    file_path=self.file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    message=f"[PERF006] Loop-invariant call to {node.func.id}() could be moved outside the loop. Consider computing this value before the loop",
-                )
+            self._report(
+                node,
+                f"[PERF006] Loop-invariant call to {func_name}() could be moved outside the loop. Consider computing this value before the loop",
             )
 
         self.generic_visit(node)
 
     def _check_loop_invariants(self, node: ast.For) -> None:
         """Check for computations that could be moved outside the loop."""
-        # This is a simplified check - a full implementation would be more complex
+        loop = self._loop_body(node)
         for stmt in node.body:
             if (
                 isinstance(stmt, ast.Assign)
-                and not self._uses_loop_variable(stmt.value, node.target)
                 and isinstance(stmt.value, (ast.BinOp, ast.Call))
+                and self._is_invariant_expression(stmt.value, loop)
             ):
-                self.issues.append(
-                    FailureLocation(
-                        file_path=self.file_path,
-                        line=stmt.lineno,
-                        column=stmt.col_offset,
-                        message="[PERF007] Loop-invariant computation could be moved outside the loop. This value doesn't change during loop iterations",
-                    )
+                self._report(
+                    stmt,
+                    "[PERF007] Loop-invariant computation could be moved outside the loop. This value doesn't change during loop iterations",
                 )
 
-    def _check_string_concatenation_in_loop(self, node: ast.For) -> None:
-        """Check for string concatenation patterns in loops."""
-        for stmt in ast.walk(node):
+    def _string_assignments(self, node: ast.For) -> Dict[str, int]:
+        """Count the string literal assignments per name in a loop body."""
+        counts: Dict[str, int] = {}
+        for stmt in node.body:
             if (
-                isinstance(stmt, ast.AugAssign)
-                and isinstance(stmt.op, ast.Add)
-                and isinstance(stmt.target, ast.Name)
+                isinstance(stmt, ast.Assign)
+                and isinstance(stmt.value, ast.Constant)
+                and isinstance(stmt.value.value, str)
             ):
-                # This is a heuristic - we can't always know the type
-                # but we can check for common patterns
-                for parent_stmt in node.body:
-                    if (
-                        isinstance(parent_stmt, ast.Assign)
-                        and any(
-                            isinstance(t, ast.Name) and t.id == stmt.target.id
-                            for t in parent_stmt.targets
-                        )
-                        and isinstance(parent_stmt.value, ast.Constant)
-                        and isinstance(parent_stmt.value.value, str)
-                    ):
-                        self.issues.append(
-                            FailureLocation(
-                                file_path=self.file_path,
-                                line=stmt.lineno,
-                                column=stmt.col_offset,
-                                message="[PERF008] String concatenation with += in loop is inefficient. Use list.append() and ''.join() for better performance",
-                            )
-                        )
+                names = {t.id for t in stmt.targets if isinstance(t, ast.Name)}
+                for name in names:
+                    counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def _check_string_concatenation_in_loops(self, node: ast.AugAssign) -> None:
+        """Check for += on names the enclosing loops assign a string to."""
+        if not (isinstance(node.op, ast.Add) and isinstance(node.target, ast.Name)):
+            return
+
+        message = "[PERF008] String concatenation with += in loop is inefficient. Use list.append() and ''.join() for better performance"
+        if not self._allows(node, message):
+            return
+
+        # This is a heuristic - we can't always know the type
+        # but we can check for common patterns
+        for context in self._string_loops.get(node.target.id, ()):
+            for _ in range(context.string_assignments[node.target.id]):
+                issue = FailureLocation(
+                    file_path=self.file_path,
+                    line=node.lineno,
+                    column=node.col_offset,
+                    message=message,
+                )
+                context.concatenations.append((self._depth, issue))
 
     def _is_string_type(self, node: ast.AST) -> bool:
         """Heuristic to check if a node is likely a string."""
@@ -286,35 +386,21 @@ class PerformanceVisitor(ast.NodeVisitor):
             return True
         return isinstance(node, ast.JoinedStr)  # f-string
 
-    def _uses_loop_variable(self, node: ast.AST, loop_var: ast.AST) -> bool:
-        """Check if an expression uses the loop variable."""
-        if isinstance(loop_var, ast.Name):
-            loop_var_name = loop_var.id
-        elif isinstance(loop_var, ast.Tuple):
-            loop_var_names = [n.id for n in loop_var.elts if isinstance(n, ast.Name)]
-        else:
-            return False
-
-        for child in ast.walk(node):
-            if isinstance(child, ast.Name) and (
-                (isinstance(loop_var, ast.Name) and child.id == loop_var_name)
-                or (isinstance(loop_var, ast.Tuple) and child.id in loop_var_names)
-            ):
-                return True
-
-        return False
-
-    def _is_loop_invariant(self, node: ast.Call) -> bool:
-        """Simple check if a function call might be loop-invariant."""
-        # This is a heuristic - check if all arguments are constants or
-        # variables that don't appear to be modified in the loop
-        for arg in node.args:
-            if isinstance(arg, ast.Constant):
-                continue
-            elif isinstance(arg, ast.Name):
-                # In a real implementation, we'd track if this variable
-                # is modified in the loop
-                continue
-            else:
-                return False
-        return True
+    def _is_invariant_expression(self, node: ast.expr, loop: LoopBody) -> bool:
+        """Check that no name an expression reads is changed in the loop.
+
+        Method calls count as changing their receiver, so an expression
+        calling a method of a variable is never invariant.
+        """
+        return not any(
+            isinstance(child, ast.Name) and loop.modifies(child.id)
+            for child in ast.walk(node)
+        )
+
+    def _is_loop_invariant(self, node: ast.Call, loop: LoopBody) -> bool:
+        """Check if a call to a builtin only reads values the loop leaves unchanged."""
+        return all(
+            isinstance(arg, ast.Constant)
+            or (isinstance(arg, ast.Name) and not loop.modifies(arg.id))
+            for arg in node.args
+        )
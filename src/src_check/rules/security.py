@@ -4,76 +4,22 @@ Security-related quality checkers.
 
 import ast
 import re
-from typing import ClassVar, Dict, List, Optional, Union
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Pattern, Type, Union
 
 from src_check.core.base import BaseChecker
-from src_check.models import CheckResult, Severity
+from src_check.core.names import NameResolver
+from src_check.core.scopes import scope_analyses
+from src_check.models import CheckResult, FailureLocation, Severity
+from src_check.models.suppressions import suppressions
 
 
-class SecurityChecker(BaseChecker):
-    """Checks for security vulnerabilities and bad practices."""
+class SecurityVisitor(ast.NodeVisitor):
+    """Detects all security issues in a single pass over the tree.
 
-    @property
-    def name(self) -> str:
-        return "security"
-
-    @property
-    def description(self) -> str:
-        return "Security vulnerability detection"
-
-    @property
-    def category(self) -> str:
-        return "security"
-
-    def check(self, ast_tree: ast.AST, file_path: str) -> Optional[CheckResult]:
-        """Check for security issues in the AST."""
-        result = self.create_result()
-
-        # Use multiple visitors for different security checks
-        visitors = [
-            HardcodedSecretsVisitor(file_path, result),
-            DangerousFunctionsVisitor(file_path, result),
-            SQLInjectionVisitor(file_path, result),
-            PickleUsageVisitor(file_path, result),
-        ]
-
-        for visitor in visitors:
-            visitor.visit(ast_tree)
-
-        # Set severity based on findings
-        if result.failure_count > 0:
-            # If any critical issues found, set to critical
-            for failure in result.failure_locations:
-                if (
-                    "password" in failure.message.lower()
-                    or "secret" in failure.message.lower()
-                ):
-                    result.severity = Severity.CRITICAL
-                    break
-                elif (
-                    "eval" in failure.message.lower()
-                    or "exec" in failure.message.lower()
-                ):
-                    result.severity = Severity.HIGH
-                elif result.severity != Severity.HIGH:
-                    result.severity = Severity.MEDIUM
-
-            # Add fix policy
-            result.fix_policy = (
-                "Security issues should be addressed immediately:\n"
-                "1. Never hardcode secrets - use environment variables or secure vaults\n"
-                "2. Avoid dangerous functions like eval() and exec()\n"
-                "3. Use parameterized queries to prevent SQL injection\n"
-                "4. Avoid pickle for untrusted data - use JSON instead"
-            )
-
-            return result
-
-        return None
-
-
-class HardcodedSecretsVisitor(ast.NodeVisitor):
-    """Detects hardcoded secrets and credentials."""
+    Name and literal patterns are compiled once, when the class is created.
+    Findings are collected per kind and reported kind by kind: secrets,
+    dangerous calls, SQL injection, then pickle usage.
+    """
 
     SECRET_PATTERNS: ClassVar[List[str]] = [
         "password",
@@ -90,87 +36,12 @@ class HardcodedSecretsVisitor(ast.NodeVisitor):
         "mysql_pwd",
         "postgres_pwd",
     ]
-
-    def __init__(self, file_path: str, result: CheckResult):
-        self.file_path = file_path
-        self.result = result
-
-    def visit_Assign(self, node: ast.Assign) -> None:
-        """Check assignments for hardcoded secrets."""
-        for target in node.targets:
-            if isinstance(target, ast.Name):
-                var_name = target.id.lower()
-
-                # Skip common metadata fields
-                if target.id in [
-                    "__author__",
-                    "__email__",
-                    "__version__",
-                    "__license__",
-                ]:
-                    continue
-
-                # Check if variable name suggests a secret
-                for pattern in self.SECRET_PATTERNS:
-                    if pattern in var_name:
-                        # Check if value is a string literal
-                        if isinstance(node.value, (ast.Str, ast.Constant)):
-                            value = (
-                                node.value.s
-                                if isinstance(node.value, ast.Str)
-                                else node.value.value
-                            )
-                            if (
-                                isinstance(value, str)
-                                and value
-                                and not value.startswith("${")
-                            ):
-                                self.result.add_failure(
-                                    file_path=self.file_path,
-                                    line=node.lineno,
-                                    column=node.col_offset,
-                                    message=f"Hardcoded secret found: {target.id}",
-                                    code_snippet=f"{target.id} = '<hidden>'",
-                                )
-                        break
-
-        self.generic_visit(node)
-
-    def visit_Dict(self, node: ast.Dict) -> None:
-        """Check dictionary literals for secrets."""
-        for key, value in zip(node.keys, node.values):
-            if isinstance(key, (ast.Str, ast.Constant)):
-                key_str = key.s if isinstance(key, ast.Str) else key.value
-                if isinstance(key_str, str):
-                    key_lower = key_str.lower()
-
-                    for pattern in self.SECRET_PATTERNS:
-                        if pattern in key_lower:
-                            if isinstance(value, (ast.Str, ast.Constant)):
-                                val = (
-                                    value.s
-                                    if isinstance(value, ast.Str)
-                                    else value.value
-                                )
-                                if (
-                                    isinstance(val, str)
-                                    and val
-                                    and not val.startswith("${")
-                                ):
-                                    self.result.add_failure(
-                                        file_path=self.file_path,
-                                        line=key.lineno,
-                                        column=key.col_offset,
-                                        message=f"Hardcoded secret in dictionary: {key_str}",
-                                        code_snippet=f'"{key_str}": "<hidden>"',
-                                    )
-                            break
-
-        self.generic_visit(node)
-
-
-class DangerousFunctionsVisitor(ast.NodeVisitor):
-    """Detects usage of dangerous functions."""
+    SECRET_NAME_RE: ClassVar[Pattern[str]] = re.compile(
+        "|".join(map(re.escape, SECRET_PATTERNS))
+    )
+    METADATA_NAMES: ClassVar[FrozenSet[str]] = frozenset(
+        {"__author__", "__email__", "__version__", "__license__"}
+    )
 
     DANGEROUS_FUNCTIONS: ClassVar[Dict[str, str]] = {
         "eval": "Can execute arbitrary code",
@@ -182,64 +53,9 @@ class DangerousFunctionsVisitor(ast.NodeVisitor):
         "subprocess.call": "Prefer subprocess.run with shell=False",
         "subprocess.Popen": "Ensure shell=False",
     }
-
-    def __init__(self, file_path: str, result: CheckResult):
-        self.file_path = file_path
-        self.result = result
-
-    def visit_Call(self, node: ast.Call) -> None:
-        """Check function calls for dangerous functions."""
-        func_name = self._get_function_name(node.func)
-
-        if func_name in self.DANGEROUS_FUNCTIONS:
-            self.result.add_failure(
-                file_path=self.file_path,
-                line=node.lineno,
-                column=node.col_offset,
-                message=f"Dangerous function '{func_name}': {self.DANGEROUS_FUNCTIONS[func_name]}",
-                code_snippet=(
-                    ast.unparse(node) if hasattr(ast, "unparse") else func_name
-                ),
-            )
-
-        # Check for subprocess with shell=True
-        if func_name in ["subprocess.call", "subprocess.run", "subprocess.Popen"]:
-            for keyword in node.keywords:
-                if keyword.arg == "shell" and self._is_true(keyword.value):
-                    self.result.add_failure(
-                        file_path=self.file_path,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        message=f"Dangerous: {func_name} with shell=True",
-                        code_snippet="shell=True",
-                    )
-
-        self.generic_visit(node)
-
-    def _get_function_name(self, node: Union[ast.expr, ast.AST]) -> str:
-        """Extract function name from AST node."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            parts = []
-            current: Union[ast.expr, ast.AST] = node
-            while isinstance(current, ast.Attribute):
-                parts.append(current.attr)
-                current = current.value
-            if isinstance(current, ast.Name):
-                parts.append(current.id)
-            return ".".join(reversed(parts))
-        return ""
-
-    def _is_true(self, node: Union[ast.expr, ast.AST]) -> bool:
-        """Check if a node represents True."""
-        if isinstance(node, (ast.Constant, ast.NameConstant)):
-            return node.value is True
-        return False
-
-
-class SQLInjectionVisitor(ast.NodeVisitor):
-    """Detects potential SQL injection vulnerabilities."""
+    SHELL_FUNCTIONS: ClassVar[FrozenSet[str]] = frozenset(
+        {"subprocess.call", "subprocess.run", "subprocess.Popen"}
+    )
 
     SQL_PATTERNS: ClassVar[List[str]] = [
         r"SELECT.*FROM",
@@ -249,126 +65,271 @@ class SQLInjectionVisitor(ast.NodeVisitor):
         r"DROP.*TABLE",
         r"CREATE.*TABLE",
     ]
-
-    def __init__(self, file_path: str, result: CheckResult):
+    SQL_RE: ClassVar[Pattern[str]] = re.compile("|".join(SQL_PATTERNS), re.IGNORECASE)
+
+    PICKLE_MODULES: ClassVar[FrozenSet[str]] = frozenset({"pickle", "cPickle"})
+    PICKLE_LOADS: ClassVar[FrozenSet[str]] = frozenset(
+        {"pickle.loads", "pickle.load", "cPickle.loads", "cPickle.load"}
+    )
+
+    @classmethod
+    def required_tokens(cls) -> FrozenSet[str]:
+        """Return literals of which one occurs in every file with a finding.
+
+        A dotted function name only resolves if each of its parts is spelled
+        out in an import or attribute, so its longest part is required. SQL
+        patterns need the keyword they start with.
+
+        Returns:
+            Lower-case tokens, one or more for every pattern of the visitor
+        """
+        names = [*cls.DANGEROUS_FUNCTIONS, *cls.SHELL_FUNCTIONS, *cls.PICKLE_LOADS]
+        tokens = {max(name.split("."), key=len) for name in names}
+        tokens.update(cls.SECRET_PATTERNS)
+        tokens.update(pattern.split(".*")[0] for pattern in cls.SQL_PATTERNS)
+        tokens.update(cls.PICKLE_MODULES)
+        return frozenset(token.lower() for token in tokens)
+
+    def __init__(
+        self,
+        file_path: str,
+        result: CheckResult,
+        resolver: Optional[NameResolver] = None,
+    ):
         self.file_path = file_path
         self.result = result
-        self.sql_re = re.compile("|".join(self.SQL_PATTERNS), re.IGNORECASE)
+        self.resolver = resolver or NameResolver()
+        self.has_pickle_import = False
+        self.secrets: List[FailureLocation] = []
+        self.dangerous: List[FailureLocation] = []
+        self.sql: List[FailureLocation] = []
+        self.pickle: List[FailureLocation] = []
+
+    def finalize(self) -> None:
+        """Add the findings to the result, kind by kind."""
+        for findings in (self.secrets, self.dangerous, self.sql, self.pickle):
+            self.result.failure_locations.extend(findings)
+        self.secrets, self.dangerous, self.sql, self.pickle = [], [], [], []
+
+    def _add(
+        self,
+        findings: List[FailureLocation],
+        node: ast.AST,
+        message: str,
+        code_snippet: Optional[str] = None,
+    ) -> None:
+        """Record a finding spanning a node; its source is the default snippet."""
+        if not suppressions.allows(
+            self.file_path, node.lineno, message, "security"  # type: ignore[attr-defined]
+        ):
+            return
+        findings.append(
+            FailureLocation(
+                file_path=self.file_path,
+                line=node.lineno,  # type: ignore[attr-defined]
+                column=node.col_offset,  # type: ignore[attr-defined]
+                end_line=getattr(node, "end_lineno", None),
+                end_column=getattr(node, "end_col_offset", None),
+                message=message,
+                code_snippet=code_snippet,
+            )
+        )
 
-    def visit_BinOp(self, node: ast.BinOp) -> None:
-        """Check string concatenation/formatting for SQL."""
-        if isinstance(node.op, (ast.Add, ast.Mod)):
-            # Check if left side contains SQL
-            left_str = self._extract_string(node.left)
-            if left_str and self.sql_re.search(left_str):
-                self.result.add_failure(
-                    file_path=self.file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    message="Potential SQL injection: String concatenation with SQL",
-                    code_snippet="SQL + user_input",
+    @staticmethod
+    def _string_value(node: Optional[ast.AST]) -> Optional[str]:
+        """Return the value of a string literal, or None."""
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        return None
+
+    @staticmethod
+    def _is_secret_value(value: Optional[str]) -> bool:
+        """Check that a literal is non-empty and not a ${...} placeholder."""
+        return bool(value) and not value.startswith("${")  # type: ignore[union-attr]
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        """Check assignments for hardcoded secrets."""
+        for target in node.targets:
+            if (
+                isinstance(target, ast.Name)
+                and target.id not in self.METADATA_NAMES
+                and self.SECRET_NAME_RE.search(target.id.lower())
+                and self._is_secret_value(self._string_value(node.value))
+            ):
+                self._add(
+                    self.secrets,
+                    node,
+                    f"Hardcoded secret found: {target.id}",
+                    f"{target.id} = '<hidden>'",
+                )
+
+        self.generic_visit(node)
+
+    def visit_Dict(self, node: ast.Dict) -> None:
+        """Check dictionary literals for secrets."""
+        for key, value in zip(node.keys, node.values):
+            key_str = self._string_value(key)
+            if (
+                key is not None
+                and key_str is not None
+                and self.SECRET_NAME_RE.search(key_str.lower())
+                and self._is_secret_value(self._string_value(value))
+            ):
+                self._add(
+                    self.secrets,
+                    key,
+                    f"Hardcoded secret in dictionary: {key_str}",
+                    f'"{key_str}": "<hidden>"',
                 )
 
         self.generic_visit(node)
 
     def visit_Call(self, node: ast.Call) -> None:
-        """Check string format calls with SQL."""
-        func_name = self._get_function_name(node.func)
+        """Check calls for dangerous functions, SQL formatting and unpickling."""
+        func_name = self.resolver.qualified(node.func) or ""
+
+        if func_name in self.DANGEROUS_FUNCTIONS:
+            self._add(
+                self.dangerous,
+                node,
+                f"Dangerous function '{func_name}': {self.DANGEROUS_FUNCTIONS[func_name]}",
+            )
+
+        # Check for subprocess with shell=True
+        if func_name in self.SHELL_FUNCTIONS:
+            for keyword in node.keywords:
+                if keyword.arg == "shell" and self._is_true(keyword.value):
+                    self._add(
+                        self.dangerous,
+                        node,
+                        f"Dangerous: {func_name} with shell=True",
+                    )
 
-        if func_name in ["str.format", "format"] or func_name.endswith(".format"):
-            # Check if any argument contains SQL
+        # Check string format calls with SQL
+        if (
+            isinstance(node.func, ast.Attribute) and node.func.attr == "format"
+        ) or func_name == "format":
             for arg in node.args:
-                sql_str = self._extract_string(arg)
-                if sql_str and self.sql_re.search(sql_str):
-                    self.result.add_failure(
-                        file_path=self.file_path,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        message="Potential SQL injection: format() with SQL",
-                        code_snippet="sql.format(user_input)",
+                sql_str = self._string_value(arg)
+                if sql_str and self.SQL_RE.search(sql_str):
+                    self._add(
+                        self.sql,
+                        node,
+                        "Potential SQL injection: format() with SQL",
                     )
                     break
 
-        self.generic_visit(node)
-
-    def _extract_string(self, node: Union[ast.expr, ast.AST]) -> Optional[str]:
-        """Extract string value from AST node."""
-        if isinstance(node, ast.Str):
-            return node.s
-        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
-            return node.value
-        return None
-
-    def _get_function_name(self, node: Union[ast.expr, ast.AST]) -> str:
-        """Extract function name from AST node."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{node.value.__class__.__name__}.{node.attr}"
-        return ""
+        # Check for pickle.loads() calls
+        if self.has_pickle_import and func_name in self.PICKLE_LOADS:
+            self._add(
+                self.pickle,
+                node,
+                "Critical: Unpickling untrusted data can execute arbitrary code",
+            )
 
+        self.generic_visit(node)
 
-class PickleUsageVisitor(ast.NodeVisitor):
-    """Detects usage of pickle module."""
+    def visit_BinOp(self, node: ast.BinOp) -> None:
+        """Check string concatenation/formatting for SQL."""
+        if isinstance(node.op, (ast.Add, ast.Mod)):
+            # Check if left side contains SQL
+            left_str = self._string_value(node.left)
+            if left_str and self.SQL_RE.search(left_str):
+                self._add(
+                    self.sql,
+                    node,
+                    "Potential SQL injection: String concatenation with SQL",
+                )
 
-    def __init__(self, file_path: str, result: CheckResult):
-        self.file_path = file_path
-        self.result = result
-        self.has_pickle_import = False
+        self.generic_visit(node)
 
     def visit_Import(self, node: ast.Import) -> None:
         """Check for pickle imports."""
         for alias in node.names:
-            if alias.name in ["pickle", "cPickle"]:
+            if alias.name in self.PICKLE_MODULES:
                 self.has_pickle_import = True
-                self.result.add_failure(
-                    file_path=self.file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    message=f"Security risk: {alias.name} can execute arbitrary code during deserialization",
-                    code_snippet=f"import {alias.name}",
+                self._add(
+                    self.pickle,
+                    node,
+                    f"Security risk: {alias.name} can execute arbitrary code during deserialization",
                 )
 
         self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         """Check for pickle imports."""
-        if node.module in ["pickle", "cPickle"]:
+        if node.module in self.PICKLE_MODULES:
             self.has_pickle_import = True
-            self.result.add_failure(
-                file_path=self.file_path,
-                line=node.lineno,
-                column=node.col_offset,
-                message=f"Security risk: {node.module} can execute arbitrary code during deserialization",
-                code_snippet=f"from {node.module} import ...",
+            self._add(
+                self.pickle,
+                node,
+                f"Security risk: {node.module} can execute arbitrary code during deserialization",
             )
 
         self.generic_visit(node)
 
-    def visit_Call(self, node: ast.Call) -> None:
-        """Check for pickle.loads() calls."""
-        func_name = self._get_function_name(node.func)
-
-        if self.has_pickle_import and func_name in [
-            "pickle.loads",
-            "pickle.load",
-            "cPickle.loads",
-            "cPickle.load",
-        ]:
-            self.result.add_failure(
-                file_path=self.file_path,
-                line=node.lineno,
-                column=node.col_offset,
-                message="Critical: Unpickling untrusted data can execute arbitrary code",
-                code_snippet=func_name,
+    def _is_true(self, node: Union[ast.expr, ast.AST]) -> bool:
+        """Check if a node represents True."""
+        return isinstance(node, ast.Constant) and node.value is True
+
+
+class SecurityChecker(BaseChecker):
+    """Checks for security vulnerabilities and bad practices."""
+
+    interesting_nodes: ClassVar[FrozenSet[Type[ast.AST]]] = frozenset(
+        {ast.Assign, ast.Dict, ast.Call, ast.BinOp, ast.Import, ast.ImportFrom}
+    )
+    # Derived from the visitor's tables, so that both stay in sync
+    trigger_tokens: ClassVar[FrozenSet[str]] = SecurityVisitor.required_tokens()
+
+    @property
+    def name(self) -> str:
+        return "security"
+
+    @property
+    def description(self) -> str:
+        return "Security vulnerability detection"
+
+    @property
+    def category(self) -> str:
+        return "security"
+
+    def check(self, ast_tree: ast.AST, file_path: str) -> Optional[CheckResult]:
+        """Check for security issues in the AST."""
+        result = self.create_result()
+        resolver = scope_analyses.get(ast_tree).resolver
+
+        visitor = SecurityVisitor(file_path, result, resolver)
+        visitor.visit(ast_tree)
+        visitor.finalize()
+
+        # Set severity based on findings
+        if result.failure_count > 0:
+            # If any critical issues found, set to critical
+            for failure in result.failure_locations:
+                if (
+                    "password" in failure.message.lower()
+                    or "secret" in failure.message.lower()
+                ):
+                    result.severity = Severity.CRITICAL
+                    break
+                elif (
+                    "eval" in failure.message.lower()
+                    or "exec" in failure.message.lower()
+                ):
+                    result.severity = Severity.HIGH
+                elif result.severity != Severity.HIGH:
+                    result.severity = Severity.MEDIUM
+
+            # Add fix policy
+            result.fix_policy = (
+                "Security issues should be addressed immediately:\n"
+                "1. Never hardcode secrets - use environment variables or secure vaults\n"
+                "2. Avoid dangerous functions like eval() and exec()\n"
+                "3. Use parameterized queries to prevent SQL injection\n"
+                "4. Avoid pickle for untrusted data - use JSON instead"
             )
 
-        self.generic_visit(node)
+            return result
 
-    def _get_function_name(self, node: Union[ast.expr, ast.AST]) -> str:
-        """Extract function name from AST node."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
-            return f"{node.value.id}.{node.attr}"
-        return ""
+        return None
@@ -4,15 +4,50 @@ Test quality checkers.
 
 import ast
 import re
-from typing import List, Optional, Union
+from pathlib import Path
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from src_check.core.base import BaseChecker
+from src_check.core.functions import FunctionFacts, function_facts
+from src_check.core.modules import module_index
+from src_check.core.names import NameResolver
+from src_check.core.references import test_references
+from src_check.core.scopes import scope_analyses
 from src_check.models import CheckResult, Severity
 
+# A public function or method: qualified name, name, line, column
+PublicFunction = Tuple[str, str, int, int]
+
 
 class TestQualityChecker(BaseChecker):
     """Checks for test quality and coverage issues."""
 
+    interesting_nodes: ClassVar[FrozenSet[Type[ast.AST]]] = frozenset(
+        {ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Assert, ast.Call}
+    )
+
+    collects_project_data: ClassVar[bool] = True
+
+    # Keep pytest from collecting the checker as a test class
+    __test__: ClassVar[bool] = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Public functions of the non-test files seen since the last
+        # project phase, keyed by file path
+        self.definitions: Dict[str, List[PublicFunction]] = {}
+
     @property
     def name(self) -> str:
         return "test_quality"
@@ -32,18 +67,22 @@ class TestQualityChecker(BaseChecker):
         # Determine if this is a test file
         is_test_file = self._is_test_file(file_path)
 
+        module = module_index.module_name(file_path)
         if is_test_file:
-            # Check test file quality
-            visitors = [
+            # Check test file quality, and record what the tests refer to
+            references = TestReferencesVisitor(
+                scope_analyses.get(ast_tree).resolver, module
+            )
+            visitors: List[ast.NodeVisitor] = [
                 TestStructureVisitor(file_path, result),
                 TestAssertionVisitor(file_path, result),
                 TestNamingVisitor(file_path, result),
+                references,
             ]
         else:
             # Check for missing tests
-            visitors = [
-                MissingTestsVisitor(file_path, result),
-            ]
+            missing = MissingTestsVisitor(file_path, result, module)
+            visitors = [missing]
 
         for visitor in visitors:
             visitor.visit(ast_tree)
@@ -51,6 +90,11 @@ class TestQualityChecker(BaseChecker):
             if hasattr(visitor, "finalize"):
                 visitor.finalize()
 
+        if is_test_file:
+            test_references.add_file(file_path, references.names, references.attributes)
+        elif module:
+            self.definitions[file_path] = missing.definitions
+
         # Set severity based on findings
         if result.failure_count > 0:
             result.severity = Severity.MEDIUM
@@ -69,6 +113,75 @@ class TestQualityChecker(BaseChecker):
 
         return None
 
+    def check_project(self, project_root: Path) -> List[CheckResult]:
+        """Report public functions that no test in the project refers to.
+
+        A module-level function counts as tested when a test imports or
+        uses its qualified name; a method also counts when a test uses an
+        attribute of the same name. Projects without test files are not
+        reported on.
+        """
+        definitions, self.definitions = self.definitions, {}
+        if not len(test_references):
+            return []
+
+        result = self.create_result("Untested functions")
+        for file_path, functions in definitions.items():
+            for qualified_name, name, line, column in functions:
+                if test_references.is_referenced(qualified_name):
+                    continue
+                owner = qualified_name[: -len(name) - 1]
+                if owner not in module_index.modules and (
+                    test_references.uses_attribute(name)
+                ):
+                    continue  # A method, called on some instance
+                result.add_failure(
+                    file_path=file_path,
+                    line=line,
+                    column=column,
+                    message=f"Public function '{qualified_name}' is not referenced by any test",
+                )
+
+        if result.failure_count == 0:
+            return []
+        result.severity = Severity.LOW
+        result.fix_policy = (
+            "Add tests that import and exercise the untested functions, or make\n"
+            "them private if they are not part of the module's interface"
+        )
+        return [result]
+
+    def project_data(self, file_path: str) -> Optional[Any]:
+        """Return the test references or public functions of a file."""
+        if self._is_test_file(file_path):
+            names = test_references.file_names(file_path)
+            if names is None:
+                return {}
+            return {"references": sorted(names[0]), "attributes": sorted(names[1])}
+        definitions = self.definitions.get(file_path)
+        if definitions is None:
+            return {}
+        return {"definitions": [list(function) for function in definitions]}
+
+    def restore_project_data(self, file_path: str, data: Any) -> None:
+        """Record the test references or public functions of a cached file."""
+        if "references" in data:
+            test_references.add_file(file_path, data["references"], data["attributes"])
+        if "definitions" in data:
+            self.definitions[file_path] = [
+                (qualified_name, name, line, column)
+                for qualified_name, name, line, column in data["definitions"]
+            ]
+
+    def cache_context(self, file_path: str) -> str:
+        """Tell test files apart, which the full path decides.
+
+        The dotted module name also goes in: the qualified names a file
+        defines or refers to change with the packages around it.
+        """
+        kind = "test" if self._is_test_file(file_path) else ""
+        return f"{kind}:{module_index.module_name(file_path) or ''}"
+
     def _is_test_file(self, file_path: str) -> bool:
         """Check if file is a test file."""
         return "test" in file_path.lower() or file_path.endswith("_test.py")
@@ -190,7 +303,8 @@ class TestAssertionVisitor(ast.NodeVisitor):
                         line=node.lineno,
                         column=node.col_offset,
                         message="Trivial assertion: 'assert True'",
-                        code_snippet="assert True",
+                        end_line=node.end_lineno,
+                        end_column=node.end_col_offset,
                     )
                 elif node.test.value is False:
                     self.result.add_failure(
@@ -198,7 +312,8 @@ class TestAssertionVisitor(ast.NodeVisitor):
                         line=node.lineno,
                         column=node.col_offset,
                         message="Test will always fail: 'assert False'",
-                        code_snippet="assert False",
+                        end_line=node.end_lineno,
+                        end_column=node.end_col_offset,
                     )
 
         self.generic_visit(node)
@@ -295,29 +410,78 @@ class TestNamingVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
+class TestReferencesVisitor(ast.NodeVisitor):
+    """Collects the qualified names and attributes a test file refers to."""
+
+    def __init__(self, resolver: NameResolver, module: Optional[str] = None):
+        self.resolver = resolver
+        # Dotted name of the test file, for resolving relative imports
+        self.module = module
+        self.names: Set[str] = set()
+        self.attributes: Set[str] = set()
+
+    def visit_Import(self, node: ast.Import) -> None:
+        """Record imported modules."""
+        for alias in node.names:
+            self.names.add(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        """Record imported names under their qualified names."""
+        package = node.module or ""
+        if node.level:
+            if self.module is None:
+                return
+            parts = self.module.split(".")[: -node.level]
+            package = ".".join(part for part in [*parts, package] if part)
+        for alias in node.names:
+            if alias.name != "*":
+                self.names.add(f"{package}.{alias.name}" if package else alias.name)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        """Record names used, resolved through the imports."""
+        if isinstance(node.ctx, ast.Load):
+            self.names.add(self.resolver.qualified(node) or node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        """Record attribute chains used, and the attribute names themselves."""
+        if isinstance(node.ctx, ast.Load):
+            self.attributes.add(node.attr)
+            name = self.resolver.qualified(node)
+            if name is not None:
+                self.names.add(name)
+        self.generic_visit(node)
+
+
 class MissingTestsVisitor(ast.NodeVisitor):
     """Detects functions that might be missing tests."""
 
-    def __init__(self, file_path: str, result: CheckResult):
+    def __init__(
+        self, file_path: str, result: CheckResult, module: Optional[str] = None
+    ):
         self.file_path = file_path
         self.result = result
-        self.public_functions: List[Union[ast.FunctionDef, ast.AsyncFunctionDef]] = []
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Track public functions."""
-        # Skip private functions and special methods
-        if not node.name.startswith("_") and not self._is_simple_accessor(node):
-            self.public_functions.append(node)
-
-        self.generic_visit(node)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Track async public functions."""
-        # Skip private functions and special methods
-        if not node.name.startswith("_") and not self._is_simple_accessor(node):
-            self.public_functions.append(node)
-
-        self.generic_visit(node)
+        self.public_functions: List[FunctionFacts] = []
+        # Module-level functions and methods of module-level classes, by
+        # qualified name, if the dotted name of the file is known
+        self.definitions: List[PublicFunction] = []
+        self.module = module
+
+    def visit_Module(self, node: ast.Module) -> None:
+        """Track public functions from the shared facts."""
+        for function in function_facts.get(node):
+            # Skip private functions, special methods and simple accessors
+            if function.name.startswith("_") or function.returns_attribute:
+                continue
+            self.public_functions.append(function)
+            if self.module and not function.is_nested:
+                self.definitions.append(
+                    (
+                        f"{self.module}.{function.qualname}",
+                        function.name,
+                        function.line,
+                        function.column,
+                    )
+                )
 
     def finalize(self) -> None:
         """Report findings after visiting."""
@@ -330,16 +494,3 @@ class MissingTestsVisitor(ast.NodeVisitor):
                 message=f"File has {len(self.public_functions)} public functions - consider adding tests",
                 code_snippet=f"Functions: {', '.join(f.name for f in self.public_functions[:3])}...",
             )
-
-    def _is_simple_accessor(
-        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
-    ) -> bool:
-        """Check if function is a simple getter/setter."""
-        # Simple heuristic: function with one line that returns an attribute
-        if len(node.body) == 1:
-            stmt = node.body[0]
-            if isinstance(stmt, ast.Return) and isinstance(
-                stmt.value, (ast.Attribute, ast.Name)
-            ):
-                return True
-        return False
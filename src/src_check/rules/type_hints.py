@@ -2,9 +2,10 @@
 
 import ast
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import ClassVar, FrozenSet, List, Optional, Tuple, Type
 
 from src_check.core.base import BaseChecker
+from src_check.core.functions import FunctionFacts, function_facts
 from src_check.models.check_result import CheckResult, Severity
 
 
@@ -30,92 +31,75 @@ class TypeHintVisitor(ast.NodeVisitor):
             "Tuple",
         }
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Check function type hints."""
-        self._check_function_type_hints(node)
-        self.generic_visit(node)
+    def visit_Module(self, node: ast.Module) -> None:
+        """Check the type hints of every function from the shared facts."""
+        for function in function_facts.get(node):
+            self._check_function_type_hints(function)
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Check async function type hints."""
-        self._check_function_type_hints(node)
-        self.generic_visit(node)
-
-    def _check_function_type_hints(
-        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
-    ) -> None:
+    def _check_function_type_hints(self, function: FunctionFacts) -> None:
         """Check type hints for a function.
 
         Args:
-            node: The function node to check
+            function: Facts of the function to check
         """
         # Skip private methods and special methods
-        if node.name.startswith("_") and node.name != "__init__":
+        if function.name.startswith("_") and function.name != "__init__":
             return
 
-        # Get function signature info
-        args = node.args
-
         # Check parameters (skip 'self' and 'cls')
-        params_to_check = []
-        if args.args:
-            skip_first = False
-            if args.args[0].arg in ("self", "cls"):
-                skip_first = True
-            params_to_check = args.args[1:] if skip_first else args.args
+        params_to_check = function.positional_args()
+        if params_to_check and params_to_check[0].name in ("self", "cls"):
+            params_to_check = params_to_check[1:]
 
         # Check parameter type hints
         for param in params_to_check:
             if param.annotation is None:
                 self.issues.append(
                     (
-                        node.lineno,
-                        f"Function '{node.name}' parameter '{param.arg}' missing type hint",
+                        function.line,
+                        f"Function '{function.name}' parameter '{param.name}' missing type hint",
                     )
                 )
 
         # Check return type hint (except for __init__)
-        if node.name != "__init__" and node.returns is None:
+        if function.name != "__init__" and function.returns is None:
             self.issues.append(
-                (node.lineno, f"Function '{node.name}' missing return type hint")
+                (function.line, f"Function '{function.name}' missing return type hint")
             )
 
         # Check for generic types without parameters
-        self._check_generic_types(node)
+        self._check_generic_types(function)
 
-    def _check_generic_types(
-        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
-    ) -> None:
+    def _check_generic_types(self, function: FunctionFacts) -> None:
         """Check for generic types that should have type parameters.
 
         Args:
-            node: The function node to check
+            function: Facts of the function to check
         """
         # Check parameter annotations
-        for arg in node.args.args:
+        for arg in function.positional_args():
             if arg.annotation:
                 self._check_annotation(
-                    arg.annotation, node.lineno, f"parameter '{arg.arg}'"
+                    arg.annotation, function.line, f"parameter '{arg.name}'"
                 )
 
         # Check return annotation
-        if node.returns:
-            self._check_annotation(node.returns, node.lineno, "return type")
+        if function.returns:
+            self._check_annotation(function.returns, function.line, "return type")
 
-    def _check_annotation(
-        self, annotation: ast.expr, lineno: int, context: str
-    ) -> None:
+    def _check_annotation(self, annotation: str, lineno: int, context: str) -> None:
         """Check if annotation uses generic types without parameters.
 
         Args:
-            annotation: The annotation to check
+            annotation: Text of the annotation to check
             lineno: Line number for error reporting
             context: Context description (e.g., "parameter 'x'")
         """
-        if isinstance(annotation, ast.Name) and annotation.id in self.generic_types:
+        if annotation in self.generic_types:
             self.issues.append(
                 (
                     lineno,
-                    f"Generic type '{annotation.id}' used without type parameters in {context}",
+                    f"Generic type '{annotation}' used without type parameters in {context}",
                 )
             )
 
@@ -123,6 +107,10 @@ class TypeHintVisitor(ast.NodeVisitor):
 class TypeHintChecker(BaseChecker):
     """Check type hint quality and completeness."""
 
+    interesting_nodes: ClassVar[FrozenSet[Type[ast.AST]]] = frozenset(
+        {ast.FunctionDef, ast.AsyncFunctionDef}
+    )
+
     @property
     def name(self) -> str:
         """Return checker name."""
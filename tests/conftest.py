@@ -2,6 +2,7 @@
 pytest configuration and shared fixtures.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -12,6 +13,18 @@ src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
 
+@pytest.fixture(autouse=True, scope="session")
+def isolated_user_cache(tmp_path_factory):
+    """Keep cached manifests and indexes out of the real user cache."""
+    original = os.environ.get("XDG_CACHE_HOME")
+    os.environ["XDG_CACHE_HOME"] = str(tmp_path_factory.mktemp("xdg-cache"))
+    yield
+    if original is None:
+        os.environ.pop("XDG_CACHE_HOME", None)
+    else:
+        os.environ["XDG_CACHE_HOME"] = original
+
+
 @pytest.fixture
 def temp_python_file(tmp_path):
     """Create a temporary Python file for testing."""
@@ -0,0 +1,150 @@
+"""
+Tests for the shared import graph and project-wide architecture metrics.
+"""
+
+from pathlib import Path
+
+from src_check.core.engine import AnalysisEngine
+from src_check.core.import_graph import ImportGraph, import_graph
+from src_check.rules.architecture import ArchitectureChecker, layer_mask
+
+
+def chain_graph() -> ImportGraph:
+    """Build ui -> services -> models and a separate leaf module."""
+    graph = ImportGraph()
+    graph.set_imports("app.ui", "ui.py", {"app.services"})
+    graph.set_imports("app.services", "services.py", {"app.models"})
+    graph.set_imports("app.models", "models.py", set())
+    graph.set_imports("app.other", "other.py", {"app.models"})
+    return graph
+
+
+class TestImportGraph:
+    """Tests for ImportGraph."""
+
+    def test_metrics(self):
+        """Test fan-in, fan-out and instability."""
+        graph = chain_graph()
+
+        models = graph.metrics("app.models")
+        services = graph.metrics("app.services")
+
+        assert (models.fan_in, models.fan_out) == (2, 0)
+        assert models.instability == 0.0
+        assert services.instability == 0.5
+
+    def test_retain_drops_deleted_modules(self):
+        """Test that modules not retained disappear with their edges."""
+        graph = chain_graph()
+
+        graph.retain(["app.services", "app.models", "app.other"])
+
+        assert "app.ui" not in graph
+        assert graph.metrics("app.services").fan_in == 0
+
+    def test_path(self):
+        """Test the shortest path to a matching module."""
+        graph = chain_graph()
+
+        assert graph.path("app.ui", lambda m: m == "app.models") == [
+            "app.ui",
+            "app.services",
+            "app.models",
+        ]
+        assert graph.path("app.models", lambda m: m == "app.ui") == []
+
+    def test_unchanged_imports_are_a_no_op(self):
+        """Test that re-recording the same imports invalidates nothing."""
+        graph = chain_graph()
+        reachability = graph.reachability(layer_mask)
+        reachability.mask("app.ui")
+        recomputed = reachability.recomputed
+
+        assert not graph.set_imports("app.services", "services.py", {"app.models"})
+        reachability.mask("app.ui")
+
+        assert reachability.recomputed == recomputed
+
+
+class TestLabelReachability:
+    """Tests for LabelReachability."""
+
+    def test_masks_are_transitive(self):
+        """Test that the labels of indirect imports are reached."""
+        graph = chain_graph()
+        reachability = graph.reachability(layer_mask)
+
+        assert reachability.mask("app.ui") == layer_mask("app.ui") | layer_mask(
+            "app.models"
+        ) | layer_mask("app.services")
+        assert reachability.mask("app.models") == layer_mask("app.models")
+
+    def test_trackers_are_shared_per_label(self):
+        """Test that a labelling keeps one tracker for the graph's lifetime."""
+        graph = chain_graph()
+
+        assert graph.reachability(layer_mask) is graph.reachability(layer_mask)
+
+    def test_only_importers_are_recomputed(self):
+        """Test that a change recomputes the module and its importers only."""
+        graph = chain_graph()
+        reachability = graph.reachability(layer_mask)
+        reachability.mask("app.ui")
+        before = reachability.recomputed
+
+        graph.set_imports("app.services", "services.py", {"app.models", "app.ui"})
+        reachability.mask("app.ui")
+
+        # services and its importer ui, but not models or other
+        assert reachability.recomputed - before == 2
+        assert reachability.mask("app.services") & layer_mask("app.ui")
+
+
+class TestArchitectureChecker:
+    """Tests for ArchitectureChecker.check_project."""
+
+    def test_transitive_layer_violation(self, tmp_path: Path):
+        """Test a data module reaching the ui layer through a helper."""
+        package = tmp_path / "app"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "models.py").write_text("from app import helpers\n")
+        (package / "helpers.py").write_text("from app import views\n")
+        (package / "views.py").write_text("X = 1\n")
+
+        results = AnalysisEngine([ArchitectureChecker()]).analyze_directory(tmp_path)
+
+        (result,) = [
+            r for r in results[str(tmp_path)] if r.title == "Project architecture"
+        ]
+        (failure,) = result.failure_locations
+        assert failure.file_path == str(package / "models.py")
+        assert failure.message == (
+            "Transitive layer violation: data layer reaches ui layer via "
+            "app.models -> app.helpers -> app.views"
+        )
+
+    def test_hub_module(self, tmp_path: Path):
+        """Test that a module with high fan-in and fan-out is reported."""
+        package = tmp_path / "pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        count = ArchitectureChecker.MAX_FAN_IN + 1
+        imports = "".join(f"from pkg import leaf{i}\n" for i in range(count))
+        (package / "hub.py").write_text(imports)
+        for i in range(count):
+            (package / f"leaf{i}.py").write_text("")
+            (package / f"user{i}.py").write_text("from pkg import hub\n")
+
+        results = AnalysisEngine([ArchitectureChecker()]).analyze_directory(tmp_path)
+
+        messages = [
+            loc.message
+            for r in results[str(tmp_path)]
+            if r.title == "Project architecture"
+            for loc in r.failure_locations
+        ]
+        assert messages == [
+            f"Hub module: fan-in {count}, fan-out {count} (instability 0.50)"
+        ]
+        assert import_graph.metrics("pkg.hub").fan_out == count
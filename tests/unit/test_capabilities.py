@@ -0,0 +1,136 @@
+"""
+Tests for checker capability flags and the import scanner.
+"""
+
+import ast
+import logging
+from pathlib import Path
+
+from src_check.core.cache import MemoryResultCache
+from src_check.core.engine import AnalysisEngine
+from src_check.core.imports import scan_imports
+from src_check.rules.dependency import DependencyChecker
+from src_check.rules.license import LicenseChecker
+from src_check.rules.security import SecurityChecker
+
+BROKEN_MODULE = """import os
+from json import (
+    dumps,
+    loads,
+)
+
+def broken(:
+    pass
+"""
+
+
+def imported_names(module: ast.Module):
+    """List the imported module names of a scanned module."""
+    names = []
+    for node in module.body:
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            names.append(node.module)
+    return names
+
+
+class TestScanImports:
+    """Tests for scan_imports."""
+
+    def test_matches_parsed_imports(self):
+        """Test that the scanner finds the same imports as the parser."""
+        source = (
+            "import os, sys\n"
+            "from typing import (\n"
+            "    Dict,\n"
+            "    List,  # comment\n"
+            ")\n"
+            "def f():\n"
+            "    import json\n"
+        )
+        scanned = scan_imports(source)
+        parsed = [
+            node
+            for node in ast.walk(ast.parse(source))
+            if isinstance(node, (ast.Import, ast.ImportFrom))
+        ]
+
+        assert [ast.dump(n) for n in scanned.body] == [ast.dump(n) for n in parsed]
+        assert [n.lineno for n in scanned.body] == [1, 2, 7]
+        assert scanned.body[2].col_offset == 4
+
+    def test_skips_imports_inside_strings(self):
+        """Test that import lines inside docstrings are ignored."""
+        source = '"""Usage:\n\nimport fake\n"""\nimport real\n'
+
+        assert imported_names(scan_imports(source)) == ["real"]
+
+    def test_works_on_unparsable_source(self):
+        """Test that a syntax error elsewhere does not hide the imports."""
+        assert imported_names(scan_imports(BROKEN_MODULE)) == ["os", "json"]
+
+
+class TestCapabilities:
+    """Tests for how the engine honours capability flags."""
+
+    def test_text_only_checker_runs_on_unparsable_file(self, tmp_path: Path):
+        """Test that the license header check survives a syntax error."""
+        (tmp_path / "pyproject.toml").write_text("")
+        (tmp_path / "LICENSE").write_text("MIT License\n")
+        broken = tmp_path / "broken.py"
+        broken.write_text(BROKEN_MODULE)
+        engine = AnalysisEngine([LicenseChecker(), SecurityChecker()])
+
+        results = engine.analyze_file(broken)
+
+        messages = [loc.message for r in results for loc in r.failure_locations]
+        assert "Missing copyright header" in messages
+        assert engine.stats["license"].runs == 1
+        assert engine.stats["security"].runs == 0
+
+    def test_no_parse_without_ast_checkers(self, tmp_path: Path, caplog):
+        """Test that the file is not parsed when no checker needs the AST."""
+        broken = tmp_path / "broken.py"
+        broken.write_text(BROKEN_MODULE)
+        engine = AnalysisEngine([LicenseChecker(), DependencyChecker()])
+
+        with caplog.at_level(logging.ERROR):
+            engine.analyze_file(broken)
+
+        assert "Error parsing" not in caplog.text
+
+    def test_import_only_checker_gets_imports(self, tmp_path: Path):
+        """Test that import-only checkers see imports of unparsable files."""
+        broken = tmp_path / "broken.py"
+        broken.write_text(BROKEN_MODULE)
+        checker = DependencyChecker()
+
+        AnalysisEngine([checker]).analyze_file(broken)
+
+        assert checker.file_imports[str(broken)] == {"os", "json"}
+
+    def test_project_only_checker_reports_per_directory(self, tmp_path: Path):
+        """Test that project-level findings are reported under the directory."""
+        (tmp_path / "requirements.txt").write_text("requests\n")
+        (tmp_path / "main.py").write_text("import os\n")
+        engine = AnalysisEngine([DependencyChecker()])
+
+        results = engine.analyze_directory(tmp_path)
+
+        assert list(results) == [str(tmp_path)]
+        rule_ids = {r.rule_id for r in results[str(tmp_path)]}
+        assert {"DEP002", "DEP006"} <= rule_ids
+
+    def test_project_only_checker_sees_cached_files(self, tmp_path: Path):
+        """Test that cache hits still feed project-only checkers."""
+        (tmp_path / "main.py").write_text("import yaml\n")
+        cache = MemoryResultCache()
+        AnalysisEngine([DependencyChecker()], cache=cache).analyze_directory(tmp_path)
+        checker = DependencyChecker()
+        engine = AnalysisEngine([checker], cache=cache)
+
+        engine.analyze_directory(tmp_path)
+
+        assert engine.cache_hits == 1
+        assert checker.project_imports == {"yaml"}
@@ -0,0 +1,120 @@
+"""
+Tests for skipping checkers whose declared triggers are absent from a file.
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from src_check.core.engine import AnalysisEngine
+from src_check.core.profile import FileProfile
+from src_check.rules.code_quality import CodeQualityChecker
+from src_check.rules.performance import PerformanceChecker
+from src_check.rules.security import SecurityChecker
+
+DATACLASS_MODULE = '''"""Plain data holders."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Point:
+    """A point."""
+
+    x: int
+    y: int
+'''
+
+EVAL_MODULE = """def run(expr):
+    return eval(expr)
+"""
+
+
+class NoInterestChecker(SecurityChecker):
+    """Security checker that runs on every file."""
+
+    interesting_nodes = None
+    trigger_tokens = None
+
+
+def findings(results):
+    """Reduce results to comparable tuples."""
+    return sorted(
+        (r.checker_name, loc.line, loc.message)
+        for file_results in results.values()
+        for r in file_results
+        for loc in r.failure_locations
+    )
+
+
+class TestFileProfile:
+    """Tests for FileProfile."""
+
+    def test_node_histogram(self):
+        """Test that node types are counted."""
+        profile = FileProfile(ast.parse("a = 1\nb = 2\n"), "a = 1\nb = 2\n")
+
+        assert profile.node_types[ast.Assign] == 2
+        assert ast.Call not in profile.node_types
+
+    def test_token_lookup_ignores_case(self):
+        """Test that tokens are found regardless of case."""
+        source = "QUERY = 'SELECT 1'\n"
+        profile = FileProfile(ast.parse(source), source)
+
+        assert profile.has_token("select")
+        assert not profile.has_token("pickle")
+
+    def test_skips_checker_without_matching_nodes(self):
+        """Test that node interests alone can rule a checker out."""
+        profile = FileProfile(ast.parse(DATACLASS_MODULE), DATACLASS_MODULE)
+
+        assert not profile.may_trigger(PerformanceChecker())
+        assert not profile.may_trigger(SecurityChecker())
+
+    def test_undeclared_checker_always_runs(self):
+        """Test that checkers without declarations are never skipped."""
+        profile = FileProfile(ast.parse("pass\n"), "pass\n")
+
+        assert profile.may_trigger(CodeQualityChecker())
+        assert profile.may_trigger(NoInterestChecker())
+
+
+class TestEngineSkipping:
+    """Tests for trigger-based skipping in AnalysisEngine."""
+
+    def test_security_skipped_on_dataclass_module(self, tmp_path: Path):
+        """Test that the security checker does not run on plain data."""
+        (tmp_path / "point.py").write_text(DATACLASS_MODULE)
+        engine = AnalysisEngine([SecurityChecker()])
+
+        engine.analyze_directory(tmp_path)
+
+        assert engine.stats["security"].skipped == 1
+        assert engine.stats["security"].runs == 0
+
+    def test_security_still_finds_eval(self, tmp_path: Path):
+        """Test that files containing a trigger are still checked."""
+        (tmp_path / "run.py").write_text(EVAL_MODULE)
+        engine = AnalysisEngine([SecurityChecker()])
+
+        results = engine.analyze_directory(tmp_path)
+
+        assert engine.stats["security"].runs == 1
+        assert any("eval" in message for _, _, message in findings(results))
+
+    @pytest.mark.parametrize("source", [DATACLASS_MODULE, EVAL_MODULE])
+    def test_output_parity(self, tmp_path: Path, source: str):
+        """Test that skipping never changes the findings."""
+        (tmp_path / "module.py").write_text(source)
+        filtered = AnalysisEngine([SecurityChecker(), PerformanceChecker()])
+        unfiltered = AnalysisEngine([NoInterestChecker()])
+
+        filtered_findings = [
+            f
+            for f in findings(filtered.analyze_directory(tmp_path))
+            if f[0] == "security"
+        ]
+
+        assert filtered_findings == findings(unfiltered.analyze_directory(tmp_path))
@@ -0,0 +1,94 @@
+"""
+Tests for the single-pass McCabe complexity computation.
+"""
+
+import ast
+import time
+
+from src_check.core.functions import extract_functions
+from src_check.rules.code_quality import CodeQualityChecker
+
+
+def complexities(source: str):
+    """Map function names to their complexity."""
+    return {f.name: f.complexity for f in extract_functions(ast.parse(source))}
+
+
+class TestFunctionComplexities:
+    """Tests for the complexity recorded by extract_functions."""
+
+    def test_decision_points(self):
+        """Test branches, boolean operators, handlers and comprehensions."""
+        source = (
+            "def f(xs):\n"
+            "    if xs and xs[0] or not xs:\n"
+            "        pass\n"
+            "    for x in xs:\n"
+            "        assert x\n"
+            "    try:\n"
+            "        pass\n"
+            "    except ValueError:\n"
+            "        pass\n"
+            "    return [x for x in xs if x]\n"
+        )
+
+        # 1 + if + and/or (2) + for + assert + except + comprehension
+        assert complexities(source) == {"f": 8}
+
+    def test_nested_functions_are_counted_once(self):
+        """Test that a nested function's branches do not count for its parent."""
+        source = (
+            "def outer(x):\n"
+            "    if x:\n"
+            "        pass\n"
+            "    async def inner(y):\n"
+            "        while y:\n"
+            "            if y:\n"
+            "                pass\n"
+            "    return inner\n"
+        )
+
+        assert complexities(source) == {"outer": 2, "inner": 3}
+
+    def test_source_order(self):
+        """Test that functions are listed in source order."""
+        source = "def a():\n    def b():\n        pass\n\ndef c():\n    pass\n"
+
+        names = [f.name for f in extract_functions(ast.parse(source))]
+
+        assert names == ["a", "b", "c"]
+
+    def test_deep_nesting_is_linear(self):
+        """Test deeply nested functions, each with many branches."""
+        depth, branches = 90, 20
+        lines = []
+        for level in range(depth):
+            indent = "    " * level
+            lines.append(f"{indent}def level_{level}(x):")
+            for branch in range(branches):
+                lines.append(f"{indent}    if x == {branch}:")
+                lines.append(f"{indent}        x += 1")
+        lines.append("    " * depth + "return x")
+        tree = ast.parse("\n".join(lines))
+
+        started = time.perf_counter()
+        found = extract_functions(tree)
+
+        assert {f.complexity for f in found} == {branches + 1}
+        assert time.perf_counter() - started < 5
+
+
+class TestCodeQualityChecker:
+    """Tests for complexity findings of CodeQualityChecker."""
+
+    def test_reports_complex_nested_function_only(self):
+        """Test that a simple parent of a complex function is not reported."""
+        branches = "".join(
+            f"        if y == {i}:\n            y += 1\n" for i in range(11)
+        )
+        source = f"def outer(x):\n    def inner(y):\n{branches}        return y\n"
+
+        result = CodeQualityChecker().check(ast.parse(source), "example.py")
+
+        messages = [loc.message for loc in result.failure_locations]
+        assert messages == ["Function 'inner' is too complex (complexity: 12, max: 10)"]
@@ -0,0 +1,174 @@
+"""
+Tests for the resident daemon and its thin client.
+"""
+
+import contextlib
+import io
+import threading
+
+import pytest
+
+from src_check.cli.client import main as client_main
+from src_check.cli.client import reads_stdin, run_remote, send_request
+from src_check.cli.daemon import DaemonServer, socket_in_use
+from src_check.core.import_graph import import_graph
+from src_check.models.source_lines import source_lines
+from src_check.rules.architecture import layer_mask
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon on a temporary socket for the duration of a test."""
+    socket_path = str(tmp_path / "daemon.sock")
+    server = DaemonServer(socket_path, max_workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def forward(daemon, argv, cwd, **extra):
+    """Forward an invocation to the daemon and capture its output."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    request = {"argv": argv, "cwd": str(cwd), **extra}
+    code = send_request(request, daemon.socket_path, stdout, stderr)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+class TestDaemon:
+    """Test running analyses through the daemon."""
+
+    def test_forwarded_run_streams_output(self, daemon, tmp_path):
+        """Test that a forwarded run reports results and the exit code."""
+        (tmp_path / "app.py").write_text("eval('1 + 1')\n")
+
+        code, stdout, _ = forward(daemon, [".", "--format", "json"], tmp_path)
+
+        assert code == 0
+        assert "Starting code quality analysis" in stdout
+        assert "Dangerous function 'eval'" in stdout
+
+    def test_repeated_runs_use_warm_cache(self, daemon, tmp_path):
+        """Test that the in-memory cache survives between runs."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+
+        forward(daemon, ["."], tmp_path)
+        code, stdout, _ = forward(daemon, [".", "--verbose"], tmp_path)
+
+        assert code == 0
+        assert "Cache: 1 hits, 0 misses" in stdout
+        assert daemon.requests_served == 2
+
+    def test_source_lines_are_kept_for_one_request(self, daemon, tmp_path):
+        """Test that file contents do not pile up across requests."""
+        for name in ("first", "second"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "app.py").write_text("eval('1 + 1')\n")
+
+        forward(daemon, [str(tmp_path / "first")], tmp_path)
+        forward(daemon, [str(tmp_path / "second")], tmp_path)
+
+        assert source_lines.lines(str(tmp_path / "first" / "app.py")) is None
+        assert source_lines.lines(str(tmp_path / "second" / "app.py")) is not None
+
+    def test_layer_reachability_survives_requests(self, daemon, tmp_path):
+        """Test that an unchanged project recomputes no reachability masks."""
+        package = tmp_path / "app"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "models.py").write_text("from app import helpers\n")
+        (package / "helpers.py").write_text("from app import views\n")
+        (package / "views.py").write_text("X = 1\n")
+        argv = [str(tmp_path), "--format", "json"]
+
+        forward(daemon, argv, tmp_path)
+        reachability = import_graph.reachability(layer_mask)
+        recomputed = reachability.recomputed
+        code, stdout, _ = forward(daemon, argv, tmp_path)
+
+        assert code == 0
+        assert "Transitive layer violation" in stdout
+        assert import_graph.reachability(layer_mask) is reachability
+        assert reachability.recomputed == recomputed
+
+    def test_exit_codes_are_forwarded(self, daemon, tmp_path):
+        """Test that errors inside the run become the client's exit code."""
+        code, _, stderr = forward(daemon, ["missing_dir"], tmp_path)
+
+        assert code == 3
+        assert "does not exist" in stderr
+
+    def test_subcommands_are_rejected(self, daemon, tmp_path):
+        """Test that server subcommands cannot be started inside the daemon."""
+        code, _, stderr = forward(daemon, ["daemon"], tmp_path)
+
+        assert code == 2
+        assert "cannot be run through the daemon" in stderr
+
+    def test_file_list_is_read_from_the_request(self, daemon, tmp_path):
+        """Test that --stdin-filelist uses the list sent by the client."""
+        (tmp_path / "listed.py").write_text("eval('1 + 1')\n")
+        (tmp_path / "other.py").write_text("exec('x = 1')\n")
+
+        code, stdout, _ = forward(
+            daemon, ["--stdin-filelist"], tmp_path, stdin="listed.py\n"
+        )
+
+        assert code == 0
+        assert "Dangerous function 'eval'" in stdout
+        assert "Dangerous function 'exec'" not in stdout
+
+    def test_file_list_without_stdin_is_rejected(self, daemon, tmp_path):
+        """Test that a request cannot make the daemon read its own stdin."""
+        code, _, stderr = forward(daemon, ["--stdin-file"], tmp_path)
+
+        assert code == 2
+        assert "--stdin-filelist needs the file list" in stderr
+
+    def test_status_command(self, daemon):
+        """Test the status command."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = send_request({"command": "status"}, daemon.socket_path, stdout, stderr)
+
+        assert code == 0
+        assert "src-check daemon running" in stdout.getvalue()
+        assert socket_in_use(daemon.socket_path)
+
+
+def test_client_sends_stdin_for_file_lists(daemon, tmp_path, monkeypatch, capsys):
+    """Test that the client forwards its stdin along with --stdin-filelist."""
+    (tmp_path / "listed.py").write_text("eval('1 + 1')\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.stdin", io.StringIO("listed.py\0"))
+
+    assert run_remote(["--stdin-filelist"], daemon.socket_path) == 0
+    assert "Dangerous function 'eval'" in capsys.readouterr().out
+
+
+def test_reads_stdin():
+    """Test recognizing --stdin-filelist and its abbreviations."""
+    assert reads_stdin([".", "--stdin-filelist"])
+    assert reads_stdin(["--stdin"])
+    assert not reads_stdin(["--st"])
+    assert not reads_stdin(["--staged"])
+    assert not reads_stdin(["--", "--stdin-filelist"])
+
+
+def test_client_without_daemon_reports_no_connection(tmp_path):
+    """Test that the client detects a missing daemon."""
+    assert run_remote(["."], str(tmp_path / "missing.sock")) is None
+
+
+def test_client_without_daemon_keeps_stdin(tmp_path, monkeypatch, capsys):
+    """Test that the in-process fallback still gets the stdin file list."""
+    (tmp_path / "listed.py").write_text("eval('1 + 1')\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SRC_CHECK_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+    monkeypatch.setattr("sys.argv", ["src-check-client", "--stdin-filelist"])
+    monkeypatch.setattr("sys.stdin", io.StringIO("listed.py\n"))
+
+    with contextlib.suppress(SystemExit):
+        client_main()
+
+    assert "Dangerous function 'eval'" in capsys.readouterr().out
@@ -0,0 +1,192 @@
+"""廃止予定APIカタログと対象バージョンによる絞り込みのテスト."""
+
+import ast
+import json
+
+from src_check.core.cache import LocalResultCache
+from src_check.core.engine import AnalysisEngine
+from src_check.core.target_version import TargetVersions, parse_requires_python
+from src_check.models import Severity
+from src_check.rules.deprecation import (
+    DeprecationChecker,
+    DeprecationVisitor,
+    DispatchTable,
+    dispatch_table,
+    load_catalog,
+)
+
+
+def messages(source: str, target_version=(3, 8)):
+    """指定バージョン向けにチェックしたメッセージの一覧を返す."""
+    result = DeprecationChecker(target_version).check(ast.parse(source), "test.py")
+    return [] if result is None else [f.message for f in result.failure_locations]
+
+
+def test_parse_requires_python():
+    """requires-python の下限を取り出す."""
+    assert parse_requires_python(">=3.8") == (3, 8)
+    assert parse_requires_python(">=3.9, <4") == (3, 9)
+    assert parse_requires_python("~=3.10.2") == (3, 10)
+    assert parse_requires_python("==3.11.*") == (3, 11)
+    assert parse_requires_python("<4") is None
+
+
+def test_target_version_from_pyproject(tmp_path):
+    """プロジェクトの pyproject.toml から対象バージョンを読み、無ければ既定値."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\nrequires-python = ">=3.10"\n'
+    )
+    (project / "mod.py").write_text("x = 1\n")
+    versions = TargetVersions(default=(3, 7))
+
+    assert versions.of(project / "mod.py") == (3, 10)
+    assert versions.of_root(tmp_path) == (3, 7)
+
+
+def test_rules_are_pruned_by_version():
+    """代替手段が使えないバージョン向けの表にはルールが入らない."""
+    assert "typing.List" not in dispatch_table((3, 8)).imports
+    assert "typing.List" in dispatch_table((3, 9)).imports
+    assert "asyncio.ensure_future" not in dispatch_table((3, 6)).calls
+    assert "imp" in dispatch_table((3, 6)).modules
+    assert dispatch_table((3, 9)) is dispatch_table((3, 9))
+
+
+def test_typing_rules_follow_target_version():
+    """DEPR005 は実行中のPythonではなく対象バージョンで判定する."""
+    source = "from typing import List, Dict\n"
+
+    assert messages(source, (3, 8)) == []
+    assert messages(source, (3, 9)) == [
+        "DEPR005: Python 3.9+では 'typing.List' の代わりに 'list' を使用できます",
+        "DEPR005: Python 3.9+では 'typing.Dict' の代わりに 'dict' を使用できます",
+    ]
+    assert messages("from __future__ import annotations\n" + source, (3, 9)) == []
+
+
+def test_decorators_match_qualified_names():
+    """asyncio.coroutine だけを報告し、types.coroutine は報告しない."""
+    source = """
+import types
+from asyncio import coroutine as co
+
+@co
+def old():
+    pass
+
+@types.coroutine
+def fine():
+    pass
+"""
+    assert messages(source) == [
+        "DEPR004: '@coroutine' デコレータは廃止予定です。'async def' を使用してください"
+    ]
+
+
+def test_catalog_entries_need_no_code(tmp_path):
+    """カタログに追記したルールはコードを変えずに検出される."""
+    catalog = tmp_path / "catalog.json"
+    catalog.write_text(
+        json.dumps(
+            {
+                "groups": [
+                    {
+                        "code": "DEPR001",
+                        "kind": "module",
+                        "message": "DEPR001: '{name}' -> '{replacement}'",
+                        "rules": [{"name": "distutils", "replacement": "setuptools"}],
+                    }
+                ]
+            }
+        )
+    )
+    checker = DeprecationChecker()
+    checker.current_module = "test.py"
+    visitor = DeprecationVisitor(checker, table=DispatchTable(load_catalog(catalog)))
+    visitor.visit(ast.parse("import distutils\nimport imp\n"))
+
+    assert [f.message for f in visitor.failures] == [
+        "DEPR001: 'distutils' -> 'setuptools'"
+    ]
+
+
+def test_catalog_severity_and_removed_are_applied(tmp_path):
+    """カタログの severity が結果に反映され、removed 以降はルールが除外される."""
+    catalog = tmp_path / "catalog.json"
+    group = {
+        "code": "DEPR001",
+        "kind": "module",
+        "severity": "high",
+        "message": "DEPR001: '{name}' -> '{replacement}'",
+        "rules": [{"name": "imp", "replacement": "importlib", "removed": "3.12"}],
+    }
+    catalog.write_text(json.dumps({"groups": [group]}))
+    rules = load_catalog(catalog)
+
+    checker = DeprecationChecker((3, 8))
+    checker.current_module = "test.py"
+    visitor = DeprecationVisitor(
+        checker, table=DispatchTable([r for r in rules if r.applies_to((3, 8))])
+    )
+    visitor.visit(ast.parse("import imp\n"))
+
+    assert len(visitor.failures) == 1
+    assert visitor.severity == Severity.HIGH
+    assert not [r for r in rules if r.applies_to((3, 12))]
+
+
+def test_result_severity_follows_findings():
+    """結果の重大度は最も重い指摘に合わせる."""
+    checker = DeprecationChecker((3, 8))
+
+    info = checker.check(ast.parse("'%s' % x\n"), "test.py")
+    medium = checker.check(ast.parse("import imp\n'%s' % x\n"), "test.py")
+
+    assert info is not None and info.severity == Severity.INFO
+    assert medium is not None and medium.severity == Severity.MEDIUM
+    assert "imp" not in dispatch_table((3, 12)).modules
+
+
+def test_engine_uses_project_requires_python(tmp_path):
+    """エンジン経由ではプロジェクトの requires-python に従う."""
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\nrequires-python = ">=3.9"\n'
+    )
+    (tmp_path / "mod.py").write_text("from typing import List\n")
+
+    results = AnalysisEngine([DeprecationChecker()]).analyze_directory(tmp_path)
+    found = [
+        f.message
+        for result in results[str(tmp_path / "mod.py")]
+        for f in result.failure_locations
+    ]
+
+    assert any("DEPR005" in message for message in found)
+
+
+def test_cached_results_follow_requires_python(tmp_path):
+    """requires-python を上げると、キャッシュ済みの結果は使われない."""
+    pyproject = tmp_path / "project" / "pyproject.toml"
+    pyproject.parent.mkdir()
+    (pyproject.parent / "mod.py").write_text("from typing import List\n")
+    engine = AnalysisEngine(
+        [DeprecationChecker()], cache=LocalResultCache(tmp_path / "cache")
+    )
+
+    found = []
+    for spec in (">=3.8", ">=3.9"):
+        pyproject.write_text(f'[project]\nname = "demo"\nrequires-python = "{spec}"\n')
+        results = engine.analyze_directory(pyproject.parent)
+        found.append(
+            [
+                f.message
+                for result in results.get(str(pyproject.parent / "mod.py"), [])
+                for f in result.failure_locations
+            ]
+        )
+
+    assert found[0] == []
+    assert any("DEPR005" in message for message in found[1])
+    assert engine.cache_hits == 0
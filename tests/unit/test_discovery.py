@@ -0,0 +1,103 @@
+"""
+Tests for source file discovery.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src_check.core.discovery import FileWalker
+from src_check.core.engine import AnalysisEngine
+from src_check.core.kpi_calculator import KPICalculator
+from src_check.formatters.text import TextFormatter
+from src_check.rules.security import SecurityChecker
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "symlink") or os.name == "nt", reason="symlinks required"
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with a symlinked shared package and a symlink loop."""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "util.py").write_text("eval('1')\n")
+    (shared / "clean.py").write_text("x = 1\n")
+
+    app = tmp_path / "app"
+    app.mkdir()
+    (app / "main.py").write_text("y = 2\n")
+    (app / "vendored").symlink_to(shared, target_is_directory=True)
+    (app / "util_link.py").symlink_to(shared / "util.py")
+    # A loop back to the project root
+    (shared / "loop").symlink_to(tmp_path, target_is_directory=True)
+    return tmp_path
+
+
+class TestFileWalker:
+    """Test the inode-keyed walker."""
+
+    def test_each_physical_file_once(self, project):
+        """Test that symlinked files are collected once with their aliases."""
+        walker = FileWalker()
+        walker.walk(project)
+        files = {f.path: f.aliases for f in walker.files()}
+
+        assert set(files) == {
+            project / "app" / "main.py",
+            project / "shared" / "clean.py",
+            project / "shared" / "util.py",
+        }
+        assert sorted(files[project / "shared" / "util.py"]) == [
+            project / "app" / "util_link.py",
+            project / "app" / "vendored" / "util.py",
+        ]
+
+    def test_symlink_loop_terminates(self, project):
+        """Test that a directory is never entered from inside itself."""
+        walker = FileWalker()
+        walker.walk(project)
+
+        assert project / "shared" / "loop" in walker.cycles
+        assert project / "app" / "vendored" / "loop" in walker.cycles
+
+    def test_non_recursive(self, project):
+        """Test that only the top-level directory is listed."""
+        walker = FileWalker()
+        walker.walk(project / "app", recursive=False)
+
+        assert [f.path for f in walker.files()] == [
+            project / "app" / "main.py",
+            project / "app" / "util_link.py",
+        ]
+
+    def test_skip_dir(self, project):
+        """Test that pruned directories are not entered."""
+        walker = FileWalker(skip_dir=lambda d: d.name == "shared")
+        walker.walk(project)
+
+        assert all("shared" not in str(f.path) for f in walker.files())
+
+
+class TestEngineDiscovery:
+    """Test that the engine analyzes aliased files once."""
+
+    def test_findings_list_alias_paths(self, project):
+        """Test that aliased findings are reported once with every path."""
+        engine = AnalysisEngine([SecurityChecker()])
+        results = engine.analyze_directory(project)
+
+        util = str(project / "shared" / "util.py")
+        assert list(results) == [util]
+        location = results[util][0].failure_locations[0]
+        assert sorted(location.aliases) == [
+            str(project / "app" / "util_link.py"),
+            str(project / "app" / "vendored" / "util.py"),
+        ]
+
+        report = TextFormatter().format(
+            results, KPICalculator().calculate_project_score(results)
+        )
+        assert str(Path("app") / "vendored" / "util.py") in report
@@ -0,0 +1,131 @@
+"""
+Tests for the installed-distribution index.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src_check.core import distributions
+from src_check.core.distributions import (
+    DistributionIndex,
+    DistributionInfo,
+    identify_license,
+    load_distribution_index,
+    scan_distributions,
+)
+from src_check.rules.dependency import DependencyChecker
+
+
+def fake_distribution(name, license_text=None, top_level=None):
+    """Build a distribution object exposing only metadata and top_level.txt."""
+    dist = MagicMock()
+    dist.metadata = {"Name": name, "Version": "1.0"}
+    if license_text is not None:
+        dist.metadata["License"] = license_text
+    dist.read_text.return_value = top_level
+    return dist
+
+
+@pytest.fixture(autouse=True)
+def forget_loaded_indexes():
+    """Make every test start without an in-process index."""
+    distributions._loaded.clear()
+    yield
+    distributions._loaded.clear()
+
+
+class TestScan:
+    """Tests for reading distribution metadata."""
+
+    def test_records_metadata(self):
+        """Test that name, version, modules and license are recorded."""
+        dists = [fake_distribution("PyYAML", "MIT License", "_yaml\nyaml\n")]
+        with patch("importlib.metadata.distributions", return_value=dists):
+            (info,) = scan_distributions()
+
+        assert info == DistributionInfo(
+            name="PyYAML",
+            version="1.0",
+            top_level=("_yaml", "yaml"),
+            license="MIT License",
+            license_id="MIT",
+        )
+
+    def test_first_copy_wins(self):
+        """Test that a distribution found twice is recorded once."""
+        dists = [fake_distribution("pkg", "MIT"), fake_distribution("PKG", "GPLv3")]
+        with patch("importlib.metadata.distributions", return_value=dists):
+            infos = scan_distributions()
+
+        assert [i.license for i in infos] == ["MIT"]
+
+    def test_identify_license(self):
+        """Test license identification against the known patterns."""
+        assert identify_license("Apache License, Version 2.0") == "Apache-2.0"
+        assert identify_license("Proprietary") is None
+
+    def test_lookup_normalizes_names(self):
+        """Test that lookups ignore case and separators."""
+        info = DistributionInfo("typing_extensions", "4.0", (), None, None)
+        index = DistributionIndex([info])
+
+        assert index.get("Typing-Extensions") is info
+        assert index.get("missing") is None
+
+
+class TestPersistence:
+    """Tests for caching the index between runs."""
+
+    def test_reused_from_disk(self, tmp_path: Path):
+        """Test that a second process reuses the index without scanning."""
+        dists = [fake_distribution("pkg", "MIT", "pkg\n")]
+        with patch("importlib.metadata.distributions", return_value=dists):
+            first = load_distribution_index(tmp_path)
+        distributions._loaded.clear()
+
+        with patch.object(distributions, "scan_distributions") as scan:
+            second = load_distribution_index(tmp_path)
+
+        scan.assert_not_called()
+        assert list(second) == list(first)
+
+    def test_rebuilt_when_environment_changes(self, tmp_path: Path):
+        """Test that a changed site-packages fingerprint triggers a rescan."""
+        with patch.object(distributions, "scan_distributions", return_value=[]):
+            load_distribution_index(tmp_path)
+
+        with patch.object(
+            distributions, "environment_fingerprint", return_value="changed"
+        ), patch.object(distributions, "scan_distributions", return_value=[]) as scan:
+            load_distribution_index(tmp_path)
+
+        scan.assert_called_once()
+
+    def test_shared_within_a_process(self, tmp_path: Path):
+        """Test that both checkers of a run get the same index object."""
+        with patch.object(distributions, "scan_distributions", return_value=[]):
+            assert load_distribution_index(tmp_path) is load_distribution_index(
+                tmp_path
+            )
+
+
+class TestDependencyChecker:
+    """Tests for how DependencyChecker uses the index."""
+
+    def test_top_level_modules_from_index(self):
+        """Test that a dependency imported under another name counts as used."""
+        index = DistributionIndex(
+            [DistributionInfo("beautifulsoup4", "4.0", ("bs4",), None, None)]
+        )
+        checker = DependencyChecker()
+        checker.declared_dependencies = {"beautifulsoup4": ">=4.0"}
+        checker.project_imports = {"bs4"}
+
+        with patch(
+            "src_check.rules.dependency.load_distribution_index", return_value=index
+        ):
+            results = checker._check_unused_dependencies()
+
+        assert results == []
@@ -0,0 +1,114 @@
+"""
+Tests for the per-function facts shared by the checkers.
+"""
+
+import ast
+from pathlib import Path
+
+from src_check.core.cache import MemoryResultCache, decode_functions
+from src_check.core.engine import AnalysisEngine
+from src_check.core.functions import (
+    ArgumentFacts,
+    FunctionFacts,
+    extract_functions,
+    function_facts,
+)
+from src_check.rules.code_quality import CodeQualityChecker
+from src_check.rules.documentation import DocumentationChecker
+from src_check.rules.type_hints import TypeHintChecker
+
+SOURCE = '''
+class Service:
+    @staticmethod
+    async def fetch(url: str, *args, timeout: float = 1.0, **kwargs) -> Dict[str, int]:
+        """Fetch a URL."""
+        if url and timeout:
+            return {}
+        return {}
+
+    def name(self):
+        return self._name
+
+
+def outer(items: list, /, flag=None) -> None:
+    def inner(x):
+        for item in items:
+            if item:
+                pass
+    return None
+'''
+
+
+def facts_by_name(source: str):
+    """Extract the facts of a source, keyed by qualified name."""
+    return {facts.qualname: facts for facts in extract_functions(ast.parse(source))}
+
+
+class TestExtractFunctions:
+    """Tests for extract_functions."""
+
+    def test_signature_and_summary(self):
+        """Test that a method is recorded with its full signature."""
+        fetch = facts_by_name(SOURCE)["Service.fetch"]
+
+        assert fetch.is_async and fetch.is_method and not fetch.is_nested
+        assert fetch.line == 4
+        assert fetch.args == (
+            ArgumentFacts("url", "str", "positional"),
+            ArgumentFacts("args", None, "vararg"),
+            ArgumentFacts("timeout", "float", "kwonly"),
+            ArgumentFacts("kwargs", None, "kwarg"),
+        )
+        assert fetch.returns == "Dict[str, int]"
+        assert fetch.docstring == "Fetch a URL."
+        assert fetch.decorators == ("staticmethod",)
+        # One 'if' and one 'and'
+        assert fetch.complexity == 3
+
+    def test_nesting_and_accessors(self):
+        """Test qualified names, nested complexity and accessor detection."""
+        facts = facts_by_name(SOURCE)
+
+        assert facts["Service.name"].returns_attribute
+        assert [arg.kind for arg in facts["outer"].args] == ["posonly", "positional"]
+        assert facts["outer"].returns == "None"
+        # The loop and 'if' of inner() do not count towards outer()
+        assert facts["outer"].complexity == 1
+        inner = facts["outer.<locals>.inner"]
+        assert inner.is_nested and not inner.is_method
+        assert inner.complexity == 3
+
+    def test_round_trip(self):
+        """Test that facts survive conversion to a dictionary and back."""
+        for facts in extract_functions(ast.parse(SOURCE)):
+            assert FunctionFacts.from_dict(facts.to_dict()) == facts
+
+
+class TestSharedFacts:
+    """Tests for sharing the facts between checkers and with the cache."""
+
+    def test_checkers_share_one_extraction(self, tmp_path):
+        """Test that the function checkers extract the facts once per file."""
+        path = tmp_path / "mod.py"
+        path.write_text(SOURCE)
+        engine = AnalysisEngine(
+            [CodeQualityChecker(), DocumentationChecker(), TypeHintChecker()]
+        )
+
+        builds = function_facts.builds
+        results = engine.analyze_file(path)
+
+        assert function_facts.builds == builds + 1
+        messages = [loc.message for r in results for loc in r.failure_locations]
+        assert "Function 'inner' missing return type hint" in messages
+        assert "Missing docstring for function 'name'" in messages
+
+    def test_facts_are_cached_with_results(self):
+        """Test that the cache entry of a file carries its function facts."""
+        cache = MemoryResultCache()
+        engine = AnalysisEngine([TypeHintChecker()], cache=cache)
+
+        engine.analyze_source(SOURCE, Path("mod.py"))
+
+        (payload,) = cache._entries.values()
+        assert decode_functions(payload) == extract_functions(ast.parse(SOURCE))
@@ -0,0 +1,106 @@
+"""
+Tests for import cycle detection over fully qualified module names.
+"""
+
+import time
+from pathlib import Path
+
+from src_check.core.engine import AnalysisEngine
+from src_check.core.graph import shortest_cycle, strongly_connected_components
+from src_check.rules.dependency import DependencyChecker
+
+
+def cycle_messages(results):
+    """Collect the DEP001 messages of a run."""
+    return [
+        loc.message
+        for file_results in results.values()
+        for r in file_results
+        if r.rule_id == "DEP001"
+        for loc in r.failure_locations
+    ]
+
+
+class TestGraphAlgorithms:
+    """Tests for the SCC and cycle helpers."""
+
+    def test_components(self):
+        """Test that cycles are grouped and acyclic nodes stand alone."""
+        graph = {"a": {"b"}, "b": {"c"}, "c": {"a", "d"}, "d": set()}
+
+        components = strongly_connected_components(graph)
+
+        assert sorted(sorted(c) for c in components) == [["a", "b", "c"], ["d"]]
+        # Reverse topological order: d is finished before the cycle
+        assert components[0] == ["d"]
+
+    def test_shortest_cycle(self):
+        """Test that the example cycle is a shortest one through the start."""
+        graph = {"a": {"b", "c"}, "b": {"c"}, "c": {"a"}}
+
+        assert shortest_cycle("a", {"a", "b", "c"}, graph) == ["a", "c", "a"]
+
+    def test_deep_graph_is_iterative(self):
+        """Test a 100k-module chain closing into one cycle."""
+        size = 100_000
+        graph = {f"m{i}": {f"m{i + 1}"} for i in range(size - 1)}
+        graph[f"m{size - 1}"] = {"m0"}
+
+        started = time.perf_counter()
+        components = strongly_connected_components(graph)
+
+        assert len(components) == 1
+        assert len(components[0]) == size
+        assert time.perf_counter() - started < 10
+
+
+class TestDependencyChecker:
+    """Tests for DependencyChecker._check_circular_dependencies."""
+
+    def test_reports_every_cycle(self):
+        """Test that independent cycles are all reported."""
+        checker = DependencyChecker()
+        checker.import_graph = {
+            "a": {"b"},
+            "b": {"a"},
+            "x": {"y"},
+            "y": {"z"},
+            "z": {"x"},
+        }
+
+        results = checker._check_circular_dependencies()
+
+        assert [r.failure_locations[0].message for r in results] == [
+            "Circular dependency: a -> b -> a",
+            "Circular dependency: x -> y -> z -> x",
+        ]
+
+    def test_same_named_modules_do_not_collide(self, tmp_path: Path):
+        """Test that a/util.py and b/util.py are different graph nodes."""
+        for package in ("a", "b"):
+            (tmp_path / package).mkdir()
+            (tmp_path / package / "__init__.py").write_text("")
+        (tmp_path / "a" / "util.py").write_text("from b import util\n")
+        (tmp_path / "b" / "util.py").write_text("import json\n")
+        checker = DependencyChecker()
+
+        results = AnalysisEngine([checker]).analyze_directory(tmp_path)
+
+        assert checker.import_graph["a.util"] == {"b.util"}
+        assert cycle_messages(results) == []
+
+    def test_relative_import_cycle(self, tmp_path: Path):
+        """Test a cycle through relative imports, reported at its file."""
+        package = tmp_path / "pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "a.py").write_text("from . import b\n")
+        (package / "b.py").write_text("from pkg.a import helper\n")
+
+        results = AnalysisEngine([DependencyChecker()]).analyze_directory(tmp_path)
+
+        assert cycle_messages(results) == [
+            "Circular dependency: pkg.a -> pkg.b -> pkg.a"
+        ]
+        (result,) = [r for r in results[str(tmp_path)] if r.rule_id == "DEP001"]
+        assert result.failure_locations[0].file_path == str(package / "a.py")
@@ -4,10 +4,18 @@ import ast
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
+import pytest
+
 from src_check.models.check_result import Severity
 from src_check.rules.license import LicenseChecker
 
 
+@pytest.fixture(autouse=True)
+def fresh_distribution_index(monkeypatch, tmp_path):
+    """Give each test its own distribution index, built from its mocks."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 class TestLicenseChecker:
     """Test suite for LicenseChecker."""
 
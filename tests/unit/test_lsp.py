@@ -0,0 +1,213 @@
+"""
+Tests for the language server mode.
+"""
+
+import io
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src_check.cli.lsp import LanguageServer, uri_to_path
+from src_check.core.cache import MemoryResultCache
+from src_check.core.engine import AnalysisEngine
+from src_check.models.source_lines import source_lines
+from src_check.rules.security import SecurityChecker
+
+
+class CaptureWriter(io.BytesIO):
+    """Writer collecting the JSON-RPC messages sent by the server."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lock = threading.Lock()
+        self.published = threading.Event()
+
+    def write(self, data: Any) -> int:
+        with self.lock:
+            if b"publishDiagnostics" in data:
+                self.published.set()
+            return super().write(data)
+
+    def messages(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            raw = self.getvalue()
+        messages = []
+        while raw:
+            header, _, rest = raw.partition(b"\r\n\r\n")
+            length = int(header.split(b":")[1])
+            messages.append(json.loads(rest[:length]))
+            raw = rest[length:]
+        return messages
+
+    def diagnostics(self) -> List[Dict[str, Any]]:
+        return [
+            m["params"]
+            for m in self.messages()
+            if m.get("method") == "textDocument/publishDiagnostics"
+        ]
+
+
+def frame(message: Dict[str, Any]) -> bytes:
+    """Encode a message with a Content-Length header."""
+    body = json.dumps(message).encode("utf-8")
+    return f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+
+
+@pytest.fixture
+def server():
+    """Language server with a security checker and an in-memory cache."""
+    engine = AnalysisEngine([SecurityChecker()], cache=MemoryResultCache())
+    lsp = LanguageServer(io.BytesIO(), CaptureWriter(), engine=engine, debounce=0.1)
+    yield lsp
+    lsp.close()
+
+
+def wait_for_diagnostics(server: LanguageServer, count: int) -> None:
+    """Wait until the server has published the given number of diagnostics."""
+    deadline = time.time() + 5
+    while len(server.writer.diagnostics()) < count and time.time() < deadline:
+        time.sleep(0.02)
+    assert len(server.writer.diagnostics()) >= count
+
+
+def open_document(server: LanguageServer, uri: str, text: str) -> None:
+    server.handle_message(
+        {
+            "jsonrpc": "2.0",
+            "method": "textDocument/didOpen",
+            "params": {
+                "textDocument": {
+                    "uri": uri,
+                    "languageId": "python",
+                    "version": 1,
+                    "text": text,
+                }
+            },
+        }
+    )
+
+
+def change_document(server: LanguageServer, uri: str, version: int, text: str) -> None:
+    server.handle_message(
+        {
+            "jsonrpc": "2.0",
+            "method": "textDocument/didChange",
+            "params": {
+                "textDocument": {"uri": uri, "version": version},
+                "contentChanges": [{"text": text}],
+            },
+        }
+    )
+
+
+class TestLanguageServer:
+    """Test the language server protocol handling."""
+
+    def test_read_message_parses_framing(self):
+        """Test that Content-Length framed messages are decoded."""
+        request = {"jsonrpc": "2.0", "id": 1, "method": "shutdown"}
+        lsp = LanguageServer(io.BytesIO(frame(request)), CaptureWriter())
+
+        assert lsp.read_message() == request
+        assert lsp.read_message() is None
+        lsp.close()
+
+    def test_unknown_request_returns_error(self, server):
+        """Test that unsupported requests get a method-not-found error."""
+        server.handle_message({"jsonrpc": "2.0", "id": 7, "method": "foo/bar"})
+
+        response = server.writer.messages()[0]
+        assert response["id"] == 7
+        assert response["error"]["code"] == -32601
+
+    def test_unsaved_buffer_is_analyzed(self, server, tmp_path):
+        """Test that buffer content is analyzed without the file existing."""
+        uri = (tmp_path / "unsaved.py").as_uri()
+        open_document(server, uri, "import os\nos.system('ls')\n")
+
+        wait_for_diagnostics(server, 1)
+        published = server.writer.diagnostics()[0]
+        assert published["uri"] == uri
+        assert published["version"] == 1
+        assert published["diagnostics"]
+        diagnostic = published["diagnostics"][0]
+        assert diagnostic["source"] == "src-check"
+        assert diagnostic["range"]["start"]["line"] == 1
+
+    def test_rapid_edits_publish_latest_version_only(self, server, tmp_path):
+        """Test that debounced edits only analyze the newest buffer."""
+        uri = (tmp_path / "edited.py").as_uri()
+        open_document(server, uri, "x = 1\n")
+        wait_for_diagnostics(server, 1)
+
+        for version in range(2, 7):
+            change_document(server, uri, version, f"x = {version}\neval('x')\n")
+        time.sleep(0.4)
+
+        published = server.writer.diagnostics()
+        assert [p["version"] for p in published] == [1, 6]
+        assert published[-1]["diagnostics"]
+
+    def test_unchanged_content_comes_from_cache(self, server, tmp_path):
+        """Test that reopening unchanged content reuses cached results."""
+        uri = (tmp_path / "cached.py").as_uri()
+        open_document(server, uri, "eval('1')\n")
+        wait_for_diagnostics(server, 1)
+        server.handle_message(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didClose",
+                "params": {"textDocument": {"uri": uri}},
+            }
+        )
+        open_document(server, uri, "eval('1')\n")
+        wait_for_diagnostics(server, 3)
+
+        assert server.engine.cache_hits == 1
+        first, cleared, second = server.writer.diagnostics()
+        assert cleared["diagnostics"] == []
+        assert first["diagnostics"] == second["diagnostics"]
+
+    def test_closed_buffers_release_their_source(self, server, tmp_path):
+        """Test that the lines of a closed buffer are not kept."""
+        path = tmp_path / "closed.py"
+        open_document(server, path.as_uri(), "eval('1')\n")
+        wait_for_diagnostics(server, 1)
+        assert source_lines.lines(str(path)) is not None
+
+        server.handle_message(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didClose",
+                "params": {"textDocument": {"uri": path.as_uri()}},
+            }
+        )
+
+        assert source_lines.lines(str(path)) is None
+
+    def test_ranges_count_utf16_code_units(self, server, tmp_path):
+        """Test that byte offsets after non-ASCII text become LSP characters."""
+        uri = (tmp_path / "unicode.py").as_uri()
+        # "é" is two bytes but one code unit, the emoji four bytes but two
+        open_document(server, uri, 'x = "é😀"; eval("1")\n')
+        wait_for_diagnostics(server, 1)
+
+        (diagnostic,) = server.writer.diagnostics()[0]["diagnostics"]
+        assert diagnostic["range"] == {
+            "start": {"line": 0, "character": 11},
+            "end": {"line": 0, "character": 20},
+        }
+
+    def test_uri_to_path(self):
+        """Test file URI decoding."""
+        assert uri_to_path("file:///tmp/my%20file.py") == Path("/tmp/my file.py")
+
+    def test_uri_to_path_round_trips_percent_signs(self, tmp_path):
+        """Test that a literal '%' in a file name is decoded only once."""
+        for name in ("a%41.py", "a%2541.py", "100% sure.py"):
+            path = tmp_path / name
+            assert uri_to_path(path.as_uri()) == path
@@ -0,0 +1,198 @@
+"""
+Tests for the checker manifest and lazy plugin loading.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from src_check.core import manifest
+from src_check.core.manifest import (
+    build_manifest,
+    load_entry_point_index,
+    load_manifest,
+)
+from src_check.core.registry import PluginRegistry
+
+
+@pytest.fixture
+def plugin_package(tmp_path, monkeypatch):
+    """Importable package with a single checker module."""
+    package = tmp_path / "my_plugins"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "todo.py").write_text(
+        textwrap.dedent(
+            """
+            from src_check.core.base import BaseChecker
+
+
+            class TodoChecker(BaseChecker):
+                name = "todo"
+                description = "Find TODO comments"
+                category = "code_quality"
+
+                def check(self, ast_tree, file_path):
+                    return None
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    yield "my_plugins"
+    for module in ("my_plugins", "my_plugins.todo"):
+        sys.modules.pop(module, None)
+
+
+@pytest.fixture
+def installed_plugin(tmp_path, monkeypatch):
+    """Directory on sys.path holding a distribution with a checker entry point."""
+    site = tmp_path / "site-packages"
+    dist_info = site / "my_ext-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: my-ext\nVersion: 1.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        "[src_check.checkers]\nstyle = my_ext:StyleChecker\n"
+    )
+    (site / "my_ext.py").write_text(
+        textwrap.dedent(
+            """
+            from src_check.core.base import BaseChecker
+
+
+            class StyleChecker(BaseChecker):
+                name = "style"
+                description = "House style"
+                category = "code_quality"
+
+                def check(self, ast_tree, file_path):
+                    return None
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(site))
+    yield site
+    sys.modules.pop("my_ext", None)
+
+
+class TestManifest:
+    """Test building and loading manifests."""
+
+    def test_shipped_manifest_is_current(self):
+        """Test that rules/manifest.json matches the rule modules."""
+        path = manifest.prebuilt_manifest_path("src_check.rules")
+        with open(path, encoding="utf-8") as f:
+            shipped = json.load(f)
+
+        assert shipped == build_manifest(
+            "src_check.rules"
+        ), "Regenerate with: python -m src_check.core.manifest"
+
+    def test_manifest_cached_on_first_run(self, plugin_package, tmp_path, monkeypatch):
+        """Test that a package without a manifest is scanned only once."""
+        entries = load_manifest(plugin_package, cache_dir=tmp_path / "cache")
+        assert [(e.name, e.module, e.checker_name, e.category) for e in entries] == [
+            ("TodoChecker", "my_plugins.todo", "todo", "code_quality")
+        ]
+        assert (tmp_path / "cache" / "manifest-my_plugins.json").exists()
+
+        def fail(package_name):
+            raise AssertionError("package scanned again")
+
+        monkeypatch.setattr(manifest, "build_manifest", fail)
+        assert load_manifest(plugin_package, cache_dir=tmp_path / "cache") == entries
+
+    def test_stale_cache_is_rebuilt(self, plugin_package, tmp_path):
+        """Test that adding a module invalidates the cached manifest."""
+        load_manifest(plugin_package, cache_dir=tmp_path / "cache")
+        (tmp_path / "my_plugins" / "extra.py").write_text("X = 1\n")
+
+        entries = load_manifest(plugin_package, cache_dir=tmp_path / "cache")
+
+        assert [e.name for e in entries] == ["TodoChecker"]
+        cached = json.loads(
+            (tmp_path / "cache" / "manifest-my_plugins.json").read_text()
+        )
+        assert cached["modules"] == ["extra", "todo"]
+
+
+class TestLazyRegistry:
+    """Test that the registry imports checkers on demand."""
+
+    def test_discovery_lists_without_importing(self, plugin_package):
+        """Test that checkers are importable by name after discovery."""
+        manifest.main([plugin_package])
+        sys.modules.pop("my_plugins.todo")
+        registry = PluginRegistry()
+        registry.discover_plugins(plugin_package)
+
+        assert registry.list_checkers() == ["TodoChecker"]
+        assert registry.is_registered("TodoChecker")
+        assert "my_plugins.todo" not in sys.modules
+
+        assert registry.get_checker("TodoChecker").name == "todo"
+        assert "my_plugins.todo" in sys.modules
+
+    def test_only_enabled_rule_modules_are_imported(self):
+        """Test that a narrow run imports only the enabled checker's module."""
+        code = textwrap.dedent(
+            """
+            import sys
+            from src_check.core.registry import registry
+
+            registry.discover_plugins()
+            checkers = registry.get_all_checkers(lambda n: n == "SecurityChecker")
+            print([c.name for c in checkers])
+            print(sorted(m for m in sys.modules if m.startswith("src_check.rules.")))
+            """
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()
+
+        assert output == ["['security']", "['src_check.rules.security']"]
+
+
+class TestEntryPoints:
+    """Test discovery of third-party checkers."""
+
+    def test_entry_point_index(self, installed_plugin, tmp_path, monkeypatch):
+        """Test that installed distributions are scanned once per environment."""
+        entries = load_entry_point_index(cache_dir=tmp_path / "cache")
+        assert [(e.name, e.module, e.checker_name, e.version) for e in entries] == [
+            ("StyleChecker", "my_ext", "style", "1.0")
+        ]
+
+        def fail():
+            raise AssertionError("distributions scanned again")
+
+        monkeypatch.setattr(manifest, "scan_entry_points", fail)
+        assert load_entry_point_index(cache_dir=tmp_path / "cache") == entries
+
+    def test_index_rebuilt_when_environment_changes(self, installed_plugin, tmp_path):
+        """Test that removing a distribution invalidates the index."""
+        assert load_entry_point_index(cache_dir=tmp_path / "cache")
+
+        for path in (installed_plugin / "my_ext-1.0.dist-info").iterdir():
+            path.unlink()
+        (installed_plugin / "my_ext-1.0.dist-info").rmdir()
+
+        assert load_entry_point_index(cache_dir=tmp_path / "cache") == []
+
+    def test_registry_discovers_entry_points(self, installed_plugin):
+        """Test that the registry loads third-party checkers on demand."""
+        registry = PluginRegistry()
+        registry.discover_plugins()
+        sys.modules.pop("my_ext", None)
+
+        assert "StyleChecker" in registry.list_checkers()
+        assert "SecurityChecker" in registry.list_checkers()
+        assert registry.get_checker("StyleChecker").name == "style"
@@ -0,0 +1,96 @@
+"""
+Tests for the project module index and standard-library names.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src_check.core.engine import AnalysisEngine
+from src_check.core.modules import ModuleIndex, module_index, stdlib_module_names
+from src_check.rules.dependency import DependencyChecker
+
+
+def make_project(tmp_path: Path) -> Path:
+    """Create a src-layout project with a nested package."""
+    src = tmp_path / "src"
+    (src / "pkg" / "sub").mkdir(parents=True)
+    (src / "pkg" / "__init__.py").write_text("")
+    (src / "pkg" / "sub" / "__init__.py").write_text("")
+    (src / "pkg" / "sub" / "mod.py").write_text("import pkg\nimport requests\n")
+    (src / "script.py").write_text("import asyncio\n")
+    return src
+
+
+class TestStdlibNames:
+    """Tests for stdlib_module_names."""
+
+    def test_known_modules(self):
+        """Test that standard modules are listed and third-party ones are not."""
+        names = stdlib_module_names()
+
+        assert {"os", "json", "asyncio", "subprocess", "sys"} <= names
+        assert "pytest" not in names
+        assert "src_check" not in names
+
+    @pytest.mark.skipif(
+        not hasattr(sys, "stdlib_module_names"), reason="Python 3.10+ only"
+    )
+    def test_uses_interpreter_list(self):
+        """Test that the interpreter's own list is used when available."""
+        assert stdlib_module_names() == frozenset(sys.stdlib_module_names)
+
+
+class TestModuleIndex:
+    """Tests for ModuleIndex."""
+
+    def test_dotted_names(self, tmp_path: Path):
+        """Test that names are relative to the first non-package directory."""
+        src = make_project(tmp_path)
+        index = ModuleIndex()
+
+        assert index.add_file(src / "pkg" / "sub" / "mod.py") == "pkg.sub.mod"
+        assert index.add_file(src / "pkg" / "__init__.py") == "pkg"
+        assert index.add_file(src / "script.py") == "script"
+        assert index.top_level == {"pkg", "script"}
+
+    def test_resolve_longest_prefix(self, tmp_path: Path):
+        """Test that attribute suffixes are stripped when resolving."""
+        src = make_project(tmp_path)
+        index = ModuleIndex()
+        index.add_file(src / "pkg" / "sub" / "mod.py")
+
+        assert index.resolve("pkg.sub.mod.function") == "pkg.sub.mod"
+        assert index.resolve("requests.adapters") is None
+
+    def test_listings_avoid_probes(self, tmp_path: Path):
+        """Test that recorded listings answer package checks."""
+        index = ModuleIndex()
+        index.record_listing(tmp_path, ["pkg"])
+        index.record_listing(tmp_path / "pkg", ["__init__.py", "mod.py"])
+
+        with patch.object(Path, "exists") as exists:
+            assert index.add_file(tmp_path / "pkg" / "mod.py") == "pkg.mod"
+
+        exists.assert_not_called()
+
+
+class TestLocalImports:
+    """Tests for DependencyChecker._is_local_import with an indexed run."""
+
+    def test_classification_is_a_lookup(self, tmp_path: Path):
+        """Test that discovered files are classified without stat calls."""
+        src = make_project(tmp_path)
+        checker = DependencyChecker()
+        AnalysisEngine([checker]).analyze_directory(src)
+        mod = src / "pkg" / "sub" / "mod.py"
+
+        with patch.object(Path, "exists") as exists:
+            assert checker._is_local_import("pkg", mod)
+            assert not checker._is_local_import("requests", mod)
+            assert not checker._is_local_import("asyncio", mod)
+
+        exists.assert_not_called()
+        assert module_index.module_name(mod) == "pkg.sub.mod"
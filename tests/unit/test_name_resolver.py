@@ -0,0 +1,110 @@
+"""
+Tests for resolving call sites to qualified names through import aliases.
+"""
+
+import ast
+
+from src_check.core.scopes import ScopeAnalysis
+from src_check.rules.deprecation import DeprecationChecker
+from src_check.rules.performance import PerformanceChecker
+from src_check.rules.security import SecurityChecker
+
+
+def call_names(source: str):
+    """Resolve the function of every call in a snippet."""
+    tree = ast.parse(source)
+    resolver = ScopeAnalysis(tree).resolver
+    return [
+        resolver.qualified(node.func)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+    ]
+
+
+def messages(checker, source: str):
+    """Return the messages a checker reports for a snippet."""
+    result = checker.check(ast.parse(source), "test.py")
+    return [] if result is None else [loc.message for loc in result.failure_locations]
+
+
+class TestNameResolver:
+    """Tests for NameResolver."""
+
+    def test_aliases(self):
+        """Test module aliases, from-imports and plain dotted imports."""
+        source = (
+            "import os as o\n"
+            "import os.path\n"
+            "from subprocess import Popen as P\n"
+            "o.system('ls')\n"
+            "os.path.join('a')\n"
+            "P(['ls'])\n"
+            "eval('1')\n"
+            "get().system()\n"
+        )
+
+        assert call_names(source) == [
+            "os.system",
+            "os.path.join",
+            "subprocess.Popen",
+            "eval",
+            None,
+            "get",
+        ]
+
+    def test_relative_imports_are_not_aliases(self):
+        """Test that names from project modules are left as written."""
+        assert call_names("from . import pickle\npickle.loads(b'')\n") == [
+            "pickle.loads"
+        ]
+
+    def test_prefixes_are_memoized(self):
+        """Test that a chain reuses the memoized name of its prefix."""
+        tree = ast.parse("import numpy as np\nnp.linalg.norm(x)\n")
+        resolver = ScopeAnalysis(tree).resolver
+        call = tree.body[1].value
+
+        assert resolver.qualified(call.func) == "numpy.linalg.norm"
+        assert resolver._qualified[call.func.value] == "numpy.linalg"
+        assert resolver.dotted(call.func) == "np.linalg.norm"
+
+
+class TestCheckers:
+    """Tests for the checkers resolving names through aliases."""
+
+    def test_aliased_os_system(self):
+        """Test that ``import os as o; o.system()`` is reported."""
+        found = messages(SecurityChecker(), "import os as o\no.system('ls')\n")
+
+        assert found == ["Dangerous function 'os.system': Can execute shell commands"]
+
+    def test_from_imported_popen_with_shell(self):
+        """Test shell=True through a from-import."""
+        source = "from subprocess import Popen\nPopen('ls', shell=True)\n"
+
+        assert "Dangerous: subprocess.Popen with shell=True" in messages(
+            SecurityChecker(), source
+        )
+
+    def test_aliased_pickle(self):
+        """Test unpickling through an aliased module."""
+        source = "import pickle as p\np.loads(data)\n"
+
+        assert (
+            "Critical: Unpickling untrusted data can execute arbitrary code"
+            in messages(SecurityChecker(), source)
+        )
+
+    def test_aliased_ensure_future(self):
+        """Test DEPR004 for an aliased asyncio module."""
+        found = messages(
+            DeprecationChecker(), "import asyncio as aio\naio.ensure_future(c)\n"
+        )
+
+        assert [m.split(":")[0] for m in found] == ["DEPR004"]
+
+    def test_shadowed_builtin(self):
+        """Test that an imported max() is not taken for the builtin."""
+        source = "from numpy import max\nfor x in xs:\n    y = max(a)\n"
+
+        assert not any("PERF006" in m for m in messages(PerformanceChecker(), source))
@@ -0,0 +1,107 @@
+"""
+Tests for the single-traversal PerformanceVisitor.
+
+The expected findings, including their order and duplicates, are those of
+the previous implementation, which re-walked every loop and comprehension.
+"""
+
+import ast
+import time
+
+from src_check.rules.performance import PerformanceVisitor
+
+
+def findings(source: str):
+    """Return (rule, line, column) for each finding, in report order."""
+    visitor = PerformanceVisitor("test.py")
+    visitor.visit(ast.parse(source))
+    return [(issue.message[1:8], issue.line, issue.column) for issue in visitor.issues]
+
+
+class TestOutputParity:
+    """Findings match those of the re-walking implementation."""
+
+    def test_nested_loops(self):
+        """Test that outer loops report concatenation in inner loops first."""
+        source = """
+s = ""
+for i in range(n()):
+    s = ""
+    t = ""
+    for j in items:
+        s = "x"
+        if j:
+            s += j
+        t += j
+    s += "a" + str(i)
+    x = len(items)
+"""
+
+        assert findings(source) == [
+            ("PERF007", 12, 4),
+            ("PERF008", 11, 4),
+            ("PERF008", 10, 8),
+            ("PERF008", 9, 12),
+            ("PERF001", 3, 0),
+            ("PERF008", 9, 12),
+            ("PERF003", 11, 9),
+            ("PERF006", 12, 8),
+        ]
+
+    def test_comprehensions_and_while(self):
+        """Test nested comprehension counts and while-loop findings."""
+        source = """
+for row in rows:
+    data = [[{k: v for k, v in c} for c in r] for r in row]
+    other = [x for x in {y for y in row}]
+while check() > 0:
+    total = sum(values)
+    out = list(list(values))
+"""
+
+        assert findings(source) == [
+            ("PERF004", 3, 11),
+            ("PERF002", 5, 0),
+            ("PERF006", 6, 12),
+            ("PERF005", 7, 10),
+        ]
+
+    def test_function_inside_loop(self):
+        """Test that loop assignment tables apply inside nested functions."""
+        source = """
+for i in items:
+    acc = ""
+    def helper(v):
+        for k in v:
+            acc += k
+        return acc
+    acc += helper(i)
+"""
+
+        assert findings(source) == [("PERF008", 8, 4), ("PERF008", 6, 12)]
+
+
+class TestTraversal:
+    """Tests for the cost of the traversal."""
+
+    def test_deeply_nested_loops(self):
+        """Test loops nested through 45 functions, each with many statements."""
+        depth, statements = 45, 50
+        lines = []
+        for level in range(depth):
+            indent = "    " * (2 * level)
+            lines.append(f"{indent}def f{level}(items):")
+            lines.append(f"{indent}    for item in items:")
+            lines.append(f"{indent}        text = ''")
+            lines.extend(f"{indent}        text += item" for _ in range(statements))
+        tree = ast.parse("\n".join(lines))
+
+        started = time.perf_counter()
+        visitor = PerformanceVisitor("test.py")
+        visitor.visit(tree)
+
+        # Each += matches its own loop and every enclosing one
+        expected = statements * depth * (depth + 1) // 2
+        assert sum("PERF008" in i.message for i in visitor.issues) == expected
+        assert visitor.loop_depth == 0
+        assert time.perf_counter() - started < 5
@@ -0,0 +1,96 @@
+"""
+Tests for the shared project-root map.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from src_check.core.engine import AnalysisEngine
+from src_check.core.project import ProjectRoots, project_roots
+from src_check.rules.dependency import DependencyChecker
+from src_check.rules.license import LicenseChecker
+
+
+def make_project(tmp_path: Path) -> Path:
+    """Create a project with a nested package and return its root."""
+    root = tmp_path / "project"
+    package = root / "src" / "pkg"
+    package.mkdir(parents=True)
+    (root / "pyproject.toml").write_text("")
+    (root / "requirements.txt").write_text("requests\n")
+    (package / "__init__.py").write_text("")
+    (package / "core.py").write_text("import os\n")
+    return root
+
+
+class TestProjectRoots:
+    """Tests for ProjectRoots."""
+
+    def test_finds_nearest_marker(self, tmp_path: Path):
+        """Test that the nearest directory with a marker is the root."""
+        root = make_project(tmp_path)
+        roots = ProjectRoots()
+
+        assert roots.root_of(root / "src" / "pkg" / "core.py") == root
+        assert roots.root_of(root / "setup.py") == root
+
+    def test_lookups_are_memoized(self, tmp_path: Path):
+        """Test that each directory is probed at most once."""
+        root = make_project(tmp_path)
+        roots = ProjectRoots()
+        roots.root_of(root / "src" / "pkg" / "core.py")
+
+        with patch.object(Path, "exists") as exists:
+            assert roots.root_of(root / "src" / "pkg" / "__init__.py") == root
+            assert roots.root_of(root / "src" / "other.py") == root
+
+        exists.assert_not_called()
+
+    def test_listings_avoid_probes(self, tmp_path: Path):
+        """Test that recorded listings answer lookups without stat calls."""
+        roots = ProjectRoots()
+        roots.record_listing(tmp_path, ["setup.py", "module.py"])
+        roots.record_listing(tmp_path / "pkg", ["__init__.py"])
+
+        with patch.object(Path, "exists") as exists:
+            assert roots.root_of(tmp_path / "pkg" / "__init__.py") == tmp_path
+
+        exists.assert_not_called()
+
+    def test_clear_forgets_roots(self, tmp_path: Path):
+        """Test that clearing picks up markers created later."""
+        roots = ProjectRoots()
+        roots.record_listing(tmp_path, [])
+        (tmp_path / "pyproject.toml").write_text("")
+
+        roots.clear()
+
+        assert roots.is_root(tmp_path)
+
+
+class TestEngineProjectRoots:
+    """Tests for how the engine shares the map."""
+
+    def test_discovery_seeds_the_map(self, tmp_path: Path):
+        """Test that checkers resolve roots without probing after discovery."""
+        root = make_project(tmp_path)
+        AnalysisEngine([LicenseChecker()]).analyze_directory(root)
+
+        with patch.object(Path, "exists") as exists:
+            assert project_roots.root_of(root / "src" / "pkg" / "core.py") == root
+
+        exists.assert_not_called()
+
+    def test_project_checkers_get_project_root(self, tmp_path: Path):
+        """Test that analyzing a subdirectory still finds the dependency files."""
+        root = make_project(tmp_path)
+        engine = AnalysisEngine([DependencyChecker()])
+
+        results = engine.analyze_directory(root / "src")
+
+        messages = [
+            loc.message
+            for result in results[str(root / "src")]
+            for loc in result.failure_locations
+        ]
+        assert "Unpinned dependency version: requests" in messages
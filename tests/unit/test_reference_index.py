@@ -0,0 +1,197 @@
+"""
+Tests for the project-wide index of names referenced by tests.
+"""
+
+import ast
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src_check.core.cache import MemoryResultCache
+from src_check.core.engine import AnalysisEngine
+from src_check.core.references import ReferenceIndex, test_references
+from src_check.core.scopes import ScopeAnalysis
+from src_check.rules import test_quality
+
+
+@pytest.fixture
+def project():
+    """Create a project outside any directory named like a test."""
+    with tempfile.TemporaryDirectory(prefix="proj") as root:
+        yield Path(root).resolve()
+    test_references.clear()
+
+
+def write(path: Path, content: str) -> None:
+    """Write a file, creating its directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def referenced(source: str, module=None):
+    """Return the names a test file refers to."""
+    tree = ast.parse(source)
+    visitor = test_quality.TestReferencesVisitor(ScopeAnalysis(tree).resolver, module)
+    visitor.visit(tree)
+    return visitor.names
+
+
+class TestReferenceIndex:
+    """Tests for ReferenceIndex."""
+
+    def test_lookups_count_across_files(self):
+        """Test that a name stays referenced while any file refers to it."""
+        index = ReferenceIndex()
+        index.add_file("tests/a.py", {"pkg.mod.f", "pkg.mod.g"}, {"run"})
+        index.add_file("tests/b.py", {"pkg.mod.f"}, set())
+
+        index.remove_file("tests/a.py")
+
+        assert index.is_referenced("pkg.mod.f")
+        assert not index.is_referenced("pkg.mod.g")
+        assert not index.uses_attribute("run")
+
+    def test_file_checked_again_replaces_its_record(self):
+        """Test that re-adding a file drops the names it no longer uses."""
+        index = ReferenceIndex()
+        index.add_file("tests/a.py", {"pkg.old"}, set())
+        index.add_file("tests/a.py", {"pkg.new"}, set())
+
+        assert len(index) == 1
+        assert not index.is_referenced("pkg.old")
+        assert index.is_referenced("pkg.new")
+
+
+class TestTestReferencesVisitor:
+    """Tests for the names recorded from test files."""
+
+    def test_imports_and_calls_resolve_to_qualified_names(self):
+        """Test that aliases and attribute chains are resolved."""
+        names = referenced(
+            "from pkg import mod\n"
+            "import pkg.other as other\n"
+            "from pkg.util import helper\n"
+            "mod.func()\n"
+            "other.run(helper)\n"
+        )
+
+        assert {"pkg.mod.func", "pkg.other.run", "pkg.util.helper"} <= names
+
+    def test_relative_imports_resolve_against_the_test_module(self):
+        """Test that relative imports are qualified from the test's package."""
+        names = referenced("from ..app import main\n", "pkg.tests.test_app")
+
+        assert "pkg.app.main" in names
+
+
+class TestUntestedFunctions:
+    """Tests for the project phase of TestQualityChecker."""
+
+    def test_reports_functions_no_test_refers_to(self, project):
+        """Test that referenced functions and called methods count as tested."""
+        write(project / "pyproject.toml", '[project]\nname = "demo"\n')
+        write(project / "pkg" / "__init__.py", "")
+        write(
+            project / "pkg" / "mod.py",
+            "def used():\n    return 1\n\n"
+            "def unused():\n    return 2\n\n"
+            "class Service:\n    def run(self):\n        return 3\n",
+        )
+        write(
+            project / "tests" / "test_mod.py",
+            "from pkg.mod import Service, used\n\n"
+            "def test_used():\n"
+            '    """Test used."""\n'
+            "    assert used() == 1\n"
+            "    assert Service().run() == 3\n",
+        )
+
+        engine = AnalysisEngine(
+            [test_quality.TestQualityChecker()], cache=MemoryResultCache()
+        )
+
+        # The second run answers every file from the cache
+        for _ in range(2):
+            test_references.clear()
+            results = engine.analyze_directory(project)
+            messages = [
+                loc.message
+                for result in results.get(str(project), [])
+                for loc in result.failure_locations
+            ]
+
+            assert messages == [
+                "Public function 'pkg.mod.unused' is not referenced by any test"
+            ]
+        assert engine.cache_hits == 3
+
+    def test_warm_runs_restore_project_data_without_parsing(self, project, monkeypatch):
+        """Test that cached files hand back their project data unparsed."""
+        write(project / "pyproject.toml", '[project]\nname = "demo"\n')
+        write(project / "pkg" / "__init__.py", "")
+        write(
+            project / "pkg" / "mod.py",
+            "def used():\n    return 1\n\ndef unused():\n    return 2\n",
+        )
+        write(
+            project / "tests" / "test_mod.py",
+            "from pkg.mod import used\n\n"
+            "def test_used():\n"
+            '    """Test used."""\n'
+            "    assert used() == 1\n",
+        )
+        engine = AnalysisEngine(
+            [test_quality.TestQualityChecker()], cache=MemoryResultCache()
+        )
+        engine.analyze_directory(project)
+
+        parsed = []
+        parse = ast.parse
+        monkeypatch.setattr(
+            ast,
+            "parse",
+            lambda *args, **kwargs: parsed.append(args) or parse(*args, **kwargs),
+        )
+        results = engine.analyze_directory(project)
+
+        # Only import statements are scanned, for the import graph
+        sources = {path.read_text() for path in project.rglob("*.py")}
+        assert not sources.intersection(args[0] for args in parsed)
+        assert engine.cache_hits == 3
+        assert [loc.message for loc in results[str(project)][0].failure_locations] == [
+            "Public function 'pkg.mod.unused' is not referenced by any test"
+        ]
+
+    def test_references_do_not_carry_over_between_runs(self, project):
+        """Test that a tree without tests is not judged by another tree's tests."""
+        write(project / "one" / "pyproject.toml", '[project]\nname = "one"\n')
+        write(project / "one" / "pkg" / "__init__.py", "")
+        write(project / "one" / "pkg" / "lib.py", "def used():\n    return 1\n")
+        write(
+            project / "one" / "tests" / "test_lib.py",
+            "from pkg.lib import used\n\n"
+            "def test_used():\n"
+            '    """Test used."""\n'
+            "    assert used() == 1\n",
+        )
+        write(project / "two" / "pyproject.toml", '[project]\nname = "two"\n')
+        write(project / "two" / "pkg" / "__init__.py", "")
+        write(project / "two" / "pkg" / "lib.py", "def other():\n    return 2\n")
+
+        engine = AnalysisEngine([test_quality.TestQualityChecker()])
+        engine.analyze_directory(project / "one")
+        results = engine.analyze_directory(project / "two")
+
+        assert str(project / "two") not in results
+
+    def test_projects_without_tests_are_not_reported(self, project):
+        """Test that the project phase stays quiet when there are no tests."""
+        write(project / "pkg" / "__init__.py", "")
+        write(project / "pkg" / "mod.py", "def lonely():\n    return 1\n")
+
+        results = AnalysisEngine([test_quality.TestQualityChecker()]).analyze_directory(
+            project
+        )
+
+        assert str(project) not in results
@@ -0,0 +1,212 @@
+"""
+Tests for result cache backends and the reference cache server.
+"""
+
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from src_check.core.cache import (
+    HttpResultCache,
+    LayeredResultCache,
+    LocalResultCache,
+    MemoryResultCache,
+    compute_cache_key,
+    config_fingerprint,
+    decode_results,
+    encode_results,
+)
+from src_check.core.cache_server import CacheServer
+from src_check.core.engine import AnalysisEngine
+from src_check.models import CheckResult, Severity
+from src_check.rules import test_quality
+from src_check.rules.code_quality import CodeQualityChecker
+from src_check.rules.security import SecurityChecker
+
+
+@pytest.fixture
+def cache_server(tmp_path):
+    """Run a cache server on a free port for the duration of a test."""
+    server = CacheServer(("127.0.0.1", 0), tmp_path / "server")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_result(file_path: str) -> CheckResult:
+    """Create a check result with a single failure."""
+    result = CheckResult(
+        title="Issue",
+        checker_name="security",
+        severity=Severity.HIGH,
+        category="security",
+        rule_id="SEC001",
+    )
+    result.add_failure(file_path, 3, "Something bad", column=4, code_snippet="x()")
+    return result
+
+
+class TestCacheKeys:
+    """Test cache key computation."""
+
+    def test_key_depends_on_content_and_fingerprint(self):
+        """Test that both content and checker set change the key."""
+        fp1 = config_fingerprint([SecurityChecker()])
+        fp2 = config_fingerprint([SecurityChecker(), CodeQualityChecker()])
+
+        assert compute_cache_key("a = 1", fp1) == compute_cache_key("a = 1", fp1)
+        assert compute_cache_key("a = 1", fp1) != compute_cache_key("a = 2", fp1)
+        assert compute_cache_key("a = 1", fp1) != compute_cache_key("a = 1", fp2)
+        assert compute_cache_key("a = 1", fp1, "pkg/a.py") != compute_cache_key(
+            "a = 1", fp1, "tests/a.py"
+        )
+
+    def test_fingerprint_ignores_checker_order(self):
+        """Test that the fingerprint does not depend on checker order."""
+        assert config_fingerprint(
+            [SecurityChecker(), CodeQualityChecker()]
+        ) == config_fingerprint([CodeQualityChecker(), SecurityChecker()])
+
+    def test_encoded_results_are_relocatable(self):
+        """Test that cached results are restored for another path."""
+        payload = encode_results([make_result("/a/mod.py")], "/a/mod.py")
+        restored = decode_results(payload, "/b/mod.py")
+
+        assert len(restored) == 1
+        assert restored[0].failure_locations[0].file_path == "/b/mod.py"
+        assert restored[0].failure_locations[0].code_snippet == "x()"
+        assert restored[0].severity == Severity.HIGH
+        # The payload itself must stay reusable
+        again = decode_results(payload, "/c/mod.py")
+        assert again[0].failure_locations[0].file_path == "/c/mod.py"
+
+
+class TestBackends:
+    """Test the individual cache backends."""
+
+    def test_local_cache_roundtrip(self, tmp_path):
+        """Test storing and loading entries on disk."""
+        cache = LocalResultCache(tmp_path)
+        key = "a" * 64
+
+        assert cache.get(key) is None
+        cache.put(key, {"results": []})
+        assert cache.get(key) == {"results": []}
+        assert cache.get_many([key, "b" * 64]) == {key: {"results": []}}
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        """Test that the memory cache stays bounded."""
+        cache = MemoryResultCache(max_entries=2)
+        cache.put("1", {"n": 1})
+        cache.put("2", {"n": 2})
+        cache.get("1")
+        cache.put("3", {"n": 3})
+
+        assert cache.get("2") is None
+        assert cache.get("1") == {"n": 1}
+        assert cache.get("3") == {"n": 3}
+
+    def test_http_cache_roundtrip(self, cache_server):
+        """Test GET/PUT and batched lookups against the server."""
+        cache = HttpResultCache(cache_server.url)
+        key1, key2, missing = "1" * 64, "2" * 64, "3" * 64
+
+        assert cache.get(key1) is None
+        cache.put(key1, {"results": [1]})
+        cache.put(key2, {"results": [2]})
+
+        assert cache.get(key1) == {"results": [1]}
+        assert cache.get_many([key1, key2, missing]) == {
+            key1: {"results": [1]},
+            key2: {"results": [2]},
+        }
+
+    def test_http_cache_unavailable_is_a_miss(self):
+        """Test that an unreachable server degrades to cache misses."""
+        cache = HttpResultCache("http://127.0.0.1:9", timeout=0.5)
+
+        assert cache.get("1" * 64) is None
+        assert cache.get_many(["1" * 64]) == {}
+        cache.put("1" * 64, {"results": []})
+
+    def test_layered_cache_backfills_faster_layers(self, cache_server, tmp_path):
+        """Test that remote hits are copied into the local cache."""
+        key = "4" * 64
+        HttpResultCache(cache_server.url).put(key, {"results": []})
+
+        local = LocalResultCache(tmp_path / "local")
+        cache = LayeredResultCache([local, HttpResultCache(cache_server.url)])
+
+        assert cache.get_many([key]) == {key: {"results": []}}
+        assert local.get(key) == {"results": []}
+
+
+class TestEngineCache:
+    """Test result caching in the analysis engine."""
+
+    def test_directory_results_shared_through_server(self, cache_server, tmp_path):
+        """Test that a second job reuses results computed by the first."""
+        source = "password = 'hunter2'\n"
+        # Each job checks out the same project at a different location
+        for job in ("job1", "job2"):
+            (tmp_path / job).mkdir()
+            (tmp_path / job / "pyproject.toml").write_text('[project]\nname = "app"\n')
+            (tmp_path / job / "settings.py").write_text(source)
+
+        first = AnalysisEngine(
+            [SecurityChecker()], cache=HttpResultCache(cache_server.url)
+        )
+        first_results = first.analyze_directory(tmp_path / "job1")
+        assert first.cache_misses == 1
+
+        second = AnalysisEngine(
+            [SecurityChecker()], cache=HttpResultCache(cache_server.url)
+        )
+        second_results = second.analyze_directory(tmp_path / "job2")
+        assert second.cache_hits == 1
+        assert second.cache_misses == 0
+
+        file1 = str(tmp_path / "job1" / "settings.py")
+        file2 = str(tmp_path / "job2" / "settings.py")
+        assert first_results[file1][0].failure_count == 1
+        assert second_results[file2][0].failure_locations[0].file_path == file2
+
+    def test_identical_content_at_different_paths(self):
+        """Test that path-dependent findings are not shared between files."""
+        source = "def test_helper():\n    assert True\n"
+        engine = AnalysisEngine(
+            [test_quality.TestQualityChecker()], cache=MemoryResultCache()
+        )
+        # Outside any directory named like a test, which would make every
+        # file a test file
+        with tempfile.TemporaryDirectory(prefix="proj") as root:
+            project = Path(root)
+            (project / "pyproject.toml").write_text('[project]\nname = "app"\n')
+            found = []
+            for relative in ("pkg/helpers.py", "tests/test_helpers.py"):
+                (project / relative).parent.mkdir()
+                (project / relative).write_text(source)
+                results = engine.analyze_file(project / relative)
+                found.append(
+                    [loc.message for r in results for loc in r.failure_locations]
+                )
+
+        assert engine.cache_hits == 0
+        assert found[0] == []
+        assert "Trivial assertion: 'assert True'" in found[1]
+
+    def test_analyze_file_uses_cache(self, tmp_path):
+        """Test that single-file analysis hits the cache on unchanged content."""
+        target = tmp_path / "mod.py"
+        target.write_text("eval('1')\n")
+        engine = AnalysisEngine([SecurityChecker()], cache=MemoryResultCache())
+
+        first = engine.analyze_file(Path(target))
+        second = engine.analyze_file(Path(target))
+
+        assert engine.cache_hits == 1
+        assert [r.to_dict() for r in first] == [r.to_dict() for r in second]
@@ -0,0 +1,129 @@
+"""
+Tests for the shared per-file scope and def-use analysis.
+"""
+
+import ast
+from pathlib import Path
+
+from src_check.core.engine import AnalysisEngine
+from src_check.core.scopes import ScopeAnalysis, scope_analyses
+from src_check.rules.code_quality import CodeQualityChecker
+from src_check.rules.performance import PerformanceChecker
+
+
+def analyze(source: str):
+    """Parse and analyze a snippet."""
+    tree = ast.parse(source)
+    return tree, ScopeAnalysis(tree)
+
+
+def rules(source: str):
+    """Return the rule ids PerformanceChecker reports for a snippet."""
+    result = PerformanceChecker().check(ast.parse(source), "test.py")
+    return [] if result is None else [i.message[1:8] for i in result.failure_locations]
+
+
+class TestScopeAnalysis:
+    """Tests for ScopeAnalysis."""
+
+    def test_loop_body(self):
+        """Test that the target and body count, the iterable and else do not."""
+        tree, scopes = analyze(
+            "for item in load():\n"
+            "    total = total + item\n"
+            "    cache[item] = 1\n"
+            "    seen.add(item)\n"
+            "    squares = [n * n for n in item]\n"
+            "else:\n"
+            "    done = True\n"
+        )
+
+        loop = scopes.loop(tree.body[0])
+
+        assert loop.assigned == {"item", "total", "squares"}
+        assert loop.mutated == {"cache", "seen"}
+        assert not loop.modifies("load")
+        assert not loop.modifies("n")
+
+    def test_while_condition_is_in_the_loop(self):
+        """Test that a while condition is re-evaluated each iteration."""
+        tree, scopes = analyze("while (line := read()):\n    pass\n")
+
+        assert scopes.loop(tree.body[0]).modifies("line")
+
+    def test_function_scopes(self):
+        """Test argument bindings and where defaults are evaluated."""
+        tree, scopes = analyze(
+            "def f(a, *args, key=default, **kw):\n    local = a\n    return local\n"
+        )
+
+        module, function = scopes.scope(tree), scopes.scope(tree.body[0])
+
+        assert function.assigned == {"a", "args", "key", "kw", "local"}
+        assert function.loaded == {"a", "local"}
+        assert module.assigned == {"f"}
+        assert module.loaded == {"default"}
+
+    def test_imports(self):
+        """Test the names imports bind and their qualified names."""
+        _, scopes = analyze("import os.path\nimport numpy as np\nfrom . import x\n")
+
+        assert [(b.name, b.qualified_name) for b in scopes.imports] == [
+            ("os", "os.path"),
+            ("np", "numpy"),
+            ("x", "x"),
+        ]
+
+
+class TestSharedAnalysis:
+    """Tests for the analysis the engine shares between checkers."""
+
+    def test_built_once_per_file(self, tmp_path: Path):
+        """Test that two checkers share one analysis, dropped afterwards."""
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text("import os\nfor x in y:\n    print(x)\n")
+        engine = AnalysisEngine([PerformanceChecker(), CodeQualityChecker()])
+        builds = scope_analyses.builds
+
+        engine.analyze_directory(tmp_path)
+
+        assert scope_analyses.builds - builds == 2
+        assert scope_analyses._entry is None
+
+
+class TestDefUseChecks:
+    """Tests for PERF006 and PERF007 using the def-use facts."""
+
+    def test_loop_variable_is_not_invariant(self):
+        """Test that len() of the loop variable is not reported."""
+        assert "PERF006" not in rules("for item in items:\n    n = len(item)\n")
+
+    def test_mutated_argument_is_not_invariant(self):
+        """Test that len() of a list appended to in the loop is not reported."""
+        source = "for item in items:\n    if len(out) < 3:\n        out.append(item)\n"
+
+        assert "PERF006" not in rules(source)
+        assert "PERF006" in rules(source.replace("out.append", "other.append"))
+
+    def test_accumulator_is_not_invariant(self):
+        """Test that an assignment reading a name the loop rebinds is not reported."""
+        assert "PERF007" not in rules("for x in xs:\n    total = total + x\n")
+        assert "PERF007" in rules("for x in xs:\n    limit = compute(a, b)\n")
+
+    def test_method_call_is_not_invariant(self):
+        """Test that calling a method of a variable may change it."""
+        assert "PERF007" not in rules("for x in xs:\n    line = f.readline()\n")
+
+
+class TestUnusedImports:
+    """Tests for unused imports reported from the shared analysis."""
+
+    def test_dotted_import(self):
+        """Test that ``import os.path`` is used through ``os``."""
+        source = "import os.path\nimport sys\n\nos.path.join('a')\n"
+
+        result = CodeQualityChecker().check(ast.parse(source), "test.py")
+
+        assert [loc.message for loc in result.failure_locations] == [
+            "Unused import: sys"
+        ]
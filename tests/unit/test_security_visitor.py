@@ -0,0 +1,80 @@
+"""
+Tests for the single-pass SecurityVisitor.
+"""
+
+import ast
+import re
+
+from src_check.models import Severity
+from src_check.rules.security import SecurityChecker, SecurityVisitor
+
+
+def findings(source: str):
+    """Return the messages SecurityChecker reports for a snippet, in order."""
+    result = SecurityChecker().check(ast.parse(source), "test.py")
+    return [] if result is None else [loc.message for loc in result.failure_locations]
+
+
+class TestSecurityVisitor:
+    """Tests for SecurityVisitor."""
+
+    def test_matchers_are_compiled_once(self):
+        """Test that the patterns are compiled on the class, not per file."""
+        assert isinstance(SecurityVisitor.SECRET_NAME_RE, re.Pattern)
+        assert isinstance(SecurityVisitor.SQL_RE, re.Pattern)
+        assert SecurityVisitor.SECRET_NAME_RE.search("db_password_hash")
+        assert not SecurityVisitor.SECRET_NAME_RE.search("hostname")
+
+    def test_every_pattern_has_a_trigger_token(self):
+        """Test that no pattern can match in a file the engine skips."""
+        tables = [
+            SecurityVisitor.SECRET_PATTERNS,
+            SecurityVisitor.DANGEROUS_FUNCTIONS,
+            SecurityVisitor.SHELL_FUNCTIONS,
+            SecurityVisitor.SQL_PATTERNS,
+            SecurityVisitor.PICKLE_MODULES,
+            SecurityVisitor.PICKLE_LOADS,
+        ]
+        tokens = SecurityChecker.trigger_tokens
+
+        for table in tables:
+            for pattern in table:
+                assert any(token in pattern.lower() for token in tokens), pattern
+
+    def test_findings_are_grouped_by_kind(self):
+        """Test that findings are reported kind by kind, as separate passes did."""
+        source = (
+            "import pickle\n"
+            "eval(code)\n"
+            "query = 'SELECT * FROM t WHERE id=' + user_id\n"
+            "API_KEY = 'abc123'\n"
+            "pickle.loads(data)\n"
+        )
+
+        assert findings(source) == [
+            "Hardcoded secret found: API_KEY",
+            "Dangerous function 'eval': Can execute arbitrary code",
+            "Potential SQL injection: String concatenation with SQL",
+            "Security risk: pickle can execute arbitrary code during deserialization",
+            "Critical: Unpickling untrusted data can execute arbitrary code",
+        ]
+
+    def test_secret_exclusions(self):
+        """Test metadata names, placeholders, empty and non-string values."""
+        source = (
+            "__author__ = 'someone'\n"
+            "password = '${DB_PASSWORD}'\n"
+            "token = ''\n"
+            "auth_retries = 3\n"
+            "settings = {'secret': 'hunter2', 'host': 'localhost'}\n"
+        )
+
+        assert findings(source) == ["Hardcoded secret in dictionary: secret"]
+
+    def test_severity(self):
+        """Test that secrets make the result critical."""
+        result = SecurityChecker().check(
+            ast.parse("exec(code)\npasswd = 'x'\n"), "test.py"
+        )
+
+        assert result.severity == Severity.CRITICAL
@@ -0,0 +1,112 @@
+"""
+Tests for snippets resolved on demand from the source line table.
+"""
+
+import json
+
+from src_check.core.engine import AnalysisEngine
+from src_check.formatters.json import JsonFormatter
+from src_check.models import FailureLocation
+from src_check.models.simple_kpi_score import KpiScore
+from src_check.models.source_lines import SourceLineTable, source_lines
+from src_check.rules.security import SecurityChecker
+
+
+class TestSourceLineTable:
+    """Tests for SourceLineTable."""
+
+    def test_lines_are_split_on_first_use(self):
+        """Test that recording a file does not split it."""
+        table = SourceLineTable()
+        table.record("a.py", "x = 1\ny = 2\n")
+
+        assert table._lines == {}
+        assert table.lines("a.py") == ["x = 1", "y = 2", ""]
+        assert table.lines("b.py") is None
+
+    def test_segment_cuts_byte_offsets(self):
+        """Test that columns are UTF-8 offsets, as the AST reports them."""
+        table = SourceLineTable()
+        table.record("a.py", "s = 'é'; eval(s)\n")
+
+        assert table.segment("a.py", 1, 10, 1, 17) == "eval(s)"
+
+    def test_segment_spans_lines(self):
+        """Test that a multi-line range keeps its line breaks."""
+        table = SourceLineTable()
+        table.record("a.py", "eval(\r\n    s\r\n)\n")
+
+        assert table.segment("a.py", 1, 0, 3, 1) == "eval(\n    s\n)"
+        assert table.segment("a.py", 9, 0, 9, 1) is None
+
+    def test_record_replaces_earlier_content(self):
+        """Test that a file checked again resolves against its new content."""
+        table = SourceLineTable()
+        table.record("a.py", "old()\n")
+        table.lines("a.py")
+        table.record("a.py", "new()\n")
+
+        assert table.segment("a.py", 1) == "new()"
+
+
+class TestLazySnippets:
+    """Tests for FailureLocation.snippet."""
+
+    def setup_method(self):
+        """Start from an empty shared table."""
+        source_lines.clear()
+
+    def teardown_method(self):
+        """Leave no recorded sources behind."""
+        source_lines.clear()
+
+    def test_explicit_snippet_wins(self):
+        """Test that an explicit code_snippet is shown as is."""
+        source_lines.record("a.py", "api_key = 'abc'\n")
+        location = FailureLocation(
+            "a.py", 1, 0, 1, 15, code_snippet="api_key = '<hidden>'"
+        )
+
+        assert location.snippet() == "api_key = '<hidden>'"
+
+    def test_location_without_range_has_no_snippet(self):
+        """Test that only ranges resolve to source text."""
+        source_lines.record("a.py", "x = 1\n")
+
+        assert FailureLocation("a.py", 1, 0).snippet() is None
+
+    def test_engine_leaves_snippets_unresolved(self, tmp_path):
+        """Test that findings carry ranges and resolve only when asked."""
+        path = tmp_path / "mod.py"
+        path.write_text("import os\n\nresult = eval(\n    expr\n)\n")
+
+        results = AnalysisEngine([SecurityChecker()]).analyze_file(path)
+        location = results[0].failure_locations[0]
+
+        assert location.code_snippet is None
+        assert (location.line, location.end_line) == (3, 5)
+        assert location.to_dict()["code_snippet"] is None
+        assert location.snippet() == "eval(\n    expr\n)"
+
+    def test_json_formatter_resolves_snippets(self, tmp_path):
+        """Test that the JSON output shows the source of each finding."""
+        path = tmp_path / "mod.py"
+        path.write_text("import pickle\npickle.loads(blob)\n")
+
+        results = AnalysisEngine([SecurityChecker()]).analyze_file(path)
+        kpi = KpiScore(
+            overall_score=50.0,
+            category_scores={},
+            total_issues=2,
+            critical_issues=0,
+            high_issues=2,
+            medium_issues=0,
+            low_issues=0,
+        )
+        output = json.loads(JsonFormatter().format({str(path): results}, kpi))
+        snippets = [
+            failure["code_snippet"]
+            for failure in output["files"][str(path)][0]["failures"]
+        ]
+
+        assert snippets == ["import pickle", "pickle.loads(blob)"]
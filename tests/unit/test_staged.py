@@ -0,0 +1,112 @@
+"""
+Tests for analyzing staged content and explicit file lists.
+"""
+
+import io
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src_check.cli.main import main
+from src_check.core.git import read_file_list, read_staged_blobs, staged_files
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git required")
+
+
+def git(repo: Path, *args: str) -> None:
+    """Run a git command in the repository."""
+    subprocess.run(["git", *args], cwd=str(repo), check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Git repository whose staged content differs from the working tree."""
+    git(tmp_path, "init", "-q")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "bad.py").write_text("eval('1')\n")
+    (tmp_path / "pkg" / "my mod.py").write_text("x = 1\n")
+    (tmp_path / "notes.txt").write_text("not python\n")
+    git(tmp_path, "add", ".")
+    # Fix the working tree without staging the fix
+    (tmp_path / "pkg" / "bad.py").write_text("x = 1\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def run_cli(argv, monkeypatch, capsys, stdin=""):
+    """Run the CLI with JSON output and return the parsed report."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    main([*argv, "--format", "json", "--no-cache"])
+    output = capsys.readouterr().out
+    return json.loads(output[output.index("{") :])
+
+
+def security_files(report):
+    """Return the files with security findings in a JSON report."""
+    return [
+        file_path
+        for file_path, results in report["files"].items()
+        if any(result["category"] == "security" for result in results)
+    ]
+
+
+class TestGitHelpers:
+    """Test the git helper functions."""
+
+    def test_read_file_list_accepts_newlines_and_nul(self):
+        """Test both separators used by git."""
+        assert read_file_list(io.StringIO("a.py\nb c.py\n\n")) == ["a.py", "b c.py"]
+        assert read_file_list(io.StringIO("a.py\0b\nc.py\0")) == ["a.py", "b\nc.py"]
+
+    def test_staged_files(self, repo):
+        """Test listing the files in the index."""
+        assert sorted(staged_files(repo)) == [
+            Path("notes.txt"),
+            Path("pkg/bad.py"),
+            Path("pkg/my mod.py"),
+        ]
+
+    def test_read_staged_blobs(self, repo):
+        """Test that blobs come from the index, not the working tree."""
+        blobs = read_staged_blobs(
+            [Path("pkg/bad.py"), Path("pkg/missing.py"), Path("pkg/my mod.py")], repo
+        )
+
+        assert blobs == {
+            Path("pkg/bad.py"): "eval('1')\n",
+            Path("pkg/my mod.py"): "x = 1\n",
+        }
+
+
+class TestFileListCli:
+    """Test the --stdin-filelist and --staged options."""
+
+    def test_staged_analyzes_index_content(self, repo, monkeypatch, capsys):
+        """Test that staged content is analyzed instead of the working tree."""
+        report = run_cli(["--staged"], monkeypatch, capsys)
+
+        assert security_files(report) == [str(Path("pkg/bad.py"))]
+
+    def test_stdin_filelist_reads_working_tree(self, repo, monkeypatch, capsys):
+        """Test that listed files are read from disk without --staged."""
+        report = run_cli(
+            ["--stdin-filelist"], monkeypatch, capsys, stdin="pkg/bad.py\ngone.py\n"
+        )
+
+        assert list(report["files"]) == [str(Path("pkg/bad.py"))]
+        assert security_files(report) == []
+
+    def test_stdin_filelist_with_staged(self, repo, monkeypatch, capsys):
+        """Test combining a stdin file list with staged content."""
+        report = run_cli(
+            ["--stdin-filelist", "--staged"],
+            monkeypatch,
+            capsys,
+            stdin="pkg/bad.py\nnotes.txt\n",
+        )
+
+        assert list(report["files"]) == [str(Path("pkg/bad.py"))]
+        assert security_files(report) == [str(Path("pkg/bad.py"))]
@@ -0,0 +1,79 @@
+"""
+Startup regression tests: the CLI must not import the engine to parse argv.
+"""
+
+import subprocess
+import sys
+from typing import Dict
+
+# Cumulative import time of src_check.cli.main, in microseconds. Currently
+# well under half of this; a failure means a heavy import slipped back in.
+IMPORT_BUDGET_US = 100_000
+
+# Modules that --help and --version must not pay for
+HEAVY_MODULES = [
+    "yaml",
+    "toml",
+    "urllib.request",
+    "src_check.core.cache",
+    "src_check.core.config_loader",
+    "src_check.core.engine",
+    "src_check.core.registry",
+    "src_check.formatters.text",
+    "src_check.models",
+]
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Run a statement under -X importtime and return cumulative times."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_skips_heavy_modules():
+    """Test that importing the CLI does not import analysis modules."""
+    times = import_times("import src_check.cli.main")
+
+    assert "src_check.cli.main" in times
+    assert [m for m in HEAVY_MODULES if m in times] == []
+
+
+def test_cli_import_within_budget():
+    """Test the startup budget of the CLI module."""
+    # Best of three to smooth out noise on busy machines
+    best = min(
+        import_times("import src_check.cli.main")["src_check.cli.main"]
+        for _ in range(3)
+    )
+
+    assert best < IMPORT_BUDGET_US
+
+
+def test_version_does_not_load_engine():
+    """Test that --version exits before any heavy import."""
+    code = (
+        "import sys\n"
+        "from src_check.cli.main import main\n"
+        "try:\n"
+        "    main(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert "0.2.0" in completed.stdout
+    assert completed.stdout.splitlines()[-1] == "[]"
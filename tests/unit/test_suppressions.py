@@ -0,0 +1,118 @@
+"""
+Tests for inline suppression comments.
+"""
+
+import pytest
+
+from src_check.core.cache import MemoryResultCache
+from src_check.core.engine import AnalysisEngine
+from src_check.models.suppressions import (
+    SuppressionIndex,
+    message_code,
+    suppressions,
+)
+from src_check.rules.code_quality import CodeQualityChecker
+from src_check.rules.performance import PerformanceChecker
+
+SOURCE = """
+def build(items):
+    text = ""
+    for item in items:
+        text = text + "x"  # src-check: ignore[PERF003]
+        text = text + "y"
+        print(item)  # src-check: ignore
+    return text
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_table():
+    """Keep suppressions recorded by a test from leaking into others."""
+    yield
+    suppressions.clear()
+
+
+def messages(results):
+    """Return the (line, message) pairs of all findings."""
+    return [(loc.line, loc.message) for r in results for loc in r.failure_locations]
+
+
+class TestSuppressionIndex:
+    """Tests for SuppressionIndex."""
+
+    def test_comments_are_indexed_by_line(self):
+        """Test that codes are collected per line and file-wide."""
+        index = SuppressionIndex.from_source(
+            "# src-check: ignore-file[security]\n"
+            "x = 1  # src-check: ignore[PERF003, DOC001]\n"
+            "y = 2  # src-check: ignore\n"
+        )
+
+        assert index.file_wide == {"security"}
+        assert index.lines == {2: {"PERF003", "DOC001"}, 3: None}
+        assert index.skips_checker("security")
+        assert not index.skips_checker("performance")
+
+    def test_markers_in_strings_are_ignored(self):
+        """Test that only real comments silence findings."""
+        index = SuppressionIndex.from_source('x = "# src-check: ignore"\n')
+
+        assert not index
+
+    def test_findings_match_codes_checker_names_and_rule_ids(self):
+        """Test the names a finding can be silenced by."""
+        index = SuppressionIndex.from_source(
+            "x = 1  # src-check: ignore[PERF003, DOC001]\n"
+        )
+
+        assert index.suppresses(1, "[PERF003] String concatenation in loop")
+        assert index.suppresses(1, "Missing docstring", ["documentation", "DOC001"])
+        assert not index.suppresses(1, "[PERF001] Function call in loop")
+        assert not index.suppresses(2, "[PERF003] String concatenation in loop")
+
+    def test_table_forgets_discarded_files(self):
+        """Test that a discarded file no longer silences findings."""
+        suppressions.record("mod.py", "x = 1  # src-check: ignore\n")
+        assert not suppressions.allows("mod.py", 1, "Anything")
+
+        suppressions.discard("mod.py")
+
+        assert suppressions.of("mod.py") is None
+        assert suppressions.allows("mod.py", 1, "Anything")
+
+    def test_message_codes(self):
+        """Test that both message code styles are recognized."""
+        assert message_code("[PERF003] String concatenation") == "PERF003"
+        assert message_code("DEPR001: 'imp' is deprecated") == "DEPR001"
+        assert message_code("Function 'f' is too complex") is None
+
+
+class TestEngineSuppressions:
+    """Tests for suppressions applied while analyzing files."""
+
+    def test_silenced_findings_are_not_reported(self, tmp_path):
+        """Test that only the findings on commented lines are dropped."""
+        path = tmp_path / "mod.py"
+        path.write_text(SOURCE)
+        engine = AnalysisEngine([PerformanceChecker(), CodeQualityChecker()])
+
+        found = messages(engine.analyze_file(path))
+
+        assert [line for line, _ in found] == [6]
+        assert found[0][1].startswith("[PERF003]")
+
+    def test_file_wide_suppression_skips_the_checker(self, tmp_path):
+        """Test that a checker silenced for the file is not run."""
+        path = tmp_path / "mod.py"
+        path.write_text("# src-check: ignore-file[performance]\n" + SOURCE)
+        engine = AnalysisEngine(
+            [PerformanceChecker(), CodeQualityChecker()], cache=MemoryResultCache()
+        )
+
+        assert messages(engine.analyze_file(path)) == []
+        assert engine.stats["performance"].runs == 0
+        assert engine.stats["performance"].skipped == 1
+
+        # Editing the comment changes the content, so the cache is not reused
+        path.write_text(SOURCE)
+        assert len(messages(engine.analyze_file(path))) == 1